@@ -10,25 +10,67 @@ Usage:
     python main.py              # Default mode (movie group)
     python main.py --girlfriend # Girlfriend mode (Charlie & Hanan)
     python main.py -g           # Short flag for girlfriend mode
+
+    # Headless ability-balance simulation (adds to abilitystats.txt/abilitywins.txt)
+    python main.py --simulate 10000 --workers 8 --movies movies.txt
+
+    # Keep lists, dockets and stats in SQLite (beyblade.db / gf_beyblade.db).
+    # A new database starts with the contents of the text files.
+    python main.py --storage sqlite
+    python main.py --storage sqlite --import-text  # Re-import the text files
+    python main.py --storage sqlite --export-text  # Write the database back to them
 """
 
 import argparse
 from src.config import set_mode
 from src.game import Game
+from src.storage import STORAGE_BACKENDS, import_text_files, export_text_files
 
 
 def main():
     parser = argparse.ArgumentParser(description='Movie Beyblade Battle')
     parser.add_argument('-g', '--girlfriend', action='store_true',
                         help='Run in girlfriend mode (Charlie & Hanan)')
+    parser.add_argument('--simulate', type=int, metavar='N',
+                        help='Run N headless tournaments and record ability stats')
+    parser.add_argument('--workers', type=int, default=None, metavar='W',
+                        help='Worker processes for --simulate (default: CPU count)')
+    parser.add_argument('--movies', metavar='FILE',
+                        help='Movie list for --simulate (default: the mode\'s movie file)')
+    parser.add_argument('--seed', type=int, default=None,
+                        help='Random seed for --simulate')
+    parser.add_argument('--storage', choices=STORAGE_BACKENDS, default='text',
+                        help='Where lists, dockets and stats are kept (default: text files)')
+    parser.add_argument('--import-text', action='store_true',
+                        help='Copy the text files into the --storage sqlite database and exit')
+    parser.add_argument('--export-text', action='store_true',
+                        help='Write the --storage sqlite database back to the text files and exit')
     args = parser.parse_args()
 
     # Set mode based on flag
     if args.girlfriend:
-        config = set_mode('girlfriend')
+        config = set_mode('girlfriend', args.storage)
         print("Running in Girlfriend Mode (Charlie & Hanan)")
     else:
-        config = set_mode('default')
+        config = set_mode('default', args.storage)
+
+    if args.import_text or args.export_text:
+        if args.storage != 'sqlite':
+            parser.error('--import-text and --export-text need --storage sqlite')
+        if args.import_text:
+            copied = import_text_files(config, config.storage)
+            print(f"Imported {len(copied)} text files into {config.database_file}: {', '.join(copied)}")
+        else:
+            written = export_text_files(config.storage, config)
+            print(f"Exported {len(written)} lists from {config.database_file}: {', '.join(written)}")
+        return
+
+    if args.simulate:
+        from src.simulation import load_movie_list, run_simulations, print_summary
+        movies = load_movie_list(args.movies) if args.movies else config.storage.read_lines('movies')
+        ability_stats, _ = run_simulations(config, movies, args.simulate, args.workers, args.seed)
+        print_summary(ability_stats, args.simulate)
+        return
 
     game = Game(config)
     game.run()
@@ -5,6 +5,9 @@ from .constants import (
     ARENA_FLOOR, ARENA_EDGE, ARENA_RIM, WHITE, DARK_GRAY
 )
 from .beyblade import Beyblade
+from .ui import get_font
+
+BACKGROUND_KEY = (255, 0, 255)  # Transparent colour for the cached arena background
 
 
 class Bumper:
@@ -281,6 +284,11 @@ class Arena:
         self.close_speed = 0.6  # Pixels per frame
         self.preliminary_scale = 0.7  # Preliminary arena is 70% the size
 
+        # Static floor pre-rendered once per size/mode (see draw)
+        self._background = None
+        self._background_pos = (0, 0)
+        self._rect_details = None  # Finals markings, redrawn over the closing-edge overlay
+
     @property
     def effective_radius(self) -> int:
         """Get the effective arena radius (smaller in preliminary mode)."""
@@ -306,6 +314,7 @@ class Arena:
         """Enable or disable finals rectangle mode."""
         self.finals_mode = enabled
         self.preliminary_mode = False  # Finals and preliminary are mutually exclusive
+        self._invalidate_background()
         if enabled:
             self._create_bumpers()
             # Reset closing edges state
@@ -322,6 +331,7 @@ class Arena:
         """Enable or disable preliminary mode (smaller arena with bumpers)."""
         self.preliminary_mode = enabled
         self.finals_mode = False  # Finals and preliminary are mutually exclusive
+        self._invalidate_background()
         self.pillars.clear()
         self.edges_closing = False
         if enabled:
@@ -389,6 +399,7 @@ class Arena:
         max_radius = min(window_width, window_height) // 2 - 80
         self.radius = max(200, max_radius)
         self._update_rect_dimensions()
+        self._invalidate_background()
         # Recreate bumpers if in finals mode or preliminary mode
         if self.finals_mode:
             self._create_bumpers()
@@ -416,13 +427,17 @@ class Arena:
 
     def apply_boundary(self, beyblade: Beyblade) -> bool:
         """Apply arena boundary physics. Returns True if bumper was hit."""
-        bumper_hit = False
-
         if self.finals_mode:
             self._apply_rectangle_boundary(beyblade)
         else:
             self._apply_circle_boundary(beyblade)
 
+        return self.apply_bumpers(beyblade)
+
+    def apply_bumpers(self, beyblade: Beyblade) -> bool:
+        """Bounce a beyblade off any bumpers it touches. Returns True if one was hit."""
+        bumper_hit = False
+
         # Check bumper collisions (both finals and preliminary modes use bumpers)
         for bumper in self.bumpers:
             if bumper.check_collision(beyblade):
@@ -530,16 +545,56 @@ class Arena:
                 beyblade.die()
 
     def draw(self, screen: pygame.Surface):
-        """Draw the arena."""
-        if self.finals_mode:
-            self._draw_rectangle(screen)
-        else:
-            self._draw_circle(screen)
+        """Draw the arena: one blit of the cached floor, plus the closing edges in finals."""
+        if self._background is None:
+            self._build_background()
+        screen.blit(self._background, self._background_pos)
+
+        # Closing edges go over the floor but under the finals markings
+        if self.finals_mode and self.edges_closing:
+            bx, by = self._background_pos
+            for covered in self._draw_closing_edges(screen):
+                screen.blit(self._rect_details, covered, area=covered.move(-bx, -by),
+                            special_flags=pygame.BLEND_PREMULTIPLIED)
 
         # Draw bumpers on top of arena floor (both finals and preliminary modes)
         for bumper in self.bumpers:
             bumper.draw(screen)
 
+    def _invalidate_background(self):
+        """Drop the cached floor so the next draw rebuilds it (size or mode changed)."""
+        self._background = None
+        self._rect_details = None
+
+    def _build_background(self):
+        """Pre-render the static arena into a colour-keyed surface covering just the arena."""
+        if self.finals_mode:
+            bounds = pygame.Rect(self.rect_left, self.rect_top, self.rect_width, self.rect_height).inflate(30, 30)
+            bounds.width += 5  # Drop shadow
+            bounds.height += 5
+        else:
+            r = self.effective_radius + 15
+            bounds = pygame.Rect(self.center_x - r, self.center_y - r, r * 2 + 5, r * 2 + 5)
+        bounds = bounds.clip(pygame.Rect(0, 0, bounds.right, bounds.bottom))
+
+        # Draw in screen coordinates, then keep only the arena's bounding box
+        canvas = pygame.Surface((bounds.right, bounds.bottom))
+        canvas.fill(BACKGROUND_KEY)
+        if self.finals_mode:
+            self._draw_rectangle_floor(canvas)
+            self._draw_rectangle_details(canvas)
+        else:
+            self._draw_circle(canvas)
+        self._background = canvas.subsurface(bounds).copy()
+        self._background.set_colorkey(BACKGROUND_KEY, pygame.RLEACCEL)
+        self._background_pos = bounds.topleft
+
+        if self.finals_mode:
+            # Markings alone, premultiplied so anti-aliased text blends correctly over the overlay
+            details = pygame.Surface((bounds.right, bounds.bottom), pygame.SRCALPHA)
+            self._draw_rectangle_details(details, premultiplied=True)
+            self._rect_details = details.subsurface(bounds).copy()
+
     def _draw_circle(self, screen: pygame.Surface):
         """Draw circular arena."""
         cx, cy = self.center_x, self.center_y
@@ -577,8 +632,8 @@ class Arena:
         )
         pygame.draw.arc(screen, WHITE, highlight_rect, math.radians(200), math.radians(340), 3)
 
-    def _draw_rectangle(self, screen: pygame.Surface):
-        """Draw rectangular finals arena."""
+    def _draw_rectangle_floor(self, screen: pygame.Surface):
+        """Draw rectangular finals arena floor, rim and shadow."""
         # Main floor rect
         floor_rect = pygame.Rect(
             self.rect_left, self.rect_top,
@@ -600,37 +655,44 @@ class Arena:
         # Main floor
         pygame.draw.rect(screen, ARENA_FLOOR, floor_rect, border_radius=3)
 
-        # Draw danger zones if edges are closing
-        if self.edges_closing:
-            danger_color = (80, 30, 30)  # Dark red tint
-            warning_color = (150, 50, 50)  # Brighter red for edge line
-
-            # Left danger zone (area that's now ring-out)
-            left_danger_width = int(self.current_rect_left - self.rect_left)
-            if left_danger_width > 0:
-                left_danger = pygame.Rect(
-                    self.rect_left, self.rect_top,
-                    left_danger_width, self.rect_height
-                )
-                pygame.draw.rect(screen, danger_color, left_danger)
-                # Draw warning line at current boundary
-                pygame.draw.line(screen, warning_color,
-                                 (int(self.current_rect_left), self.rect_top),
-                                 (int(self.current_rect_left), self.rect_bottom), 3)
-
-            # Right danger zone
-            right_danger_width = int(self.rect_right - self.current_rect_right)
-            if right_danger_width > 0:
-                right_danger = pygame.Rect(
-                    int(self.current_rect_right), self.rect_top,
-                    right_danger_width, self.rect_height
-                )
-                pygame.draw.rect(screen, danger_color, right_danger)
-                # Draw warning line at current boundary
-                pygame.draw.line(screen, warning_color,
-                                 (int(self.current_rect_right), self.rect_top),
-                                 (int(self.current_rect_right), self.rect_bottom), 3)
+    def _draw_closing_edges(self, screen: pygame.Surface):
+        """Draw the danger zones left behind by the closing finals edges. Returns the rects covered."""
+        covered = []
+        danger_color = (80, 30, 30)  # Dark red tint
+        warning_color = (150, 50, 50)  # Brighter red for edge line
+
+        # Left danger zone (area that's now ring-out)
+        left_danger_width = int(self.current_rect_left - self.rect_left)
+        if left_danger_width > 0:
+            left_danger = pygame.Rect(
+                self.rect_left, self.rect_top,
+                left_danger_width, self.rect_height
+            )
+            pygame.draw.rect(screen, danger_color, left_danger)
+            # Draw warning line at current boundary
+            pygame.draw.line(screen, warning_color,
+                             (int(self.current_rect_left), self.rect_top),
+                             (int(self.current_rect_left), self.rect_bottom), 3)
+            covered.append(left_danger.union(pygame.Rect(int(self.current_rect_left) - 1, self.rect_top, 3, self.rect_height + 1)))
 
+        # Right danger zone
+        right_danger_width = int(self.rect_right - self.current_rect_right)
+        if right_danger_width > 0:
+            right_danger = pygame.Rect(
+                int(self.current_rect_right), self.rect_top,
+                right_danger_width, self.rect_height
+            )
+            pygame.draw.rect(screen, danger_color, right_danger)
+            # Draw warning line at current boundary
+            pygame.draw.line(screen, warning_color,
+                             (int(self.current_rect_right), self.rect_top),
+                             (int(self.current_rect_right), self.rect_bottom), 3)
+            covered.append(right_danger.union(pygame.Rect(int(self.current_rect_right) - 1, self.rect_top, 3, self.rect_height + 1)))
+
+        return covered
+
+    def _draw_rectangle_details(self, screen: pygame.Surface, premultiplied: bool = False):
+        """Draw the finals floor markings, wall indicators and title."""
         # Floor detail lines (horizontal)
         for i in range(1, 6):
             y = self.rect_top + int(self.rect_height * (i / 6))
@@ -669,10 +731,13 @@ class Arena:
                          (self.rect_right, self.rect_bottom), 4)
 
         # "FINALS" text in center
-        font = pygame.font.Font(None, 36)
+        font = get_font(36)
         text = font.render("FINALS", True, (80, 80, 100))
         text_rect = text.get_rect(center=(self.center_x, self.center_y + 50))
-        screen.blit(text, text_rect)
+        if premultiplied:
+            screen.blit(text.premul_alpha(), text_rect, special_flags=pygame.BLEND_PREMULTIPLIED)
+        else:
+            screen.blit(text, text_rect)
 
     def get_spawn_positions(self, count: int) -> list:
         """Generate spawn positions."""
@@ -1,8 +1,17 @@
 import pygame
 import random
 import math
+from collections import OrderedDict
 from enum import Enum, auto
 from .constants import AVATAR_DISTANCE_FROM_ARENA, AVATAR_ELIMINATED_DIM, AVATAR_ABILITIES
+from .ui import get_font
+from .labels import label_cache
+
+# Pose sprite cache: limb angles snap to this grid (radians) so periodic poses reuse sprites
+POSE_ANGLE_STEP = 0.05
+POSE_CACHE_SIZE = 32  # Sprites kept per avatar
+POSE_CANVAS = (140, 160)  # Scratch surface big enough for any figure, hat and hair included
+POSE_ANCHOR = (70, 115)  # Hip position on the scratch surface
 
 
 class AvatarState(Enum):
@@ -94,6 +103,9 @@ class Avatar:
         self.pistol_cooldown = 0
         self.pistol_followup_pending = False  # True when waiting for follow-up shot
 
+        # Pre-rendered poses: (head offset, limb angle buckets, color) -> (sprite, offset from hip)
+        self._pose_sprites: OrderedDict[tuple, tuple] = OrderedDict()
+
     def update_position(self, arena_cx: int, arena_cy: int, arena_radius: int,
                         finals_mode: bool = False, rect_left: int = 0, rect_right: int = 0,
                         rect_top: int = 0, rect_bottom: int = 0):
@@ -171,12 +183,7 @@ class Avatar:
 
     def draw(self, screen: pygame.Surface):
         """Draw the avatar."""
-        # Calculate dimensions with traits
-        head_r = int(self.BASE_HEAD_RADIUS * self.traits.head_size)
-        body_len = int(self.BASE_BODY_LENGTH * self.traits.body_length)
-        arm_len = int(self.BASE_ARM_LENGTH * self.traits.arm_length)
         leg_len = int(self.BASE_LEG_LENGTH * self.traits.leg_length)
-        thick = self.traits.thickness
 
         # Get color (dim if eliminated)
         if self.state == AvatarState.ELIMINATED:
@@ -186,19 +193,69 @@ class Avatar:
             color = self.traits.color
 
         # Calculate body positions
-        head_offset, left_arm, right_arm, left_leg, right_leg = self._get_pose()
+        pose = self._get_pose()
+
+        # Hip position
+        hip_x = int(self.x)
+        hip_y = int(self.y)
+
+        if self.state == AvatarState.LAUNCHING:
+            # The ripcord spin is different every frame and lasts under a second - not worth caching
+            self._draw_figure(screen, self.x, self.y, pose, color)
+        else:
+            sprite, (offset_x, offset_y) = self._get_pose_sprite(pose, color)
+            screen.blit(sprite, (hip_x + offset_x, hip_y + offset_y))
+
+        # Draw name below avatar
+        self._draw_name(screen, hip_x, hip_y + leg_len + 5, color)
+
+    def _get_pose_sprite(self, pose: tuple, color: tuple) -> tuple:
+        """Sprite for a pose snapped to the POSE_ANGLE_STEP grid, and its offset from the hip."""
+        head_offset, left_arm, right_arm, left_leg, right_leg = pose
+        key = (round(head_offset),
+               round(left_arm / POSE_ANGLE_STEP), round(right_arm / POSE_ANGLE_STEP),
+               round(left_leg / POSE_ANGLE_STEP), round(right_leg / POSE_ANGLE_STEP), color)
+        cached = self._pose_sprites.get(key)
+        if cached is not None:
+            self._pose_sprites.move_to_end(key)
+            return cached
+
+        anchor_x, anchor_y = POSE_ANCHOR
+        canvas = pygame.Surface(POSE_CANVAS, pygame.SRCALPHA)
+        snapped = (key[0],) + tuple(k * POSE_ANGLE_STEP for k in key[1:5])
+        self._draw_figure(canvas, anchor_x, anchor_y, snapped, color)
+        bounds = canvas.get_bounding_rect()
+        sprite = canvas.subsurface(bounds).copy()
+        sprite.set_alpha(255, pygame.RLEACCEL)
+        cached = (sprite, (bounds.x - anchor_x, bounds.y - anchor_y))
+
+        self._pose_sprites[key] = cached
+        if len(self._pose_sprites) > POSE_CACHE_SIZE:
+            self._pose_sprites.popitem(last=False)
+        return cached
+
+    def _draw_figure(self, screen: pygame.Surface, x: float, y: float, pose: tuple, color: tuple):
+        """Draw the stick figure (everything but the name) with its hip at (x, y)."""
+        # Calculate dimensions with traits
+        head_r = int(self.BASE_HEAD_RADIUS * self.traits.head_size)
+        body_len = int(self.BASE_BODY_LENGTH * self.traits.body_length)
+        arm_len = int(self.BASE_ARM_LENGTH * self.traits.arm_length)
+        leg_len = int(self.BASE_LEG_LENGTH * self.traits.leg_length)
+        thick = self.traits.thickness
+
+        head_offset, left_arm, right_arm, left_leg, right_leg = pose
 
         # Head position (adjusted for animation)
-        head_x = int(self.x)
-        head_y = int(self.y - body_len - head_r + head_offset)
+        head_x = int(x)
+        head_y = int(y - body_len - head_r + head_offset)
 
         # Shoulder position
-        shoulder_x = int(self.x)
-        shoulder_y = int(self.y - body_len + head_offset * 0.5)
+        shoulder_x = int(x)
+        shoulder_y = int(y - body_len + head_offset * 0.5)
 
         # Hip position
-        hip_x = int(self.x)
-        hip_y = int(self.y)
+        hip_x = int(x)
+        hip_y = int(y)
 
         # Draw legs
         self._draw_legs(screen, hip_x, hip_y, left_leg, right_leg, leg_len, thick, color)
@@ -224,9 +281,6 @@ class Avatar:
         if self.ability != 'kamehameha':
             self._draw_accessory(screen, head_x, head_y, head_r, color)
 
-        # Draw name below avatar
-        self._draw_name(screen, hip_x, hip_y + leg_len + 5, color)
-
     def _get_pose(self) -> tuple:
         """Get pose based on current animation state."""
         # Default pose
@@ -457,19 +511,11 @@ class Avatar:
         pygame.draw.line(screen, color, (hx, hy), right_end, thickness)
 
     def _draw_name(self, screen: pygame.Surface, x: int, y: int, color: tuple):
-        """Draw the movie name below the avatar."""
-        font = pygame.font.Font(None, 24)
+        """Draw the movie name below the avatar, on a background for readability."""
         # Truncate long names
         display_name = self.beyblade_name if len(self.beyblade_name) <= 15 else self.beyblade_name[:12] + "..."
-        text_surface = font.render(display_name, True, color)
-        text_rect = text_surface.get_rect(center=(x, y))
-
-        # Background for readability
-        bg_rect = text_rect.inflate(6, 2)
-        bg_surface = pygame.Surface(bg_rect.size, pygame.SRCALPHA)
-        bg_surface.fill((0, 0, 0, 120))
-        screen.blit(bg_surface, bg_rect)
-        screen.blit(text_surface, text_rect)
+        label = label_cache.boxed(display_name, get_font(24), color, background=(0, 0, 0, 120), padding=(6, 2))
+        screen.blit(label, label.get_rect(center=(x, y)), special_flags=pygame.BLEND_PREMULTIPLIED)
 
 
 class AvatarManager:
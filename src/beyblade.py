@@ -7,11 +7,14 @@ from .constants import (
     KNOCKOUT_DURATION, KNOCKOUT_FLASH_SPEED,
     ABILITY_CHANCE, ABILITIES, AVATAR_ABILITIES
 )
+from .labels import label_cache
+from .sprites import beyblade_sprites
 
 
 class Beyblade:
     def __init__(self, name: str, x: float, y: float, color_index: int):
         self.name = name
+        self.field_index = -1  # Set by the engine; projectiles record it as their owner
         self.x = x
         self.y = y
         # Will be set by arena spawn with tangential velocity
@@ -207,54 +210,21 @@ class Beyblade:
 
         x, y = int(self.x), int(self.y)
 
-        # Knockout flash effect
-        if not self.alive and self.flash_state:
-            alpha_color = tuple(min(255, c + 100) for c in self.color)
-        else:
-            alpha_color = self.color
-
-        # Draw outer ring
-        pygame.draw.circle(screen, alpha_color, (x, y), self.radius)
-
-        # Draw inner details (spinning pattern)
-        inner_radius = self.radius - 4
-        if inner_radius > 5:
-            # Darker center
-            center_color = tuple(max(0, c - 60) for c in self.color)
-            pygame.draw.circle(screen, center_color, (x, y), inner_radius)
-
-            # Spinning spokes
-            num_spokes = 3
-            for i in range(num_spokes):
-                angle = math.radians(self.rotation + i * (360 / num_spokes))
-                spoke_len = inner_radius - 3
-                end_x = x + math.cos(angle) * spoke_len
-                end_y = y + math.sin(angle) * spoke_len
-                pygame.draw.line(screen, alpha_color, (x, y), (end_x, end_y), 3)
-
-            # Center circle
-            pygame.draw.circle(screen, alpha_color, (x, y), 5)
-
-        # Draw rim highlight
-        pygame.draw.circle(screen, WHITE, (x, y), self.radius, 2)
-
-        # Draw name above (truncate if too long)
+        # Body (knockout flash, ring, spinning spokes, rim) from the pre-rotated sprite atlas
+        flash = not self.alive and self.flash_state
+        screen.blit(beyblade_sprites.get(self.color, self.radius, flash, self.rotation), (x - self.radius, y - self.radius))
+
+        # Draw name above (truncate if too long), on a background for readability
         display_name = self.name if len(self.name) <= 20 else self.name[:17] + "..."
-        text_surface = font.render(display_name, True, WHITE)
 
         # Calculate label height based on ability
         label_height = 12
         if self.ability:
             label_height = 22  # Extra space for ability name
 
-        text_rect = text_surface.get_rect(center=(x, y - self.radius - label_height))
-
-        # Background for readability
-        bg_rect = text_rect.inflate(8, 4)
-        bg_surface = pygame.Surface(bg_rect.size, pygame.SRCALPHA)
-        bg_surface.fill((0, 0, 0, 150))
-        screen.blit(bg_surface, bg_rect)
-        screen.blit(text_surface, text_rect)
+        name_label = label_cache.boxed(display_name, font, WHITE)
+        screen.blit(name_label, name_label.get_rect(center=(x, y - self.radius - label_height)),
+                    special_flags=pygame.BLEND_PREMULTIPLIED)
 
         # Draw ability name below movie name
         if self.ability and self.ability_data:
@@ -262,19 +232,12 @@ class Beyblade:
             # Mark avatar abilities with (Avatar) suffix
             if self.ability in AVATAR_ABILITIES:
                 ability_name = f"{ability_name} (Avatar)"
-            # Brighten the ability color for readability
+            # Brighten the ability color for readability, with a shadow/outline for contrast
             base_color = self.ability_data['color']
             bright_color = tuple(min(255, c + 100) for c in base_color)
-            ability_rect_pos = (x, y - self.radius - 2)
-            # Draw shadow/outline for contrast
-            shadow_surface = font.render(ability_name, True, (0, 0, 0))
-            for dx, dy in [(-1, -1), (-1, 1), (1, -1), (1, 1), (0, -1), (0, 1), (-1, 0), (1, 0)]:
-                shadow_rect = shadow_surface.get_rect(center=(ability_rect_pos[0] + dx, ability_rect_pos[1] + dy))
-                screen.blit(shadow_surface, shadow_rect)
-            # Draw main text
-            ability_surface = font.render(ability_name, True, bright_color)
-            ability_rect = ability_surface.get_rect(center=ability_rect_pos)
-            screen.blit(ability_surface, ability_rect)
+            ability_label = label_cache.outlined(ability_name, font, bright_color)
+            screen.blit(ability_label, ability_label.get_rect(center=(x, y - self.radius - 2)),
+                        special_flags=pygame.BLEND_PREMULTIPLIED)
 
         # Draw stamina bar
         bar_width = self.radius * 2
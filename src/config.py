@@ -1,12 +1,24 @@
 # Mode configuration for different user groups
 
+from .storage import open_storage
+
+
 class ModeConfig:
     """Configuration for different game modes."""
 
-    def __init__(self, mode='default'):
+    def __init__(self, mode='default', storage='text'):
         self.mode = mode
+        self.storage_backend = storage  # 'text' (the files below) or 'sqlite' (database_file)
+        self._storage = None
         self._setup_mode()
 
+    @property
+    def storage(self):
+        """Where this mode's lists, dockets and stats are kept (opened on first use)."""
+        if self._storage is None:
+            self._storage = open_storage(self)
+        return self._storage
+
     def _setup_mode(self):
         if self.mode == 'girlfriend':
             self._setup_girlfriend_mode()
@@ -30,6 +42,7 @@ class ModeConfig:
         self.golden_lockout_file = "goldenlockout.txt"
         self.director_file = "directors.txt"
         self.actor_file = "actors.txt"
+        self.database_file = "beyblade.db"  # All of the above, with --storage sqlite
 
         # UI Colors
         self.ui_bg = (25, 25, 35)
@@ -68,6 +81,7 @@ class ModeConfig:
         self.golden_lockout_file = "gf_goldenlockout.txt"
         self.director_file = "gf_directors.txt"
         self.actor_file = "gf_actors.txt"
+        self.database_file = "gf_beyblade.db"
 
         # UI Colors - Purple theme
         self.ui_bg = (35, 25, 45)  # Dark purple
@@ -100,8 +114,8 @@ def get_config():
         current_config = ModeConfig('default')
     return current_config
 
-def set_mode(mode):
-    """Set the game mode."""
+def set_mode(mode, storage='text'):
+    """Set the game mode (and where it saves: 'text' or 'sqlite')."""
     global current_config
-    current_config = ModeConfig(mode)
+    current_config = ModeConfig(mode, storage)
     return current_config
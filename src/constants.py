@@ -2,6 +2,8 @@
 WINDOW_WIDTH = 1920
 WINDOW_HEIGHT = 1200
 FPS = 60
+IDLE_FPS = 10  # Static menu screens once nobody has interacted for IDLE_AFTER_MS
+IDLE_AFTER_MS = 2000
 
 # Arena settings
 ARENA_CENTER = (WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2)
@@ -137,6 +139,7 @@ SPARK_COLORS = [
 ]
 SPARK_LIFETIME = 20
 SPARK_COUNT = 8
+PARTICLE_BUDGET = 2000  # Max live particles - the oldest are evicted first when full
 
 # Knockout effect
 KNOCKOUT_DURATION = 45
@@ -2,7 +2,8 @@ import pygame
 import random
 import math
 import array
-from .constants import SPARK_COLORS, SPARK_LIFETIME, SPARK_COUNT
+import numpy as np
+from .constants import SPARK_COLORS, SPARK_LIFETIME, SPARK_COUNT, PARTICLE_BUDGET
 
 # Fun notification colors
 NOTIFICATION_COLORS = [
@@ -17,37 +18,122 @@ NOTIFICATION_COLORS = [
 ]
 
 
-class Particle:
-    def __init__(self, x: float, y: float, vx: float, vy: float, color: tuple, lifetime: int):
-        self.x = x
-        self.y = y
-        self.vx = vx
-        self.vy = vy
-        self.color = color
-        self.lifetime = lifetime
-        self.max_lifetime = lifetime
+class ParticleSystem:
+    """Sparks kept in preallocated NumPy arrays, oldest first.
+
+    Update and culling are one vectorized pass each. When a spawn would go
+    over the budget, the oldest particles are evicted to make room. Drawing
+    blits cached dot sprites in a single call.
+    """
+
+    def __init__(self, budget: int = PARTICLE_BUDGET):
+        self.budget = budget
+        self.count = 0
+        self.evicted = 0  # Particles dropped to stay within budget
+        self.x = np.zeros(budget)
+        self.y = np.zeros(budget)
+        self.vx = np.zeros(budget)
+        self.vy = np.zeros(budget)
+        self.lifetime = np.zeros(budget)
+        self.max_lifetime = np.ones(budget)
+        self.color = np.zeros(budget, dtype=np.int32)  # Index into self.colors
+        self._columns = (self.x, self.y, self.vx, self.vy, self.lifetime, self.max_lifetime, self.color)
+        self.colors: list[tuple] = []
+        self._color_index: dict[tuple, int] = {}
+        self._sprites: dict[tuple, pygame.Surface] = {}  # (color index, radius) -> dot
+
+    def __len__(self):
+        return self.count
+
+    def emit(self, xs: list, ys: list, vxs: list, vys: list, colors: list, lifetimes: list):
+        """Add a batch of particles, evicting the oldest if the budget is exceeded."""
+        n = len(xs)
+        if n > self.budget:
+            # Only the newest of an oversized batch would survive anyway
+            drop = n - self.budget
+            xs, ys, vxs, vys, colors, lifetimes = (v[drop:] for v in (xs, ys, vxs, vys, colors, lifetimes))
+            self.evicted += drop
+            n = self.budget
+        if not n:
+            return
+        overflow = self.count + n - self.budget
+        if overflow > 0:
+            self._evict(overflow)
+
+        start, end = self.count, self.count + n
+        self.x[start:end] = xs
+        self.y[start:end] = ys
+        self.vx[start:end] = vxs
+        self.vy[start:end] = vys
+        self.lifetime[start:end] = lifetimes
+        self.max_lifetime[start:end] = lifetimes
+        self.color[start:end] = [self._color_id(color) for color in colors]
+        self.count = end
+
+    def _color_id(self, color: tuple) -> int:
+        index = self._color_index.get(color)
+        if index is None:
+            index = self._color_index[color] = len(self.colors)
+            self.colors.append(color)
+        return index
+
+    def _evict(self, n: int):
+        keep = self.count - n
+        for column in self._columns:
+            column[:keep] = column[n:self.count]
+        self.count = keep
+        self.evicted += n
 
     def update(self, dt: float = 1.0):
-        self.x += self.vx * dt
-        self.y += self.vy * dt
-        self.vx *= 0.95
-        self.vy *= 0.95
-        self.lifetime -= dt
-
-    @property
-    def alive(self) -> bool:
-        return self.lifetime > 0
+        count = self.count
+        if not count:
+            return
+        self.x[:count] += self.vx[:count] * dt
+        self.y[:count] += self.vy[:count] * dt
+        self.vx[:count] *= 0.95
+        self.vy[:count] *= 0.95
+        self.lifetime[:count] -= dt
+
+        # Cull dead particles, keeping spawn order
+        alive = self.lifetime[:count] > 0
+        survivors = int(alive.sum())
+        if survivors < count:
+            for column in self._columns:
+                column[:survivors] = column[:count][alive]
+            self.count = survivors
+
+    def _sprite(self, color_id: int, radius: int) -> pygame.Surface:
+        """A dot matching pygame.draw.circle(radius) drawn at (radius, radius)."""
+        key = (color_id, radius)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            color = self.colors[color_id]
+            colorkey = (0, 0, 0) if color != (0, 0, 0) else (255, 255, 255)
+            sprite = pygame.Surface((radius * 2, radius * 2))
+            sprite.fill(colorkey)
+            pygame.draw.circle(sprite, color, (radius, radius), radius)
+            sprite.set_colorkey(colorkey, pygame.RLEACCEL)
+            self._sprites[key] = sprite
+        return sprite
 
     def draw(self, screen: pygame.Surface):
-        if not self.alive:
+        count = self.count
+        if not count:
             return
 
         # Fade out based on lifetime
-        alpha_ratio = self.lifetime / self.max_lifetime
-        size = max(1, int(4 * alpha_ratio))
+        alpha_ratio = self.lifetime[:count] / self.max_lifetime[:count]
+        sizes = np.maximum(1, (4 * alpha_ratio).astype(np.int32))
+        left = self.x[:count].astype(np.int32) - sizes
+        top = self.y[:count].astype(np.int32) - sizes
 
-        # Draw particle
-        pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), size)
+        sprite = self._sprite
+        screen.blits([(sprite(color_id, size), (px, py)) for color_id, size, px, py
+                      in zip(self.color[:count].tolist(), sizes.tolist(), left.tolist(), top.tolist())],
+                     doreturn=False)
+
+    def clear(self):
+        self.count = 0
 
 
 class SoundManager:
@@ -232,49 +318,65 @@ class SoundManager:
         return self.muted
 
 
-class EffectsManager:
+class NullSoundManager:
+    """Silent stand-in for SoundManager when there is no mixer (headless runs)."""
+
     def __init__(self):
-        self.particles: list[Particle] = []
+        self.muted = True
+        self.sounds = {}
+
+    def play(self, sound_name: str):
+        pass
+
+    def toggle_mute(self):
+        return self.muted
+
+
+class EffectsManager:
+    def __init__(self, sound=None, particle_budget: int = PARTICLE_BUDGET):
+        self.particles = ParticleSystem(particle_budget)
         self.knockout_effects: list[dict] = []
         self.nuke_blasts: list[dict] = []  # Oppenheimer nuke explosions
         self.event_log: list[dict] = []  # Scrolling log on the side
         self.max_log_entries = 30  # Entries persist until heat ends
-        self.sound = SoundManager()
+        self.sound = sound if sound is not None else SoundManager()
 
     def spawn_collision_sparks(self, x: float, y: float, intensity: float = 1.0):
         """Spawn spark particles at a collision point."""
         num_sparks = int(SPARK_COUNT * min(2.0, intensity))
+        vxs, vys, colors, lifetimes = [], [], [], []
 
         for _ in range(num_sparks):
             angle = random.uniform(0, 2 * math.pi)
             speed = random.uniform(2, 5) * intensity
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-            color = random.choice(SPARK_COLORS)
-            lifetime = SPARK_LIFETIME + random.randint(-5, 5)
+            vxs.append(math.cos(angle) * speed)
+            vys.append(math.sin(angle) * speed)
+            colors.append(random.choice(SPARK_COLORS))
+            lifetimes.append(SPARK_LIFETIME + random.randint(-5, 5))
 
-            self.particles.append(Particle(x, y, vx, vy, color, lifetime))
+        self.particles.emit([x] * num_sparks, [y] * num_sparks, vxs, vys, colors, lifetimes)
 
     def spawn_knockout_effect(self, x: float, y: float, color: tuple, name: str):
         """Spawn a knockout explosion effect."""
+        vxs, vys = [], []
+
         # Ring of particles
         for i in range(16):
             angle = (2 * math.pi * i / 16)
             speed = 4
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-
-            self.particles.append(Particle(x, y, vx, vy, color, 30))
+            vxs.append(math.cos(angle) * speed)
+            vys.append(math.sin(angle) * speed)
 
         # Inner burst
         for _ in range(20):
             angle = random.uniform(0, 2 * math.pi)
             speed = random.uniform(1, 6)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-            particle_color = tuple(min(255, c + 50) for c in color)
+            vxs.append(math.cos(angle) * speed)
+            vys.append(math.sin(angle) * speed)
 
-            self.particles.append(Particle(x, y, vx, vy, particle_color, 25))
+        particle_color = tuple(min(255, c + 50) for c in color)
+        self.particles.emit([x] * 36, [y] * 36, vxs, vys,
+                            [color] * 16 + [particle_color] * 20, [30] * 16 + [25] * 20)
 
         # Add text effect
         self.knockout_effects.append({
@@ -317,6 +419,7 @@ class EffectsManager:
         })
 
         # Spawn tons of particles in the nuked area
+        xs, ys, vxs, vys, colors, lifetimes = [], [], [], [], [], []
         for _ in range(100):
             if nuke_left:
                 x = center_x - random.uniform(0, arena_radius)
@@ -324,21 +427,25 @@ class EffectsManager:
                 x = center_x + random.uniform(0, arena_radius)
             y = center_y + random.uniform(-arena_radius, arena_radius)
 
+            xs.append(x)
+            ys.append(y)
+
             angle = random.uniform(0, 2 * math.pi)
             speed = random.uniform(2, 8)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
+            vxs.append(math.cos(angle) * speed)
+            vys.append(math.sin(angle) * speed)
 
             # Fire colors
-            color = random.choice([
+            colors.append(random.choice([
                 (255, 255, 200),
                 (255, 200, 100),
                 (255, 150, 50),
                 (255, 100, 0),
                 (255, 50, 0),
-            ])
-            lifetime = random.randint(30, 60)
-            self.particles.append(Particle(x, y, vx, vy, color, lifetime))
+            ]))
+            lifetimes.append(random.randint(30, 60))
+
+        self.particles.emit(xs, ys, vxs, vys, colors, lifetimes)
 
     def add_log_entry(self, text: str, color: tuple = None, sound_name: str = None):
         """Add a generic log entry."""
@@ -359,12 +466,8 @@ class EffectsManager:
             self.sound.play(sound_name)
 
     def update(self, dt: float = 1.0):
-        # Update particles
-        for particle in self.particles:
-            particle.update(dt)
-
-        # Remove dead particles
-        self.particles = [p for p in self.particles if p.alive]
+        # Update particles and remove dead ones
+        self.particles.update(dt)
 
         # Update knockout text effects
         for effect in self.knockout_effects:
@@ -441,8 +544,7 @@ class EffectsManager:
                         screen.blit(cloud_surface, (cloud_x - layer_r, cloud_y - layer_r - i * 20))
 
         # Draw all particles
-        for particle in self.particles:
-            particle.draw(screen)
+        self.particles.draw(screen)
 
         # Draw knockout text effects
         for effect in self.knockout_effects:
@@ -494,3 +596,38 @@ class EffectsManager:
         self.knockout_effects.clear()
         self.nuke_blasts.clear()
         self.event_log.clear()
+
+
+class NullEffectsManager:
+    """Effects sink that discards everything, for battles nobody is watching."""
+
+    def __init__(self):
+        self.particles = []
+        self.knockout_effects = []
+        self.nuke_blasts = []
+        self.event_log = []
+        self.sound = NullSoundManager()
+
+    def spawn_collision_sparks(self, x: float, y: float, intensity: float = 1.0):
+        pass
+
+    def spawn_knockout_effect(self, x: float, y: float, color: tuple, name: str):
+        pass
+
+    def spawn_ability_notification(self, beyblade_name: str, ability_text: str, color: tuple, sound_name: str = 'ability', ability_name: str = None):
+        pass
+
+    def spawn_nuke_blast(self, center_x: float, center_y: float, nuke_left: bool, arena_radius: float):
+        pass
+
+    def add_log_entry(self, text: str, color: tuple = None, sound_name: str = None):
+        pass
+
+    def update(self, dt: float = 1.0):
+        pass
+
+    def draw(self, screen: pygame.Surface, font: pygame.font.Font):
+        pass
+
+    def clear(self):
+        pass
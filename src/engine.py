@@ -0,0 +1,1942 @@
+import random
+import math
+import numpy as np
+from .constants import (
+    STATE_INPUT, STATE_BATTLE, STATE_HEAT_TRANSITION, STATE_VICTORY,
+    BEYBLADE_COLORS, ABILITIES
+)
+from .config import get_config
+from .beyblade import Beyblade, resolve_collision, is_immune_to_damage, deal_damage, apply_knockback
+from .arena import Arena
+from .physics import colliding_pairs, step_vector_physics
+from .projectiles import (
+    ProjectileStore, gather_positions,
+    FIREBALL, ICE, ICE_TRAIL, GRENADE, KAMEHAMEHA, WATER_WAVE, BULLET,
+    KAMEHAMEHA_WIDTH, KAMEHAMEHA_MAX_LENGTH, WATER_WAVE_WIDTH
+)
+from .effects import NullEffectsManager
+from .avatar import AvatarManager, AvatarState
+
+
+class BattleEngine:
+    """Tournament and battle simulation without any display, mixer or fonts.
+
+    Owns the beyblades, arena, projectiles and ability state. Game builds the
+    window and UI screens on top of it; on its own it can play whole
+    tournaments as fast as the CPU allows (see run_tournament).
+    """
+
+    def __init__(self, config=None, effects=None, persist_stats=True):
+        # Mode configuration
+        self.config = config if config else get_config()
+
+        self.arena = Arena()
+        # Effects and sounds are optional sinks - headless runs drop them
+        self.effects = effects if effects is not None else NullEffectsManager()
+        self.avatar_manager = AvatarManager()
+        self.verbose = False  # Print tournament progress to stdout
+        self.vector_physics = True  # NumPy movement/boundary kernel for big fields
+
+        # Ability stats go to abilitystats.txt/abilitywins.txt, or stay in memory when not persisting
+        self.persist_stats = persist_stats
+        self.ability_stats = {}  # ability -> {'tournament_wins', 'heat_wins', 'heats_participated', 'games_entered'}
+        self.ability_wins = {}  # ability -> tournament wins
+
+        self.beyblades: list[Beyblade] = []
+        self.ability_holders: dict[str, list[Beyblade]] = {}  # ability -> holders, in self.beyblades order
+        self.beyblades_by_name: dict[str, Beyblade] = {}  # name -> beyblade (owner/target lookups)
+        self.eliminated: list[str] = []  # Current heat eliminations
+        self.all_eliminated: list[str] = []  # Full tournament elimination order
+        self.state = STATE_INPUT
+        self.speed_multiplier = 1
+        self.winner = None
+        self.round_number = 1
+        self.ability_win_recorded = False  # Prevent double-recording ability wins
+        self.games_entered_recorded = set()  # Track abilities credited with games_entered this tournament
+
+        # Tournament state
+        self.heats: list[list[str]] = []
+        self.current_heat = 0
+        self.heat_winners: list[str] = []
+        self.current_heat_participants: list[str] = []  # Participants in current heat (for stats)
+        self.is_finals = False
+        self.advancers_per_heat = 2  # Top N from each heat advance
+        self.max_per_heat = 11  # Max beyblades per heat
+
+        # Preliminary round state (for large tournaments >54 movies)
+        self.preliminary_groups: list[list[str]] = []  # Groups of movies for preliminary battles
+        self.preliminary_winning_movies: list[str] = []  # Movies from the winning group
+        self.is_preliminary = False  # True when running preliminary rounds
+        self.preliminary_max_size = 54  # Max movies per preliminary group
+
+        # Persistent movie data (survives across heats)
+        self.movie_abilities: dict[str, tuple] = {}  # name -> (ability_key, color)
+        self.zombie_used: set[str] = set()  # Track which movies have used zombie (persists across heats)
+        self.swamp_thing_used: set[str] = set()  # Track which movies have used swamp thing (persists across heats)
+        self.andy_respawn_used: set[str] = set()  # Track which movies have used Andy Dufresne respawn
+
+        # Portal state: [{'x': float, 'y': float, 'partner_idx': int}]
+        self.portals: list[dict] = []
+        self.portal_cooldown = 0  # Cooldown between portal uses
+
+        # Countdown state
+        self.countdown_timer = 0
+        self.countdown_active = False
+        self.countdown_last_num = 0  # Track which number was last shown for sound
+
+        # Fireballs, ice shards and trails, grenades, kamehameha beams, water waves
+        # and John Wick bullets share one pooled store (see projectiles.py)
+        self.projectiles = ProjectileStore()
+
+        # Obelisk bumpers spawned by The Obelisk ability
+        self.obelisk_bumpers = []
+
+        # Kevin McAllister traps: [{'x', 'y', 'type', 'owner_name', 'lifetime'}]
+        self.traps = []
+
+        # Interstellar black holes: [{'x', 'y', 'owner_name'}]
+        self.black_holes = []
+
+        # Neo heat reset tracking
+        self.heat_start_frame = 0
+        self.current_frame = 0
+        self.neo_reset_used_this_heat = False
+        self.neo_reset_countdown = 0  # Frames to show reset message
+        self.neo_reset_name = ""  # Name of Neo who triggered reset
+
+        # Once-per-game ability tracking
+        self.barry_lyndon_used = set()
+        self.oppenheimer_used = set()
+
+        # Transition state
+        self.pending_next_heat = 0
+        self.pending_is_finals = False
+        self.pending_start_main_tournament = False
+
+    def run_tournament(self, movie_list: list) -> str:
+        """Play a whole tournament headlessly, from start_battle through heats,
+        preliminary groups and finals. Returns the winner's name."""
+        self.start_battle(movie_list)
+        while self.state in (STATE_BATTLE, STATE_HEAT_TRANSITION):
+            if self.state == STATE_HEAT_TRANSITION:
+                self._continue_after_heat()
+            elif self.countdown_active:
+                self.update_countdown()
+            else:
+                self.update_battle()
+        return self.winner
+
+    def update_countdown(self):
+        """Advance the pre-battle countdown by one frame."""
+        self.countdown_timer -= 1
+        # Update avatars during countdown (for launch animation)
+        self.avatar_manager.update()
+
+        # Determine current number and play sound on change
+        if self.countdown_timer > 120:
+            current_num = 3
+        elif self.countdown_timer > 60:
+            current_num = 2
+        elif self.countdown_timer > 0:
+            current_num = 1
+        else:
+            current_num = 0  # GO!
+
+        if current_num != self.countdown_last_num:
+            self.countdown_last_num = current_num
+            if current_num == 0:
+                self.effects.sound.play('countdown_go')
+            elif current_num > 0:
+                self.effects.sound.play('countdown_beep')
+
+        if self.countdown_timer <= 0:
+            self.countdown_active = False
+
+    def start_battle(self, movie_list: list):
+        """Initialize a new tournament with the given movie list."""
+        # Deduplicate movie list (preserve order, keep first occurrence)
+        # Case-insensitive and whitespace-tolerant
+        seen = set()
+        unique_movies = []
+        for movie in movie_list:
+            normalized = movie.strip().lower()
+            if normalized not in seen:
+                seen.add(normalized)
+                unique_movies.append(movie)
+        movie_list = unique_movies
+
+        self.eliminated.clear()
+        self.all_eliminated.clear()
+        self.effects.clear()
+        self.winner = None
+        self.round_number = 1
+        self.ability_win_recorded = False  # Reset for new tournament
+        self.games_entered_recorded = set()  # Track abilities credited with games_entered this tournament
+        self.heat_winners.clear()
+        self.current_heat = 0
+        self.is_finals = False
+        self.movie_abilities.clear()  # Fresh abilities for new tournament
+        self.zombie_used.clear()  # Fresh zombie uses for new tournament
+        self.swamp_thing_used.clear()  # Fresh swamp thing uses for new tournament
+        self.portals.clear()
+        self.andy_respawn_used = set()  # Track Andy Dufresne respawns
+
+        # Shuffle movies for random placement
+        random.shuffle(movie_list)
+
+        # Check if we need a preliminary round (>54 movies)
+        # If so, DON'T assign abilities yet - wait until winning group is determined
+        if len(movie_list) > self.preliminary_max_size:
+            # Split movies into groups of max 54
+            self.preliminary_groups = []
+            for i in range(0, len(movie_list), self.preliminary_max_size):
+                group = movie_list[i:i + self.preliminary_max_size]
+                if group:
+                    self.preliminary_groups.append(group)
+
+            self.is_preliminary = True
+
+            # Create group names showing actual movie count in each group
+            group_names = [f"Group {i+1} ({len(g)} movies)" for i, g in enumerate(self.preliminary_groups)]
+
+            # All group beyblades get the SAME random ability (amadeus, prestige, copycat, deadpool banned)
+            banned_group_abilities = {'amadeus', 'the_prestige', 'copycat', 'deadpool'}
+            group_ability_pool = [k for k in ABILITIES.keys() if k not in banned_group_abilities]
+            shared_ability = random.choice(group_ability_pool)
+            for i, group_name in enumerate(group_names):
+                color = BEYBLADE_COLORS[i % len(BEYBLADE_COLORS)]
+                self.movie_abilities[group_name] = (shared_ability, color)
+
+            # Set up the preliminary battle with group beyblades
+            self.heats = [group_names]
+            self._start_heat(0)
+        else:
+            # Normal tournament flow - assign abilities now (no preliminary)
+            self.is_preliminary = False
+            self.preliminary_groups.clear()
+
+            # Assign abilities to movies
+            movie_list = self._assign_abilities_to_movies(movie_list)
+
+            # If few movies, just run single battle (no heats needed)
+            if len(movie_list) <= self.max_per_heat:
+                self.heats = [movie_list.copy()]  # Use copy to avoid reference issues
+                if self.verbose:
+                    print(f"[Battle] Single heat with {len(movie_list)} movies")
+            else:
+                # Split into heats (slicing creates new lists)
+                self.heats = []
+                for i in range(0, len(movie_list), self.max_per_heat):
+                    heat = movie_list[i:i + self.max_per_heat]
+                    if heat:
+                        self.heats.append(heat)
+                if self.verbose:
+                    print(f"[Battle] {len(self.heats)} heats created: {[len(h) for h in self.heats]} movies each")
+
+            # Start first heat
+            self._start_heat(0)
+
+        self.state = STATE_BATTLE
+        self.speed_multiplier = 1
+
+    def _assign_abilities_to_movies(self, movie_list: list) -> list:
+        """Assign abilities to movies. Each ability is used once before repeating.
+        Returns the updated movie list (with prestige duplicates added)."""
+        ability_keys = list(ABILITIES.keys())
+        ability_pool = []
+
+        # Build pool: each ability appears once per "round", shuffle each round
+        # This ensures each ability is used once before any repeats
+        num_rounds = (len(movie_list) // len(ability_keys)) + 2  # Extra rounds for prestige duplicates
+        for _ in range(num_rounds):
+            round_abilities = ability_keys.copy()
+            random.shuffle(round_abilities)
+            ability_pool.extend(round_abilities)
+
+        pool_index = 0
+        prestige_movies = []
+
+        for movie in movie_list:
+            ability_key = ability_pool[pool_index]
+            pool_index += 1
+
+            if ability_key == 'the_prestige':
+                prestige_movies.append(movie)
+                # Store ability for both copies
+                color = BEYBLADE_COLORS[len(self.movie_abilities) % len(BEYBLADE_COLORS)]
+                self.movie_abilities[movie] = (ability_key, color)
+                self.movie_abilities[f"{movie} (Double)"] = (ability_key, color)
+            else:
+                color = BEYBLADE_COLORS[len(self.movie_abilities) % len(BEYBLADE_COLORS)]
+                self.movie_abilities[movie] = (ability_key, color)
+
+        # Add prestige duplicates to movie list
+        for movie in prestige_movies:
+            movie_list.append(f"{movie} (Double)")
+
+        # Shuffle to mix in prestige duplicates
+        random.shuffle(movie_list)
+
+        return movie_list
+
+    def _start_heat(self, heat_index: int, is_neo_reset: bool = False):
+        """Start a specific heat battle."""
+        self.current_heat = heat_index
+        self.round_number = 1
+        self.beyblades.clear()
+        self.ability_holders.clear()
+        self.beyblades_by_name.clear()
+        self.effects.clear()
+        self.projectiles.clear()
+        self.portals.clear()
+        self.portal_cooldown = 0
+        self.obelisk_bumpers.clear()
+        self.traps.clear()
+        self.black_holes.clear()
+        self.heat_start_frame = self.current_frame
+
+        # Only reset Neo flag if this is a normal heat start, not a Neo reset
+        if not is_neo_reset:
+            self.neo_reset_used_this_heat = False
+
+        if self.is_finals:
+            movies = self.heat_winners
+        else:
+            movies = self.heats[heat_index]
+
+        # Use rectangle finals arena for the deciding battle (not for preliminary rounds)
+        is_final_battle = (self.is_finals or len(self.heats) == 1) and not self.is_preliminary
+        self.arena.set_finals_mode(is_final_battle)
+
+        # Use normal arena for all non-finals battles (including preliminary)
+        if not is_final_battle:
+            self.arena.set_preliminary_mode(False)
+
+        self._spawn_beyblades(movies)
+
+        # Track participants for this heat (for ability stats)
+        self.current_heat_participants = [b.name for b in self.beyblades if not b.is_clone and not getattr(b, 'barbie_is_fragment', False)]
+
+        # Start countdown (3 seconds at 60 FPS = 180 frames)
+        self.countdown_timer = 180
+        self.countdown_active = True
+        self.countdown_last_num = 4  # Start above 3 so first beep plays
+        self.effects.sound.play('countdown_beep')  # Play first beep immediately
+
+    def _spawn_beyblades(self, movie_list: list):
+        """Spawn beyblades with positions and tangential velocities."""
+        # Create a copy to shuffle for spawn positions without modifying original
+        # Defensive: deduplicate to prevent mystery duplicate spawns
+        seen = set()
+        movies_to_spawn = []
+        for movie in movie_list:
+            if movie not in seen:
+                seen.add(movie)
+                movies_to_spawn.append(movie)
+        random.shuffle(movies_to_spawn)
+        spawns = self.arena.get_spawn_positions(len(movies_to_spawn))
+
+        for i, (movie, spawn) in enumerate(zip(movies_to_spawn, spawns)):
+            x, y, vx, vy = spawn
+            beyblade = Beyblade(movie, x, y, i)
+            beyblade.vx = vx
+            beyblade.vy = vy
+
+            # Restore or store persistent data (ability and color)
+            if movie in self.movie_abilities:
+                # Returning movie - restore its ability and color
+                ability_key, color = self.movie_abilities[movie]
+                beyblade.ability = ability_key
+                if ability_key:
+                    beyblade.ability_data = ABILITIES[ability_key].copy()
+                    # Reapply size modifiers
+                    if ability_key == 'giant':
+                        beyblade.radius = int(beyblade.base_radius * 1.4)
+                    elif ability_key == 'tiny':
+                        beyblade.radius = int(beyblade.base_radius * 0.7)
+                beyblade.color = color
+            else:
+                # New movie - store its generated ability and color
+                self.movie_abilities[movie] = (beyblade.ability, beyblade.color)
+
+            # Initialize ability timers
+            if beyblade.ability == 'timebomb':
+                beyblade.timebomb_timer = 1200  # 20 seconds
+            if beyblade.ability == 'earthquake':
+                beyblade.earthquake_timer = 900  # 15 seconds
+            if beyblade.ability == 'lightning_storm':
+                beyblade.lightning_timer = 600  # 10 seconds
+            if beyblade.ability == 'doomsday':
+                beyblade.doomsday_timer = 1800  # 30 seconds
+
+            # Zoro: starts going the opposite direction (counterclockwise, lost as usual)
+            if beyblade.ability == 'zoro':
+                beyblade.vx = -beyblade.vx
+                beyblade.vy = -beyblade.vy
+
+            # Truman: spawn in center of arena
+            if beyblade.ability == 'truman':
+                beyblade.x = self.arena.center_x
+                beyblade.y = self.arena.center_y
+                beyblade.vx = random.uniform(-2, 2)
+                beyblade.vy = random.uniform(-2, 2)
+
+            # Interstellar: record spawn position for black hole
+            if beyblade.ability == 'interstellar':
+                beyblade.interstellar_spawn_x = beyblade.x
+                beyblade.interstellar_spawn_y = beyblade.y
+                self.black_holes.append({
+                    'x': beyblade.x,
+                    'y': beyblade.y,
+                    'owner_name': beyblade.name
+                })
+
+            # Neo: record spawn frame for reset check
+            if beyblade.ability == 'neo':
+                beyblade.neo_spawn_frame = self.current_frame
+
+            # Marty McFly: record spawn position for teleport ability
+            if beyblade.ability == 'marty_mcfly':
+                beyblade.marty_mcfly_spawn_x = beyblade.x
+                beyblade.marty_mcfly_spawn_y = beyblade.y
+                beyblade.marty_mcfly_used = False
+
+            self._add_beyblade(beyblade)
+
+            # Naruto: create 5 clones, each with 1/6 HP (including original = 6 total)
+            if beyblade.ability == 'naruto' and not beyblade.naruto_cloned:
+                beyblade.naruto_cloned = True
+                # Split HP into sixths
+                sixth_hp = beyblade.max_stamina / 6
+                beyblade.stamina = sixth_hp
+                beyblade.max_stamina = sixth_hp
+
+                # Create 5 clones - spawn in distinct positions to avoid immediate collision
+                clone_offsets = [
+                    (80, 0),    # Clone 1: right
+                    (-80, 0),   # Clone 2: left
+                    (40, 70),   # Clone 3: down-right
+                    (-40, 70),  # Clone 4: down-left
+                    (0, -80),   # Clone 5: up
+                ]
+                for clone_num in range(5):
+                    offset_x, offset_y = clone_offsets[clone_num]
+                    clone = Beyblade(f"{movie} (Clone {clone_num + 1})", x, y, i)
+                    clone.vx = vx + random.uniform(-2, 2)
+                    clone.vy = vy + random.uniform(-2, 2)
+                    clone.x = x + offset_x + random.uniform(-10, 10)
+                    clone.y = y + offset_y + random.uniform(-10, 10)
+                    clone.ability = 'naruto'
+                    clone.ability_data = beyblade.ability_data.copy() if beyblade.ability_data else None
+                    clone.color = beyblade.color
+                    clone.stamina = sixth_hp
+                    clone.max_stamina = sixth_hp
+                    clone.is_clone = True
+                    clone.original_name = movie
+                    clone.naruto_cloned = True  # Prevent clones from cloning
+                    self._add_beyblade(clone)
+
+        # Create avatars for this batch of beyblades
+        self.avatar_manager.create_avatars(self.beyblades, self.arena)
+
+        # Post-spawn ability setup
+        from .arena import ObeliskBumper
+        for beyblade in self.beyblades:
+            # Kill Bill: select a random target for this heat
+            if beyblade.ability == 'kill_bill':
+                targets = [b for b in self.beyblades if b != beyblade and b.name != beyblade.name]
+                if targets:
+                    beyblade.kill_bill_target = random.choice(targets).name
+                    self.effects.spawn_ability_notification(
+                        beyblade.name, f'TARGET: {beyblade.kill_bill_target[:12]}', ABILITIES['kill_bill']['color'], 'ability', 'Kill Bill'
+                    )
+
+            # The Obelisk: spawn a bumper at random arena position
+            if beyblade.ability == 'the_obelisk':
+                if self.arena.finals_mode:
+                    bx = random.uniform(self.arena.rect_left + 80, self.arena.rect_right - 80)
+                    by = random.uniform(self.arena.rect_top + 80, self.arena.rect_bottom - 80)
+                else:
+                    angle = random.uniform(0, 2 * math.pi)
+                    dist = random.uniform(50, self.arena.radius * 0.6)
+                    bx = self.arena.center_x + math.cos(angle) * dist
+                    by = self.arena.center_y + math.sin(angle) * dist
+                # Create 2001-style monolith obelisk
+                bumper = ObeliskBumper(int(bx), int(by), width=25, height=70)
+                self.obelisk_bumpers.append(bumper)
+                self.effects.spawn_ability_notification(beyblade.name, 'OBELISK RISES!', ABILITIES['the_obelisk']['color'], 'ability')
+
+            # American Psycho: initialize damage tracking
+            if beyblade.ability == 'american_psycho':
+                beyblade.american_psycho_timer = 1200  # 20 seconds
+                beyblade.american_psycho_stored_stamina = beyblade.stamina
+
+            # Amadeus: pick a rival for this heat
+            if beyblade.ability == 'amadeus':
+                targets = [b for b in self.beyblades if b != beyblade and b.name != beyblade.name]
+                if targets:
+                    beyblade.amadeus_rival = random.choice(targets).name
+                    self.effects.spawn_ability_notification(
+                        beyblade.name, f'RIVAL: {beyblade.amadeus_rival[:12]}', ABILITIES['amadeus']['color'], 'ability', 'Amadeus'
+                    )
+
+            # Terminator: pick a target for this heat
+            if beyblade.ability == 'terminator':
+                targets = [b for b in self.beyblades if b != beyblade and b.name != beyblade.name]
+                if targets:
+                    beyblade.terminator_target = random.choice(targets).name
+                    beyblade.terminator_no_hit_timer = 0
+                    self.effects.spawn_ability_notification(
+                        beyblade.name, f'TARGET: {beyblade.terminator_target[:12]}', ABILITIES['terminator']['color'], 'ability', 'Terminator'
+                    )
+
+            # Ferris Bueller: starts hidden, spawns 5 seconds late
+            if beyblade.ability == 'ferris_bueller' and beyblade.ferris_late_entry:
+                beyblade.alive = False
+                beyblade.x = -1000  # Off screen
+                beyblade.y = -1000
+                beyblade.ferris_timer = 300  # 5 seconds
+
+    def _add_beyblade(self, beyblade: Beyblade):
+        """Add a beyblade to the field, the ability index and the name registry."""
+        first = self.beyblades_by_name.setdefault(beyblade.name, beyblade)
+        # Same-named tops share a projectile owner id, as they used to share owner_name
+        beyblade.field_index = len(self.beyblades) if first is beyblade else first.field_index
+        self.beyblades.append(beyblade)
+        if beyblade.ability:
+            self.ability_holders.setdefault(beyblade.ability, []).append(beyblade)
+
+    def _reindex_abilities(self, *abilities):
+        """Rebuild the holder lists for abilities whose holders changed (Copycat)."""
+        for ability in set(abilities):
+            if ability:
+                self.ability_holders[ability] = [b for b in self.beyblades if b.ability == ability]
+
+    def _find_beyblade(self, name: str, alive_only: bool = False):
+        """Look up a beyblade on the field by name (None if absent, or dead with alive_only)."""
+        beyblade = self.beyblades_by_name.get(name)
+        if beyblade is None or (alive_only and not beyblade.alive):
+            return None
+        return beyblade
+
+    def _projectile_owner(self, slot: int):
+        """The beyblade that owns a projectile slot (None if it has no owner)."""
+        index = self.projectiles.owner[slot]
+        return self.beyblades[index] if index >= 0 else None
+
+    def _projectile_hits(self, slots, hit_radius: float):
+        """Yield (slot, beyblade) for each projectile in `slots` (oldest first) touching
+        a live beyblade other than its owner - the first such beyblade in field order.
+
+        Distances for every projectile/beyblade pair come from one batched test.
+        Alive and owner checks are made as each projectile is resolved, so kills
+        and reflections earlier in the batch are seen by the ones after it.
+        """
+        if not len(slots):
+            return
+        bx, by, radius = gather_positions(self.beyblades)
+        near = self.projectiles.within(slots, bx, by, radius + hit_radius)
+        for slot, row in zip(slots.tolist(), near):
+            owner_index = self.projectiles.owner[slot]
+            for index in np.flatnonzero(row).tolist():
+                beyblade = self.beyblades[index]
+                if beyblade.alive and beyblade.field_index != owner_index:
+                    yield slot, beyblade
+                    break
+
+    def _holders(self, ability: str) -> list:
+        """Beyblades holding an ability, in spawn order. Dead holders stay indexed
+        (avatar abilities, Andy, Alien and Ferris act while out), so passes
+        still check alive themselves."""
+        return self.ability_holders.get(ability, ())
+
+    def heat_info(self):
+        """(title, field size) for the battle HUD, or None for a single-heat tournament."""
+        if self.is_preliminary:
+            return (f"PRELIMINARY ({len(self.preliminary_groups)} groups)", len(self.preliminary_groups))
+        if len(self.heats) > 1:
+            if self.is_finals:
+                return ("FINALS", len(self.heat_winners))
+            return (f"Heat {self.current_heat + 1}/{len(self.heats)}", len(self.heats[self.current_heat]))
+        return None
+
+    def update_battle(self):
+        # Increment frame counter
+        self.current_frame += 1
+
+        # Update arena (bumper animations)
+        self.arena.update()
+
+        # Interstellar: black holes pull ALL beyblades on the map (Batman immune)
+        for black_hole in self.black_holes:
+            for beyblade in self.beyblades:
+                if beyblade.alive and beyblade.name != black_hole['owner_name'] and beyblade.ability != 'batman':
+                    dx = black_hole['x'] - beyblade.x
+                    dy = black_hole['y'] - beyblade.y
+                    dist = math.sqrt(dx * dx + dy * dy)
+                    if dist > 5:  # Avoid division issues when very close
+                        # Constant pull strength across entire map, weaker but always active
+                        pull_strength = 0.08
+                        beyblade.vx += (dx / dist) * pull_strength
+                        beyblade.vy += (dy / dist) * pull_strength
+
+        # Deadpool: regenerate health over time
+        for beyblade in self._holders('deadpool'):
+            if beyblade.alive:
+                regen_rate = 0.05  # HP per frame
+                beyblade.stamina = min(beyblade.max_stamina, beyblade.stamina + regen_rate)
+
+        # Update Amadeus rival status (needed for edge bounce check)
+        for beyblade in self._holders('amadeus'):
+            if beyblade.amadeus_rival:
+                beyblade.amadeus_rival_alive = self._find_beyblade(beyblade.amadeus_rival, alive_only=True) is not None
+
+        # Update all beyblades (vectorized kernel for plain movers, per-object for the rest)
+        vectorized = set()
+        if self.vector_physics:
+            vectorized = {id(b) for b in step_vector_physics(self.beyblades, self.arena)}
+        for beyblade in self.beyblades:
+            in_kernel = id(beyblade) in vectorized
+            if not in_kernel:
+                beyblade.update()
+            if beyblade.alive:
+                # Marty McFly: teleport back to spawn when within 10% of edge (once per heat)
+                if beyblade.ability == 'marty_mcfly' and not beyblade.marty_mcfly_used:
+                    near_edge = False
+                    if self.arena.finals_mode:
+                        # Rectangle arena: check distance from closing left/right edges
+                        arena_width = self.arena.current_rect_right - self.arena.current_rect_left
+                        edge_threshold = arena_width * 0.1
+                        if (beyblade.x < self.arena.current_rect_left + edge_threshold or
+                            beyblade.x > self.arena.current_rect_right - edge_threshold):
+                            near_edge = True
+                    else:
+                        # Circular arena: check distance from center vs radius
+                        dx = beyblade.x - self.arena.center_x
+                        dy = beyblade.y - self.arena.center_y
+                        dist_from_center = math.sqrt(dx**2 + dy**2)
+                        if dist_from_center > self.arena.radius * 0.9:
+                            near_edge = True
+
+                    if near_edge:
+                        # Teleport back to spawn position
+                        beyblade.x = beyblade.marty_mcfly_spawn_x
+                        beyblade.y = beyblade.marty_mcfly_spawn_y
+                        beyblade.vx = 0
+                        beyblade.vy = 0
+                        beyblade.marty_mcfly_used = True
+                        self.effects.spawn_ability_notification(
+                            beyblade.name, 'BACK IN TIME!', ABILITIES['marty_mcfly']['color'], 'ability', 'Marty McFly'
+                        )
+                        self.effects.sound.play('teleport')
+
+                if in_kernel:
+                    bumper_hit = self.arena.apply_bumpers(beyblade)
+                else:
+                    bumper_hit = self.arena.apply_boundary(beyblade)
+                if bumper_hit:
+                    # Spawn sparks and play sound for bumper hit
+                    self.effects.spawn_collision_sparks(beyblade.x, beyblade.y, 1.5)
+                    self.effects.sound.play('bumper')
+
+        # Check for collisions
+        # (spatial-hash broad phase, resolved in the same order as testing every pair)
+        alive_beyblades = [b for b in self.beyblades if b.alive]
+        for b1, b2 in colliding_pairs(alive_beyblades):
+            abilities_before = (b1.ability, b2.ability)
+            collision_x, collision_y, intensity, triggers = resolve_collision(b1, b2)
+            if (b1.ability, b2.ability) != abilities_before:
+                # Copycat took on a new ability
+                self._reindex_abilities(*abilities_before, b1.ability, b2.ability)
+            if intensity > 0.5:
+                self.effects.spawn_collision_sparks(collision_x, collision_y, intensity)
+                # Play hit sound
+                if intensity > 5:
+                    self.effects.sound.play('big_hit')
+                else:
+                    self.effects.sound.play('hit')
+            # Process ability triggers with appropriate sounds
+            for trigger in triggers:
+                if len(trigger) == 4:
+                    name, text, color, ability_name = trigger
+                else:
+                    name, text, color = trigger
+                    ability_name = None
+                sound = self._get_ability_sound(text)
+                self.effects.spawn_ability_notification(name, text, color, sound, ability_name)
+
+        # Handle parasite damage sharing
+        for beyblade in self.beyblades:
+            if beyblade.alive and beyblade.parasite_target:
+                # Find the target and share damage (both take stamina drain)
+                target = self._find_beyblade(beyblade.parasite_target, alive_only=True)
+                if target:
+                    # Slowly drain both (parasitic relationship hurts both)
+                    drain = 0.02
+                    beyblade.stamina -= drain
+                    target.stamina -= drain
+                    # If either dies, break the link
+                    if beyblade.stamina <= 0 or target.stamina <= 0:
+                        beyblade.parasite_target = None
+                        target.parasite_host = None
+                else:
+                    # Target is dead, clear the link
+                    beyblade.parasite_target = None
+
+        # Check for explosive triggers
+        for beyblade in self.beyblades:
+            if beyblade.explosive_triggered:
+                beyblade.explosive_triggered = False
+                # Push all alive beyblades away
+                for other in self.beyblades:
+                    if other.alive and other != beyblade:
+                        dx = other.x - beyblade.x
+                        dy = other.y - beyblade.y
+                        dist = math.sqrt(dx**2 + dy**2)
+                        if dist < 300 and dist > 0:  # Explosion radius
+                            force = 15 * (1 - dist / 300)  # Stronger when closer
+                            apply_knockback(other, beyblade, dx, dy, force)
+                # Visual and sound
+                self.effects.spawn_collision_sparks(beyblade.x, beyblade.y, 5.0)
+                self.effects.spawn_ability_notification(beyblade.name, 'EXPLOSION!', ABILITIES['explosive']['color'], 'burst')
+
+        # Handle fireball ability - avatars shoot fireballs toward arena (continues after death)
+        for beyblade in self._holders('fireball'):
+            avatar = self.avatar_manager.avatars.get(beyblade.name)
+            if avatar and avatar.state not in (AvatarState.ELIMINATED, AvatarState.LAUNCHING):
+                avatar.fireball_cooldown -= 1
+                if avatar.fireball_cooldown <= 0:
+                    # Spawn a fireball from avatar toward a random point in arena
+                    dx = self.arena.center_x - avatar.x
+                    dy = self.arena.center_y - avatar.y
+                    base_angle = math.atan2(dy, dx)
+                    # Add randomness to direction
+                    shoot_angle = base_angle + random.uniform(-0.6, 0.6)
+                    speed = 8
+                    self.projectiles.spawn(
+                        FIREBALL, avatar.x, avatar.y, beyblade.field_index,
+                        vx=math.cos(shoot_angle) * speed,
+                        vy=math.sin(shoot_angle) * speed,
+                        lifetime=180,  # 3 seconds max
+                    )
+                    avatar.fireball_cooldown = 90  # 1.5 second cooldown
+
+        # Update fireballs - movement and collision
+        store = self.projectiles
+        fireball_slots = store.slots(FIREBALL)
+        if len(fireball_slots):
+            store.advance(fireball_slots)
+            fireballs_to_remove = []
+            for slot, beyblade in self._projectile_hits(fireball_slots, 8):  # 8 is fireball radius
+                fx, fy = float(store.x[slot]), float(store.y[slot])
+                # Marty Mauser: reflect projectiles back
+                if beyblade.ability == 'marty_mauser':
+                    store.reflect(slot, beyblade.field_index, 180)
+                    self.effects.spawn_collision_sparks(fx, fy, 0.5)
+                    self.effects.spawn_ability_notification(beyblade.name, 'REFLECT!', ABILITIES['marty_mauser']['color'], 'ability', 'Marty Mauser')
+                    continue
+                # Hit! Apply knockback
+                owner = self._projectile_owner(slot)
+                if owner:
+                    apply_knockback(beyblade, owner, beyblade.x - fx, beyblade.y - fy, 10)
+                self.effects.spawn_collision_sparks(fx, fy, 1.5)
+                self.effects.sound.play('hit')
+                fireballs_to_remove.append(slot)
+
+            # Remove if expired or out of arena
+            fireballs_to_remove.extend(fireball_slots[store.lifetime[fireball_slots] <= 0].tolist())
+            store.remove(fireballs_to_remove)
+
+        # Handle ice ability - avatars shoot ice toward arena (continues after death)
+        for beyblade in self._holders('ice'):
+            avatar = self.avatar_manager.avatars.get(beyblade.name)
+            if avatar and avatar.state not in (AvatarState.ELIMINATED, AvatarState.LAUNCHING):
+                avatar.ice_cooldown -= 1
+                if avatar.ice_cooldown <= 0:
+                    # Spawn an ice projectile from avatar toward a random point in arena
+                    dx = self.arena.center_x - avatar.x
+                    dy = self.arena.center_y - avatar.y
+                    base_angle = math.atan2(dy, dx)
+                    # Add randomness to direction
+                    shoot_angle = base_angle + random.uniform(-0.6, 0.6)
+                    speed = 6  # Slower than fireball
+                    self.projectiles.spawn(
+                        ICE, avatar.x, avatar.y, beyblade.field_index,
+                        vx=math.cos(shoot_angle) * speed,
+                        vy=math.sin(shoot_angle) * speed,
+                        lifetime=240,  # 4 seconds max
+                    )
+                    avatar.ice_cooldown = 120  # 2 second cooldown
+
+        # Update ice projectiles - movement, trails, and collision
+        ice_slots = store.slots(ICE)
+        if len(ice_slots):
+            store.advance(ice_slots)
+
+            # Leave ice trail every few frames
+            for slot in ice_slots[store.lifetime[ice_slots] % 3 == 0].tolist():
+                store.spawn(ICE_TRAIL, store.x[slot], store.y[slot], lifetime=600)  # 10 seconds
+
+            ice_to_remove = []
+            for slot, beyblade in self._projectile_hits(ice_slots, 10):  # 10 is ice radius
+                ix, iy = float(store.x[slot]), float(store.y[slot])
+                # Marty Mauser: reflect projectiles back
+                if beyblade.ability == 'marty_mauser':
+                    store.reflect(slot, beyblade.field_index, 240)
+                    self.effects.spawn_collision_sparks(ix, iy, 0.5)
+                    self.effects.spawn_ability_notification(beyblade.name, 'REFLECT!', ABILITIES['marty_mauser']['color'], 'ability', 'Marty Mauser')
+                    continue
+                # Hit! Freeze the beyblade
+                owner = self._projectile_owner(slot)
+                if owner and not is_immune_to_damage(beyblade, owner):
+                    beyblade.ice_frozen_timer = 60  # 1 second freeze
+                    beyblade.vx = 0
+                    beyblade.vy = 0
+                    self.effects.spawn_ability_notification(beyblade.name, 'FROZEN!', ABILITIES['ice']['color'], 'ability', 'Ice')
+                self.effects.spawn_collision_sparks(ix, iy, 1.5)
+                ice_to_remove.append(slot)
+
+            # Remove if expired
+            ice_to_remove.extend(ice_slots[store.lifetime[ice_slots] <= 0].tolist())
+            store.remove(ice_to_remove)
+
+        # Handle ice freeze (prevent movement during freeze)
+        for beyblade in self.beyblades:
+            if beyblade.ice_frozen_timer > 0:
+                beyblade.ice_frozen_timer -= 1
+                beyblade.vx = 0
+                beyblade.vy = 0
+
+        # Handle beyblades slipping on ice trails (Batman immune)
+        trail_slots = store.slots(ICE_TRAIL)
+        if len(trail_slots):
+            bx, by, radius = gather_positions(self.beyblades)
+            on_ice = store.within(trail_slots, bx, by, radius + 8).any(axis=0)  # Close enough to ice
+            for beyblade, slipping in zip(self.beyblades, on_ice.tolist()):
+                if slipping and beyblade.alive and beyblade.ice_frozen_timer <= 0 and beyblade.ability != 'batman':
+                    # Slip effect: slight angle change and speed boost (one trail per frame)
+                    if beyblade.speed > 0.5:
+                        # Rotate velocity by small random angle
+                        angle_change = random.uniform(-0.15, 0.15)
+                        cos_a = math.cos(angle_change)
+                        sin_a = math.sin(angle_change)
+                        new_vx = beyblade.vx * cos_a - beyblade.vy * sin_a
+                        new_vy = beyblade.vx * sin_a + beyblade.vy * cos_a
+                        beyblade.vx = new_vx * 1.03  # Small speed boost
+                        beyblade.vy = new_vy * 1.03
+
+            # Update ice trail lifetimes
+            store.lifetime[trail_slots] -= 1
+            store.remove(trail_slots[store.lifetime[trail_slots] <= 0])
+
+        # Handle grenade ability - avatars throw grenades toward center of arena
+        for beyblade in self._holders('grenade'):  # Continues after death
+            avatar = self.avatar_manager.avatars.get(beyblade.name)
+            if avatar and avatar.state not in (AvatarState.ELIMINATED, AvatarState.LAUNCHING):
+                avatar.grenade_cooldown -= 1
+                if avatar.grenade_cooldown <= 0:
+                    # Pick random target near center of arena (inner ~35% radius)
+                    if self.arena.finals_mode:
+                        # For rectangle, target the middle third
+                        rect_width = self.arena.rect_right - self.arena.rect_left
+                        rect_height = self.arena.rect_bottom - self.arena.rect_top
+                        center_x = (self.arena.rect_left + self.arena.rect_right) / 2
+                        center_y = (self.arena.rect_top + self.arena.rect_bottom) / 2
+                        target_x = center_x + random.uniform(-rect_width * 0.2, rect_width * 0.2)
+                        target_y = center_y + random.uniform(-rect_height * 0.2, rect_height * 0.2)
+                    else:
+                        angle = random.uniform(0, 2 * math.pi)
+                        dist = random.uniform(0, self.arena.radius * 0.35)
+                        target_x = self.arena.center_x + math.cos(angle) * dist
+                        target_y = self.arena.center_y + math.sin(angle) * dist
+
+                    self.projectiles.spawn(
+                        GRENADE, avatar.x, avatar.y, beyblade.field_index,
+                        target_x=target_x, target_y=target_y,
+                    )
+                    avatar.grenade_cooldown = 180  # 3 second cooldown
+
+        # Update grenades - flight and explosion
+        grenade_slots = store.slots(GRENADE)
+        if len(grenade_slots):
+            store.progress[grenade_slots] += 0.02  # Takes ~50 frames (less than 1 second) to land
+            landed = grenade_slots[store.progress[grenade_slots] >= 1.0]
+
+            for slot in landed.tolist():
+                # Grenade landed - EXPLODE!
+                tx, ty = float(store.target_x[slot]), float(store.target_y[slot])
+                explosion_radius = 100
+                owner = self._projectile_owner(slot)
+
+                for beyblade in self.beyblades:
+                    if beyblade.alive and owner:
+                        dx = beyblade.x - tx
+                        dy = beyblade.y - ty
+                        dist = math.sqrt(dx**2 + dy**2)
+                        if dist < explosion_radius:
+                            # Strong knockback and significant damage
+                            damage_mult = 1 - (dist / explosion_radius)  # 100% at center, 0% at edge
+                            apply_knockback(beyblade, owner, dx, dy, 15 * damage_mult)
+                            deal_damage(beyblade, owner, 20 * damage_mult)
+
+                self.effects.spawn_collision_sparks(tx, ty, 5.0)
+                self.effects.sound.play('big_hit')
+
+            store.remove(landed)
+
+        # Handle kamehameha ability - avatars charge and fire beams (continues after death)
+        for beyblade in self._holders('kamehameha'):
+            avatar = self.avatar_manager.avatars.get(beyblade.name)
+            if avatar and avatar.state not in (AvatarState.ELIMINATED, AvatarState.LAUNCHING):
+                if avatar.kamehameha_charging:
+                    avatar.kamehameha_charge_timer -= 1
+                    if avatar.kamehameha_charge_timer <= 0:
+                        # FIRE THE BEAM!
+                        # Calculate beam direction toward arena
+                        dx = self.arena.center_x - avatar.x
+                        dy = self.arena.center_y - avatar.y
+                        base_angle = math.atan2(dy, dx)
+                        # Add some randomness to the angle
+                        beam_angle = base_angle + random.uniform(-0.5, 0.5)
+
+                        self.projectiles.spawn(
+                            KAMEHAMEHA, avatar.x, avatar.y, beyblade.field_index,
+                            angle=beam_angle, cos=math.cos(beam_angle), sin=math.sin(beam_angle),
+                            lifetime=45,  # Beam lasts 0.75 seconds
+                        )
+
+                        avatar.kamehameha_charging = False
+                        avatar.kamehameha_cooldown = random.randint(600, 900)  # 10-15 seconds
+                        self.effects.spawn_ability_notification(beyblade.name, 'KAMEHAMEHA!', ABILITIES['kamehameha']['color'], 'burst')
+                else:
+                    avatar.kamehameha_cooldown -= 1
+                    if avatar.kamehameha_cooldown <= 0:
+                        # Start charging
+                        avatar.kamehameha_charging = True
+                        avatar.kamehameha_charge_timer = 90  # 1.5 second charge
+
+        # Update kamehameha beams
+        beam_slots = store.slots(KAMEHAMEHA)
+        if len(beam_slots):
+            # Extend beam length (fast beam extension)
+            length = store.length[beam_slots]
+            store.length[beam_slots] = np.where(length < KAMEHAMEHA_MAX_LENGTH, length + 40, length)
+            store.lifetime[beam_slots] -= 1
+
+            bx, by, radius = gather_positions(self.beyblades)
+            for slot in beam_slots.tolist():
+                # Project every beyblade onto the beam axis
+                cos_a, sin_a = float(store.cos[slot]), float(store.sin[slot])
+                dx = bx - store.x[slot]
+                dy = by - store.y[slot]
+                along_beam = dx * cos_a + dy * sin_a  # Distance along beam
+                perp_beam = np.abs(-dx * sin_a + dy * cos_a)  # Distance perpendicular to beam
+                in_beam = (0 < along_beam) & (along_beam < store.length[slot]) & (perp_beam < KAMEHAMEHA_WIDTH / 2 + radius)
+
+                owner_index = store.owner[slot]
+                hit_targets = store.hit_targets[slot]
+                for index in np.flatnonzero(in_beam).tolist():
+                    beyblade = self.beyblades[index]
+                    if beyblade.alive and beyblade.field_index != owner_index and beyblade.field_index not in hit_targets:
+                        # HIT! Apply hitstun then knockback
+                        hit_targets.add(beyblade.field_index)
+                        owner = self._projectile_owner(slot)
+                        if owner and not is_immune_to_damage(beyblade, owner):
+                            beyblade.hitstun_timer = 15  # 0.25 second hitstun
+                            beyblade.vx = 0
+                            beyblade.vy = 0
+                            # Store knockback to apply after hitstun
+                            knockback_force = 18
+                            beyblade.hitstun_knockback = (cos_a * knockback_force, sin_a * knockback_force)
+                        self.effects.spawn_collision_sparks(beyblade.x, beyblade.y, 2.5)
+
+            store.remove(beam_slots[store.lifetime[beam_slots] <= 0])
+
+        # Handle hitstun (freeze then knockback)
+        for beyblade in self.beyblades:
+            if beyblade.hitstun_timer > 0:
+                beyblade.hitstun_timer -= 1
+                beyblade.vx = 0
+                beyblade.vy = 0
+                if beyblade.hitstun_timer == 0:
+                    # Apply the stored knockback
+                    beyblade.vx, beyblade.vy = beyblade.hitstun_knockback
+                    beyblade.hitstun_knockback = (0, 0)
+
+        # Handle water ability - avatars create waves that push everything
+        for beyblade in self._holders('water'):  # Continues after death
+            avatar = self.avatar_manager.avatars.get(beyblade.name)
+            if avatar and avatar.state not in (AvatarState.ELIMINATED, AvatarState.LAUNCHING):
+                avatar.water_cooldown -= 1
+                if avatar.water_cooldown <= 0:
+                    # Spawn a wave from avatar toward arena
+                    dx = self.arena.center_x - avatar.x
+                    dy = self.arena.center_y - avatar.y
+                    base_angle = math.atan2(dy, dx)
+                    # Add randomness to direction
+                    wave_angle = base_angle + random.uniform(-0.4, 0.4)
+
+                    self.projectiles.spawn(
+                        WATER_WAVE, avatar.x, avatar.y, beyblade.field_index,
+                        angle=wave_angle, cos=math.cos(wave_angle), sin=math.sin(wave_angle),
+                    )
+                    avatar.water_cooldown = random.randint(600, 900)  # 10-15 seconds
+                    self.effects.spawn_ability_notification(beyblade.name, 'WAVE!', ABILITIES['water']['color'], 'ability', 'Water')
+
+        # Update water waves
+        wave_slots = store.slots(WATER_WAVE)
+        if len(wave_slots):
+            store.progress[wave_slots] += 0.025  # Wave moves across arena
+
+            bx, by, radius = gather_positions(self.beyblades)
+            for slot in wave_slots.tolist():
+                # Calculate wave front position
+                cos_a, sin_a = float(store.cos[slot]), float(store.sin[slot])
+                max_dist = 700  # How far wave travels
+                current_dist = float(store.progress[slot]) * max_dist
+                wave_x = float(store.x[slot]) + cos_a * current_dist
+                wave_y = float(store.y[slot]) + sin_a * current_dist
+
+                # Beyblades within the wave front
+                dx = bx - wave_x
+                dy = by - wave_y
+                perp_dist = np.abs(-dx * sin_a + dy * cos_a)  # Distance perpendicular to wave direction
+                along_dist = dx * cos_a + dy * sin_a  # Distance along wave direction
+                in_front = (perp_dist < WATER_WAVE_WIDTH / 2 + radius) & (np.abs(along_dist) < 40)
+
+                # Push beyblades in wave direction
+                owner = self._projectile_owner(slot)
+                hit_targets = store.hit_targets[slot]
+                for index in np.flatnonzero(in_front).tolist():
+                    beyblade = self.beyblades[index]
+                    if beyblade.alive and beyblade.field_index not in hit_targets:
+                        # Hit by wave - push in wave direction
+                        hit_targets.add(beyblade.field_index)
+                        if owner and not is_immune_to_damage(beyblade, owner):
+                            push_force = 10
+                            beyblade.vx += cos_a * push_force
+                            beyblade.vy += sin_a * push_force
+                        self.effects.spawn_collision_sparks(beyblade.x, beyblade.y, 1.5)
+
+            store.remove(wave_slots[store.progress[wave_slots] >= 1.0])
+
+        # Handle venom DoT ticks
+        for beyblade in self.beyblades:
+            if beyblade.alive and beyblade.venom_dot > 0:
+                beyblade.venom_tick_timer -= 1
+                if beyblade.venom_tick_timer <= 0:
+                    # Apply tick damage (spread over 3 seconds = 180 frames, tick every 30 frames = 6 ticks)
+                    tick_damage = beyblade.venom_dot / 6
+                    beyblade.stamina -= tick_damage
+                    beyblade.venom_dot -= tick_damage
+                    beyblade.venom_tick_timer = 30
+                    # Visual feedback
+                    self.effects.spawn_collision_sparks(beyblade.x, beyblade.y, 0.5)
+                    if beyblade.stamina <= 0:
+                        beyblade.die()
+
+        # Update timebomb countdowns
+        for beyblade in self._holders('timebomb'):
+            if beyblade.alive and beyblade.timebomb_timer > 0:
+                beyblade.timebomb_timer -= 1
+                if beyblade.timebomb_timer <= 0:
+                    # BOOM! Massive explosion
+                    for other in self.beyblades:
+                        if other.alive and other != beyblade:
+                            dx = other.x - beyblade.x
+                            dy = other.y - beyblade.y
+                            dist = math.sqrt(dx**2 + dy**2)
+                            if dist > 0 and dist < 500:
+                                # Huge knockback and damage to everyone
+                                force = 25 * (1 - dist / 500)
+                                apply_knockback(other, beyblade, dx, dy, force)
+                                if dist < 200:
+                                    deal_damage(other, beyblade, 15 * (1 - dist / 200))
+                    # Self-destruct
+                    beyblade.die()
+                    self.effects.spawn_collision_sparks(beyblade.x, beyblade.y, 8.0)
+                    self.effects.spawn_ability_notification(beyblade.name, 'TIMEBOMB!', ABILITIES['timebomb']['color'], 'burst')
+
+        # Swamp Thing: stop own momentum when going fast (once per game)
+        for beyblade in self._holders('swamp_thing'):
+            if beyblade.alive:
+                if beyblade.name not in self.swamp_thing_used and beyblade.speed >= 12:
+                    # Trigger swamp thing - freeze only self
+                    self.swamp_thing_used.add(beyblade.name)
+                    beyblade.swamp_thing_freeze_timer = 45  # 0.75 seconds
+                    beyblade.vx = 0
+                    beyblade.vy = 0
+                    self.effects.spawn_ability_notification(beyblade.name, 'SWAMP THING!', ABILITIES['swamp_thing']['color'], 'ability')
+
+        # Handle swamp thing freeze (prevent movement during freeze)
+        for beyblade in self.beyblades:
+            if beyblade.swamp_thing_freeze_timer > 0:
+                beyblade.swamp_thing_freeze_timer -= 1
+                beyblade.vx = 0
+                beyblade.vy = 0
+
+        # Goku: teleport behind random enemy every 5-20 seconds
+        for beyblade in self._holders('goku'):
+            if beyblade.alive:
+                beyblade.goku_teleport_cooldown -= 1
+                if beyblade.goku_teleport_cooldown <= 0:
+                    # Find a random target
+                    targets = [b for b in self.beyblades if b.alive and b != beyblade]
+                    if targets:
+                        target = random.choice(targets)
+                        # Teleport behind the target (opposite side from their movement direction)
+                        if target.speed > 0.5:
+                            # Behind based on velocity
+                            behind_x = target.x - (target.vx / target.speed) * (target.radius + beyblade.radius + 10)
+                            behind_y = target.y - (target.vy / target.speed) * (target.radius + beyblade.radius + 10)
+                        else:
+                            # Random offset if target is stationary
+                            angle = random.uniform(0, 2 * math.pi)
+                            behind_x = target.x + math.cos(angle) * (target.radius + beyblade.radius + 10)
+                            behind_y = target.y + math.sin(angle) * (target.radius + beyblade.radius + 10)
+
+                        beyblade.x = behind_x
+                        beyblade.y = behind_y
+                        # Give a burst of speed toward target
+                        dx = target.x - beyblade.x
+                        dy = target.y - beyblade.y
+                        dist = math.sqrt(dx**2 + dy**2)
+                        if dist > 0:
+                            beyblade.vx = (dx / dist) * 12
+                            beyblade.vy = (dy / dist) * 12
+                        self.effects.spawn_collision_sparks(beyblade.x, beyblade.y, 2.0)
+                        self.effects.spawn_ability_notification(beyblade.name, 'INSTANT TRANSMISSION!', ABILITIES['goku']['color'], 'ability', 'Goku')
+                    # Reset cooldown (random 5-20 seconds)
+                    beyblade.goku_teleport_cooldown = random.randint(300, 1200)
+
+        # Last Stand: activate at 10% HP, invincible for 5 seconds (once per heat)
+        for beyblade in self._holders('last_stand'):
+            if beyblade.alive:
+                if not beyblade.last_stand_active and not beyblade.last_stand_used and beyblade.stamina <= beyblade.max_stamina * 0.1:
+                    beyblade.last_stand_active = True
+                    beyblade.last_stand_used = True  # Only triggers once
+                    beyblade.last_stand_timer = 300  # 5 seconds
+                    self.effects.spawn_ability_notification(beyblade.name, 'LAST STAND!', ABILITIES['last_stand']['color'], 'ability')
+                if beyblade.last_stand_active:
+                    beyblade.last_stand_timer -= 1
+                    beyblade.stamina = max(1, beyblade.stamina)  # Can't die during last stand
+                    if beyblade.last_stand_timer <= 0:
+                        beyblade.last_stand_active = False
+
+        # Earthquake: shake all beyblades every 15 seconds
+        for beyblade in self._holders('earthquake'):
+            if beyblade.alive:
+                beyblade.earthquake_timer -= 1
+                if beyblade.earthquake_timer <= 0:
+                    beyblade.earthquake_timer = 900  # Reset for next quake
+                    for other in self.beyblades:
+                        if other.alive and not is_immune_to_damage(other, beyblade):
+                            # Random velocity change
+                            other.vx += random.uniform(-8, 8)
+                            other.vy += random.uniform(-8, 8)
+                    self.effects.spawn_ability_notification(beyblade.name, 'EARTHQUAKE!', ABILITIES['earthquake']['color'], 'burst')
+
+        # Lightning Storm: strike 3 random enemies every 10 seconds
+        for beyblade in self._holders('lightning_storm'):
+            if beyblade.alive:
+                beyblade.lightning_timer -= 1
+                if beyblade.lightning_timer <= 0:
+                    beyblade.lightning_timer = 600  # Reset
+                    targets = [b for b in self.beyblades if b.alive and b != beyblade and not is_immune_to_damage(b, beyblade)]
+                    random.shuffle(targets)
+                    for target in targets[:3]:  # Up to 3 targets
+                        deal_damage(target, beyblade, 5)
+                        target.vx += random.uniform(-5, 5)
+                        target.vy += random.uniform(-5, 5)
+                        self.effects.spawn_collision_sparks(target.x, target.y, 2.0)
+                    self.effects.spawn_ability_notification(beyblade.name, 'LIGHTNING!', ABILITIES['lightning_storm']['color'], 'ability')
+
+        # Doomsday Clock: after 30 seconds, eliminate 2 beyblades closest to edge
+        for beyblade in self._holders('doomsday'):
+            if beyblade.alive:
+                beyblade.doomsday_timer -= 1
+                if beyblade.doomsday_timer <= 0:
+                    beyblade.doomsday_timer = 9999999  # Only triggers once
+                    # Find 2 beyblades closest to arena edge (excluding self and immune beyblades)
+                    others = [b for b in self.beyblades if b.alive and b != beyblade and not is_immune_to_damage(b, beyblade)]
+                    if self.arena.finals_mode:
+                        # Distance to left/right edge
+                        def edge_dist(b):
+                            return min(b.x - self.arena.rect_left, self.arena.rect_right - b.x)
+                    else:
+                        # Distance from center (closer to edge = larger dist)
+                        def edge_dist(b):
+                            dx = b.x - self.arena.center_x
+                            dy = b.y - self.arena.center_y
+                            return self.arena.radius - math.sqrt(dx**2 + dy**2)
+                    others.sort(key=edge_dist)
+                    for victim in others[:2]:
+                        victim.die()
+                        self.effects.spawn_collision_sparks(victim.x, victim.y, 5.0)
+                    self.effects.spawn_ability_notification(beyblade.name, 'DOOMSDAY!', ABILITIES['doomsday']['color'], 'knockout')
+
+        # Portal: create linked portals, teleport beyblades that touch them
+        portal_owner = None
+        for beyblade in self._holders('portal'):
+            if beyblade.alive:
+                portal_owner = beyblade
+                break
+
+        if portal_owner and len(self.portals) == 0:
+            # Create two portals at random positions in arena
+            for i in range(2):
+                if self.arena.finals_mode:
+                    px = random.uniform(self.arena.rect_left + 50, self.arena.rect_right - 50)
+                    py = random.uniform(self.arena.rect_top + 50, self.arena.rect_bottom - 50)
+                else:
+                    angle = random.uniform(0, 2 * math.pi)
+                    dist = random.uniform(50, self.arena.radius * 0.7)
+                    px = self.arena.center_x + math.cos(angle) * dist
+                    py = self.arena.center_y + math.sin(angle) * dist
+                self.portals.append({'x': px, 'y': py, 'color': portal_owner.color})
+            self.effects.spawn_ability_notification(portal_owner.name, 'PORTAL!', ABILITIES['portal']['color'], 'ability')
+
+        # Handle portal teleportation
+        if len(self.portals) >= 2 and self.portal_cooldown <= 0:
+            for beyblade in self.beyblades:
+                if beyblade.alive:
+                    for i, portal in enumerate(self.portals):
+                        dx = beyblade.x - portal['x']
+                        dy = beyblade.y - portal['y']
+                        dist = math.sqrt(dx**2 + dy**2)
+                        if dist < 25:  # Portal radius
+                            # Teleport to other portal
+                            other_portal = self.portals[1 - i]
+                            beyblade.x = other_portal['x']
+                            beyblade.y = other_portal['y']
+                            self.portal_cooldown = 60  # 1 second cooldown
+                            self.effects.spawn_collision_sparks(portal['x'], portal['y'], 2.0)
+                            break
+        if self.portal_cooldown > 0:
+            self.portal_cooldown -= 1
+
+        # Handle obelisk bumper collisions
+        for bumper in self.obelisk_bumpers:
+            bumper.update()
+            for beyblade in self.beyblades:
+                if beyblade.alive and bumper.check_collision(beyblade):
+                    bumper.apply_bounce(beyblade)
+                    self.effects.spawn_collision_sparks(beyblade.x, beyblade.y, 1.5)
+                    self.effects.sound.play('bumper')
+
+        # Andy Dufresne: respawn after 20 seconds dead if heat continues
+        for beyblade in self._holders('andy_dufresne'):
+            if not beyblade.alive:
+                if beyblade.name not in self.andy_respawn_used:
+                    beyblade.andy_death_timer += 1
+                    if beyblade.andy_death_timer >= 1200:  # 20 seconds
+                        # Respawn with full HP at arena center
+                        self.andy_respawn_used.add(beyblade.name)
+                        beyblade.alive = True
+                        beyblade.stamina = beyblade.max_stamina
+                        beyblade.knockout_timer = 0
+                        beyblade.x = self.arena.center_x + random.uniform(-50, 50)
+                        beyblade.y = self.arena.center_y + random.uniform(-50, 50)
+                        beyblade.vx = random.uniform(-5, 5)
+                        beyblade.vy = random.uniform(-5, 5)
+                        # Remove from eliminated list if present
+                        if beyblade.name in self.eliminated:
+                            self.eliminated.remove(beyblade.name)
+                        if beyblade.name in self.all_eliminated:
+                            self.all_eliminated.remove(beyblade.name)
+                        self.effects.spawn_ability_notification(beyblade.name, 'HOPE PREVAILS!', ABILITIES['andy_dufresne']['color'], 'ability', 'Andy Dufresne')
+                        self.effects.spawn_collision_sparks(beyblade.x, beyblade.y, 3.0)
+
+        # Shelob: crawl after 5 seconds without being hit
+        for beyblade in self._holders('shelob'):
+            if beyblade.alive:
+                beyblade.shelob_no_hit_timer += 1
+                if beyblade.shelob_no_hit_timer >= 300:  # 5 seconds
+                    if not beyblade.shelob_is_crawling:
+                        beyblade.shelob_is_crawling = True
+                        beyblade.shelob_crawl_angle = random.uniform(0, 2 * math.pi)
+                        self.effects.spawn_ability_notification(beyblade.name, 'CRAWLING...', ABILITIES['shelob']['color'], 'ability', 'Shelob')
+
+                    # Crawl in current direction
+                    beyblade.shelob_crawl_timer -= 1
+                    if beyblade.shelob_crawl_timer <= 0:
+                        # Change direction periodically
+                        beyblade.shelob_crawl_angle += random.uniform(-0.5, 0.5)
+                        beyblade.shelob_crawl_timer = random.randint(30, 90)
+
+                    # Move in crawl direction at slow speed
+                    crawl_speed = 2.0
+                    beyblade.vx = math.cos(beyblade.shelob_crawl_angle) * crawl_speed
+                    beyblade.vy = math.sin(beyblade.shelob_crawl_angle) * crawl_speed
+
+                    # Don't walk off edge - check distance from center
+                    if not self.arena.finals_mode:
+                        dx = beyblade.x - self.arena.center_x
+                        dy = beyblade.y - self.arena.center_y
+                        dist = math.sqrt(dx**2 + dy**2)
+                        if dist > self.arena.radius * 0.7:
+                            # Turn toward center
+                            beyblade.shelob_crawl_angle = math.atan2(-dy, -dx)
+                    else:
+                        # Rectangle arena - stay away from CURRENT edges (accounts for moving walls)
+                        # Use larger margin when walls are closing to stay safe
+                        margin = 150 if self.arena.edges_closing else 100
+                        current_left = self.arena.current_rect_left
+                        current_right = self.arena.current_rect_right
+
+                        # Check if too close to left wall
+                        if beyblade.x < current_left + margin:
+                            beyblade.shelob_crawl_angle = 0  # Turn right (away from left wall)
+                        # Check if too close to right wall
+                        elif beyblade.x > current_right - margin:
+                            beyblade.shelob_crawl_angle = math.pi  # Turn left (away from right wall)
+
+                        # If walls are very close together, move toward center
+                        arena_width = current_right - current_left
+                        if arena_width < 400:
+                            center_x = (current_left + current_right) / 2
+                            if beyblade.x < center_x:
+                                beyblade.shelob_crawl_angle = 0  # Move right toward center
+                            else:
+                                beyblade.shelob_crawl_angle = math.pi  # Move left toward center
+
+        # American Psycho: reset own damage after 20 seconds
+        for beyblade in self._holders('american_psycho'):
+            if beyblade.alive:
+                beyblade.american_psycho_timer -= 1
+                if beyblade.american_psycho_timer <= 0:
+                    # Reset stamina to stored value
+                    if beyblade.stamina < beyblade.american_psycho_stored_stamina:
+                        beyblade.stamina = beyblade.american_psycho_stored_stamina
+                        self.effects.spawn_ability_notification(beyblade.name, 'DAMAGE RESET!', ABILITIES['american_psycho']['color'], 'ability', 'American Psycho')
+                    # Store current stamina and reset timer
+                    beyblade.american_psycho_stored_stamina = beyblade.stamina
+                    beyblade.american_psycho_timer = 1200  # 20 seconds
+
+        # Barry Lyndon: random duel trigger (once per game)
+        for beyblade in self._holders('barry_lyndon'):
+            if beyblade.alive:
+                if beyblade.name not in self.barry_lyndon_used:
+                    if random.random() < 0.001:  # ~6% chance per second at 60fps
+                        targets = [b for b in self.beyblades if b.alive and b != beyblade]
+                        if targets:
+                            opponent = random.choice(targets)
+                            self.barry_lyndon_used.add(beyblade.name)
+                            self.effects.spawn_ability_notification(
+                                beyblade.name, f'DUEL vs {opponent.name[:10]}!', ABILITIES['barry_lyndon']['color'], 'ability', 'Barry Lyndon'
+                            )
+                            # 90% Barry wins
+                            if random.random() < 0.9:
+                                opponent.die()
+                                self.effects.spawn_knockout_effect(opponent.x, opponent.y, opponent.color, opponent.name)
+                                self.effects.spawn_ability_notification(beyblade.name, 'WINS DUEL!', ABILITIES['barry_lyndon']['color'], 'ability')
+                            else:
+                                beyblade.die()
+                                self.effects.spawn_knockout_effect(beyblade.x, beyblade.y, beyblade.color, beyblade.name)
+                                self.effects.spawn_ability_notification(opponent.name, 'WINS DUEL!', (255, 255, 255), 'ability')
+
+        # Kevin McAllister: drop traps behind
+        for beyblade in self._holders('kevin_mcallister'):
+            if beyblade.alive:
+                beyblade.trap_cooldown -= 1
+                if beyblade.trap_cooldown <= 0:
+                    trap_type = random.choice(['nail', 'banana'])
+                    self.traps.append({
+                        'x': beyblade.x,
+                        'y': beyblade.y,
+                        'type': trap_type,
+                        'owner_name': beyblade.name,
+                        'lifetime': 600,  # 10 seconds
+                    })
+                    beyblade.trap_cooldown = 120  # Drop every 2 seconds
+
+        # Update traps
+        traps_to_remove = []
+        for trap in self.traps:
+            trap['lifetime'] -= 1
+            if trap['lifetime'] <= 0:
+                traps_to_remove.append(trap)
+                continue
+
+            owner = self._find_beyblade(trap['owner_name'])
+            for beyblade in self.beyblades:
+                if beyblade.alive and beyblade.name != trap['owner_name'] and owner:
+                    dx = beyblade.x - trap['x']
+                    dy = beyblade.y - trap['y']
+                    dist = math.sqrt(dx * dx + dy * dy)
+                    if dist < beyblade.radius + 10:
+                        if trap['type'] == 'nail':
+                            if deal_damage(beyblade, owner, 3):
+                                self.effects.spawn_collision_sparks(trap['x'], trap['y'], 0.5)
+                                traps_to_remove.append(trap)
+                                break
+                        else:  # banana
+                            if not is_immune_to_damage(beyblade, owner):
+                                # Slip effect like ice
+                                angle = random.uniform(0, 2 * math.pi)
+                                speed = max(beyblade.speed, 5)
+                                beyblade.vx = math.cos(angle) * speed * 1.3
+                                beyblade.vy = math.sin(angle) * speed * 1.3
+                                self.effects.spawn_collision_sparks(trap['x'], trap['y'], 0.3)
+                            traps_to_remove.append(trap)
+                            break
+
+        for trap in traps_to_remove:
+            if trap in self.traps:
+                self.traps.remove(trap)
+
+        # Ferris Bueller: late entry (5 seconds into heat)
+        for beyblade in self._holders('ferris_bueller'):
+            if beyblade.ferris_late_entry:
+                beyblade.ferris_timer -= 1
+                if beyblade.ferris_timer <= 0:
+                    beyblade.ferris_late_entry = False
+                    beyblade.alive = True
+                    # Spawn at random position
+                    if self.arena.finals_mode:
+                        beyblade.x = random.uniform(self.arena.rect_left + 50, self.arena.rect_right - 50)
+                        beyblade.y = random.uniform(self.arena.rect_top + 50, self.arena.rect_bottom - 50)
+                    else:
+                        angle = random.uniform(0, 2 * math.pi)
+                        dist = random.uniform(50, self.arena.radius * 0.6)
+                        beyblade.x = self.arena.center_x + math.cos(angle) * dist
+                        beyblade.y = self.arena.center_y + math.sin(angle) * dist
+                    beyblade.vx = random.uniform(-3, 3)
+                    beyblade.vy = random.uniform(-3, 3)
+                    self.effects.spawn_ability_notification(beyblade.name, 'ARRIVES LATE!', ABILITIES['ferris_bueller']['color'], 'ability', 'Ferris Bueller')
+
+        # Alien: gestation and bursting
+        for beyblade in self._holders('alien'):
+            if beyblade.alien_host:
+                host = self._find_beyblade(beyblade.alien_host)
+                if host and host.alive:
+                    beyblade.alien_gestation_timer -= 1
+                    beyblade.x, beyblade.y = host.x, host.y  # Follow host
+                    if beyblade.alien_gestation_timer <= 0:
+                        # Burst out!
+                        host.die()
+                        beyblade.alive = True
+                        beyblade.alien_is_juvenile = False
+                        beyblade.alien_host = None
+                        # Apply adult bonus (+10% stats)
+                        if not beyblade.alien_adult_bonus_applied:
+                            beyblade.attack *= 1.1
+                            beyblade.defense *= 1.1
+                            beyblade.max_stamina *= 1.1
+                            beyblade.stamina = beyblade.max_stamina
+                            beyblade.alien_adult_bonus_applied = True
+                        self.effects.spawn_knockout_effect(host.x, host.y, host.color, host.name)
+                        self.effects.spawn_ability_notification(beyblade.name, 'BURSTS OUT!', ABILITIES['alien']['color'], 'ability', 'Alien')
+                        self.effects.spawn_collision_sparks(beyblade.x, beyblade.y, 4.0)
+                else:
+                    # Host died some other way, alien emerges early
+                    if not beyblade.alive:
+                        beyblade.alive = True
+                        beyblade.alien_is_juvenile = False
+                        beyblade.alien_host = None
+                        if not beyblade.alien_adult_bonus_applied:
+                            beyblade.attack *= 1.1
+                            beyblade.defense *= 1.1
+                            beyblade.max_stamina *= 1.1
+                            beyblade.stamina = beyblade.max_stamina
+                            beyblade.alien_adult_bonus_applied = True
+                        self.effects.spawn_ability_notification(beyblade.name, 'EMERGES!', ABILITIES['alien']['color'], 'ability', 'Alien')
+
+        # Amadeus: refuse to die while rival lives (use the flag computed earlier this frame)
+        for beyblade in self._holders('amadeus'):
+            if beyblade.amadeus_rival_alive:
+                if beyblade.stamina <= 0:
+                    beyblade.stamina = 1  # Refuse to die
+                    beyblade.alive = True
+                    beyblade.knockout_timer = 0
+
+        # Terminator: hunt target after 3s without being hit
+        for beyblade in self._holders('terminator'):
+            if beyblade.alive and beyblade.terminator_target:
+                beyblade.terminator_no_hit_timer += 1
+                if beyblade.terminator_no_hit_timer >= 180:  # 3 seconds
+                    target = self._find_beyblade(beyblade.terminator_target, alive_only=True)
+                    if target:
+                        dx = target.x - beyblade.x
+                        dy = target.y - beyblade.y
+                        dist = math.sqrt(dx * dx + dy * dy)
+                        if dist > 0:
+                            force = 0.3
+                            beyblade.vx += (dx / dist) * force
+                            beyblade.vy += (dy / dist) * force
+
+        # Oppenheimer: 1/200 chance to nuke half the field (once per game)
+        for beyblade in self._holders('oppenheimer'):
+            if beyblade.alive:
+                if beyblade.name not in self.oppenheimer_used:
+                    if random.random() < 1/200:
+                        self.oppenheimer_used.add(beyblade.name)
+                        self.effects.spawn_ability_notification(beyblade.name, 'I AM BECOME DEATH!', ABILITIES['oppenheimer']['color'], 'knockout', 'Oppenheimer')
+
+                        # Nuke left or right half
+                        nuke_left = random.choice([True, False])
+                        center_x = self.arena.center_x
+
+                        # Spawn massive nuke blast effect
+                        self.effects.spawn_nuke_blast(center_x, self.arena.center_y, nuke_left, self.arena.radius)
+
+                        for target in self.beyblades:
+                            if target.alive and target != beyblade:
+                                if (nuke_left and target.x < center_x) or (not nuke_left and target.x >= center_x):
+                                    target.die()
+                                    self.effects.spawn_knockout_effect(target.x, target.y, target.color, target.name)
+                                    self.effects.spawn_collision_sparks(target.x, target.y, 5.0)
+
+        # John Wick: avatar shoots double-tap pistol pattern
+        for beyblade in self._holders('john_wick'):
+            avatar = self.avatar_manager.avatars.get(beyblade.name)
+            if avatar and avatar.state not in (AvatarState.ELIMINATED, AvatarState.LAUNCHING):
+                avatar.pistol_cooldown -= 1
+                if avatar.pistol_cooldown <= 0:
+                    # Target random point in arena
+                    if self.arena.finals_mode:
+                        target_x = random.uniform(self.arena.rect_left, self.arena.rect_right)
+                        target_y = random.uniform(self.arena.rect_top, self.arena.rect_bottom)
+                    else:
+                        target_angle = random.uniform(0, 2 * math.pi)
+                        target_dist = random.uniform(0, self.arena.radius * 0.8)
+                        target_x = self.arena.center_x + math.cos(target_angle) * target_dist
+                        target_y = self.arena.center_y + math.sin(target_angle) * target_dist
+
+                    dx = target_x - avatar.x
+                    dy = target_y - avatar.y
+                    dist = math.sqrt(dx * dx + dy * dy)
+                    if dist > 0:
+                        speed = 15
+                        shoot_angle = math.atan2(dy, dx)
+
+                        # Single bullet per shot (double-tap pattern)
+                        self.projectiles.spawn(
+                            BULLET, avatar.x, avatar.y, beyblade.field_index,
+                            vx=math.cos(shoot_angle) * speed,
+                            vy=math.sin(shoot_angle) * speed,
+                            lifetime=90,
+                        )
+                        self.effects.sound.play('hit')
+
+                    # Double-tap timing: quick follow-up, then longer wait
+                    if avatar.pistol_followup_pending:
+                        # This was the follow-up shot, wait longer before next double-tap
+                        avatar.pistol_cooldown = 120  # 2 seconds before next double-tap
+                        avatar.pistol_followup_pending = False
+                    else:
+                        # First shot done, quick follow-up coming
+                        avatar.pistol_cooldown = 10  # ~0.17 seconds for follow-up
+                        avatar.pistol_followup_pending = True
+
+        # Update bullets
+        bullet_slots = store.slots(BULLET)
+        if len(bullet_slots):
+            store.advance(bullet_slots)
+            expired = store.lifetime[bullet_slots] <= 0
+            bullets_to_remove = bullet_slots[expired].tolist()
+
+            for slot, target in self._projectile_hits(bullet_slots[~expired], 4):
+                px, py = float(store.x[slot]), float(store.y[slot])
+                # Marty Mauser: reflect projectiles back (always works, even if immune)
+                if target.ability == 'marty_mauser':
+                    store.reflect(slot, target.field_index, 90)  # Now owned by reflector, lifetime reset
+                    self.effects.spawn_collision_sparks(px, py, 0.5)
+                    self.effects.spawn_ability_notification(target.name, 'REFLECT!', ABILITIES['marty_mauser']['color'], 'ability', 'Marty Mauser')
+                    continue
+                # Hit! Apply knockback and significant damage
+                owner = self._projectile_owner(slot)
+                if owner:
+                    dx = target.x - px
+                    dy = target.y - py
+                    apply_knockback(target, owner, dx, dy, 3)
+                    deal_damage(target, owner, 12)
+                self.effects.spawn_collision_sparks(px, py, 0.5)
+                bullets_to_remove.append(slot)
+
+            store.remove(bullets_to_remove)
+
+        # Check for new eliminations (with zombie revival and mutually assured)
+        for beyblade in self.beyblades:
+            if not beyblade.alive and beyblade.name not in self.eliminated:
+                # Neo: reset heat if killed in first 0.5 seconds (30 frames), once per heat
+                if beyblade.ability == 'neo' and not self.neo_reset_used_this_heat:
+                    frames_alive = self.current_frame - beyblade.neo_spawn_frame
+                    if frames_alive <= 60:  # 1 second at 60fps
+                        self.neo_reset_used_this_heat = True  # Mark as used before reset
+                        # Big visual notification
+                        self.effects.spawn_ability_notification(beyblade.name, 'MATRIX RESET!', ABILITIES['neo']['color'], 'ability', 'Neo')
+                        # Add a countdown-style reset message
+                        self.neo_reset_countdown = 120  # 2 second display
+                        self.neo_reset_name = beyblade.name
+                        # Reset the heat
+                        self._start_heat(self.current_heat, is_neo_reset=True)
+                        return  # Exit update_battle, heat is restarting
+
+                # Barbie: split into two fragile pieces on death
+                if beyblade.ability == 'barbie' and not beyblade.barbie_split_done and not beyblade.barbie_is_fragment:
+                    beyblade.barbie_split_done = True
+                    # Create two fragments
+                    for i, offset in enumerate([(-30, -20), (30, 20)]):
+                        fragment = Beyblade(f"{beyblade.name} (Fragment {i+1})", beyblade.x + offset[0], beyblade.y + offset[1], 0)
+                        fragment.color = beyblade.color
+                        fragment.ability = 'barbie'
+                        fragment.ability_data = ABILITIES['barbie'].copy()
+                        fragment.barbie_is_fragment = True
+                        fragment.barbie_split_done = True
+                        fragment.stamina = 1  # Dies from one hit
+                        fragment.max_stamina = 1
+                        fragment.radius = int(beyblade.radius * 0.7)
+                        fragment.vx = random.uniform(-5, 5)
+                        fragment.vy = random.uniform(-5, 5)
+                        self._add_beyblade(fragment)
+                    self.effects.spawn_ability_notification(beyblade.name, 'SPLIT!', ABILITIES['barbie']['color'], 'ability', 'Barbie')
+                    self.effects.spawn_collision_sparks(beyblade.x, beyblade.y, 2.0)
+                    # Still add original to eliminated
+                    self.eliminated.append(beyblade.name)
+                    self.all_eliminated.append(beyblade.name)
+                    continue
+
+                # Check for zombie revival
+                if beyblade.ability == 'zombie' and beyblade.name not in self.zombie_used:
+                    # Revive with 50% HP
+                    self.zombie_used.add(beyblade.name)
+                    beyblade.alive = True
+                    beyblade.stamina = beyblade.max_stamina * 0.5
+                    beyblade.knockout_timer = 0
+                    self.effects.spawn_ability_notification(beyblade.name, 'ZOMBIE RISE!', ABILITIES['zombie']['color'], 'ability')
+                    self.effects.spawn_collision_sparks(beyblade.x, beyblade.y, 3.0)
+                    continue  # Don't add to eliminated
+
+                # Check for mutually assured destruction
+                if beyblade.ability == 'mutually_assured' and not beyblade.mutually_assured_triggered:
+                    beyblade.mutually_assured_triggered = True
+                    for other in self.beyblades:
+                        if other.alive and other != beyblade:
+                            # Deal 50% of their CURRENT HP as damage
+                            damage = other.stamina * 0.5
+                            other.stamina -= damage
+                            self.effects.spawn_collision_sparks(other.x, other.y, 2.0)
+                    self.effects.spawn_ability_notification(beyblade.name, 'M.A.D. TRIGGERED!', ABILITIES['mutually_assured']['color'], 'knockout')
+
+                # Normal elimination
+                self.eliminated.append(beyblade.name)
+                self.all_eliminated.append(beyblade.name)  # Track for leaderboard
+                self.effects.spawn_knockout_effect(
+                    beyblade.x, beyblade.y, beyblade.color, beyblade.name
+                )
+                self.effects.sound.play('knockout')
+
+        # Update effects
+        self.effects.update()
+
+        # Update avatars
+        self.avatar_manager.sync_with_beyblades(self.beyblades)
+        self.avatar_manager.update()
+
+        # Check for heat/battle end
+        alive_beyblades = [b for b in self.beyblades if b.alive]
+        alive_count = len(alive_beyblades)
+
+        # Determine how many need to survive this heat
+        if self.is_finals:
+            # Finals: fight until 1 remains
+            target_survivors = 1
+        elif len(self.heats) == 1:
+            # Single heat (few movies): fight until 1 remains
+            target_survivors = 1
+        else:
+            # Regular heat: fight until advancers_per_heat remain
+            target_survivors = self.advancers_per_heat
+
+        if alive_count <= target_survivors:
+            self._end_current_heat(alive_beyblades)
+
+    def _get_ability_sound(self, text: str) -> str:
+        """Get the appropriate sound name for an ability trigger."""
+        text_lower = text.lower()
+        if 'burst' in text_lower:
+            return 'burst'
+        elif 'dodge' in text_lower:
+            return 'dodge'
+        elif 'counter' in text_lower:
+            return 'counter'
+        elif 'vampire' in text_lower:
+            return 'vampire'
+        elif 'rage' in text_lower:
+            return 'burst'
+        elif 'gambler win' in text_lower:
+            return 'gambler_win'
+        elif 'gambler lose' in text_lower:
+            return 'gambler_lose'
+        return 'ability'
+
+    def _record_ability_win(self, winner_name: str):
+        """Record the winning movie's ability to the ability wins file."""
+        # Get the winner's ability from movie_abilities
+        if winner_name not in self.movie_abilities:
+            return
+
+        ability_key, _ = self.movie_abilities[winner_name]
+        if not ability_key:
+            return
+
+        ability_wins = self._load_ability_wins()
+
+        # Increment the win count for this ability
+        ability_wins[ability_key] = ability_wins.get(ability_key, 0) + 1
+
+        self._save_ability_wins(ability_wins)
+
+    def _load_ability_wins(self):
+        """Load ability wins from file. Format: ability: count"""
+        if not self.persist_stats:
+            return self.ability_wins
+        ability_wins = {}
+        try:
+            for line in self.config.storage.read_lines('ability_wins'):
+                if ':' in line:
+                    ability, count = line.rsplit(':', 1)
+                    ability_wins[ability.strip()] = int(count.strip())
+        except:
+            pass
+        return ability_wins
+
+    def _save_ability_wins(self, ability_wins):
+        """Save ability wins to file."""
+        if not self.persist_stats:
+            self.ability_wins = ability_wins
+            return
+        self.config.storage.write_text('ability_wins', ''.join(
+            f"{ability}: {count}\n" for ability, count in sorted(ability_wins.items())))
+
+    def _load_ability_stats(self):
+        """Load ability stats from file. Format: ability|tournament_wins|heat_wins|heats_participated|games_entered"""
+        if not self.persist_stats:
+            return self.ability_stats
+        ability_stats = {}
+        try:
+            for line in self.config.storage.read_lines('ability_stats'):
+                if '|' in line:
+                    parts = line.split('|')
+                    if len(parts) >= 4:
+                        ability = parts[0]
+                        ability_stats[ability] = {
+                            'tournament_wins': int(parts[1]),
+                            'heat_wins': int(parts[2]),
+                            'heats_participated': int(parts[3]),
+                            'games_entered': int(parts[4]) if len(parts) >= 5 else 0
+                        }
+        except:
+            pass
+        return ability_stats
+
+    def _save_ability_stats(self, ability_stats):
+        """Save ability stats to file."""
+        if not self.persist_stats:
+            self.ability_stats = ability_stats
+            return
+        lines = []
+        for ability in sorted(ability_stats.keys()):
+            stats = ability_stats[ability]
+            games_entered = stats.get('games_entered', 0)
+            lines.append(f"{ability}|{stats['tournament_wins']}|{stats['heat_wins']}|{stats['heats_participated']}|{games_entered}\n")
+        self.config.storage.write_text('ability_stats', ''.join(lines))
+
+    def _record_heat_stats(self, participants: list, survivors: list):
+        """Record heat participation and wins for all abilities in this heat.
+
+        participants: list of beyblade names that participated in this heat
+        survivors: list of beyblade names that survived (won) this heat
+        """
+        ability_stats = self._load_ability_stats()
+        survivor_set = set(survivors)
+
+        for movie_name in participants:
+            if movie_name in self.movie_abilities:
+                ability_key, _ = self.movie_abilities[movie_name]
+                if ability_key:
+                    if ability_key not in ability_stats:
+                        ability_stats[ability_key] = {'tournament_wins': 0, 'heat_wins': 0, 'heats_participated': 0, 'games_entered': 0}
+                    ability_stats[ability_key]['heats_participated'] += 1
+
+                    # Credit games_entered once per movie per tournament
+                    # (This function is only called for non-preliminary heats, so movies
+                    # eliminated in preliminary group stage don't get credit)
+                    # Track by movie name so same movie in multiple heats only counts once,
+                    # but two movies with same ability each count separately
+                    if movie_name not in self.games_entered_recorded:
+                        ability_stats[ability_key]['games_entered'] += 1
+                        self.games_entered_recorded.add(movie_name)
+
+                    if movie_name in survivor_set:
+                        ability_stats[ability_key]['heat_wins'] += 1
+
+        self._save_ability_stats(ability_stats)
+
+    def _record_ability_stats(self):
+        """Record tournament win for the winner's ability."""
+        if not self.winner or self.winner == "No Winner":
+            return
+        if self.winner not in self.movie_abilities:
+            return
+
+        ability_key, _ = self.movie_abilities[self.winner]
+        if not ability_key:
+            return
+
+        ability_stats = self._load_ability_stats()
+        if ability_key not in ability_stats:
+            ability_stats[ability_key] = {'tournament_wins': 0, 'heat_wins': 0, 'heats_participated': 0, 'games_entered': 0}
+        ability_stats[ability_key]['tournament_wins'] += 1
+        self._save_ability_stats(ability_stats)
+
+    def _end_current_heat(self, survivors: list):
+        """Handle end of a heat - advance winners or end tournament."""
+        survivor_names = [b.name for b in survivors]
+
+        # Record heat stats for abilities (skip clones and fragments)
+        real_survivor_names = [b.name for b in survivors if not b.is_clone and not getattr(b, 'barbie_is_fragment', False)]
+        if self.current_heat_participants and not self.is_preliminary:
+            self._record_heat_stats(self.current_heat_participants, real_survivor_names)
+
+        # Handle preliminary round ending
+        if self.is_preliminary:
+            # Determine winner - either last survivor or last eliminated
+            if survivor_names:
+                winner_name = survivor_names[0]
+            elif self.all_eliminated:
+                winner_name = self.all_eliminated[-1]
+            else:
+                winner_name = "Group 1"  # Fallback
+
+            # Extract group index from winner name (e.g., "Group 2 (55 movies)" -> index 1)
+            try:
+                group_num = int(winner_name.split()[1])
+                winning_group_index = group_num - 1
+            except (IndexError, ValueError):
+                winning_group_index = 0
+
+            # Store the winning group's movies
+            self.preliminary_winning_movies = self.preliminary_groups[winning_group_index].copy()
+
+            # Show transition screen
+            self._show_heat_transition(
+                [winner_name],
+                1,
+                len(self.preliminary_groups),
+                is_to_finals=False,
+                is_preliminary=True,
+                is_preliminary_complete=True
+            )
+            self.pending_start_main_tournament = True
+            self.state = STATE_HEAT_TRANSITION
+            return
+
+        if self.is_finals or len(self.heats) == 1:
+            # Tournament over - we have a winner
+            if survivor_names:
+                self.winner = survivor_names[0]
+            elif self.all_eliminated:
+                self.winner = self.all_eliminated[-1]
+            else:
+                self.winner = "No Winner"
+            self._show_victory(self.winner)
+            # Record ability stats (only once per tournament)
+            if not self.ability_win_recorded:
+                if self.winner and self.winner != "No Winner":
+                    self._record_ability_win(self.winner)
+                self._record_ability_stats()
+                self.ability_win_recorded = True
+            self.effects.sound.play('victory')
+            self.avatar_manager.sync_with_beyblades(self.beyblades, winner_name=self.winner)
+            self.state = STATE_VICTORY
+        else:
+            # Add survivors to heat winners (skip clones and fragments to prevent duplicates)
+            # When Naruto clones or Barbie fragments survive, only the original should advance
+            # Otherwise the clone/fragment would spawn AND the original would create new clones
+            for survivor in survivors:
+                if survivor.is_clone or survivor.barbie_is_fragment:
+                    continue  # Skip clones and fragments
+                # Defensive: also skip if name already in heat_winners (prevents mystery duplicates)
+                if survivor.name in self.heat_winners:
+                    continue
+                self.heat_winners.append(survivor.name)
+
+            # Check if more heats remain
+            if self.current_heat < len(self.heats) - 1:
+                # Show transition screen before next heat
+                self._show_heat_transition(
+                    survivor_names,
+                    self.current_heat + 1,
+                    len(self.heats),
+                    is_to_finals=False
+                )
+                self.pending_next_heat = self.current_heat + 1
+                self.pending_is_finals = False
+                self.state = STATE_HEAT_TRANSITION
+            else:
+                # All heats done - show transition to finals
+                self._show_heat_transition(
+                    self.heat_winners,
+                    len(self.heats),
+                    len(self.heats),
+                    is_to_finals=True
+                )
+                self.pending_next_heat = 0
+                self.pending_is_finals = True
+                self.state = STATE_HEAT_TRANSITION
+
+    def _show_heat_transition(self, advancers: list, heat_number: int, total_heats: int, **kwargs):
+        """Hook called when a heat ends and the tournament continues. Game shows its transition screen."""
+        pass
+
+    def _show_victory(self, winner: str):
+        """Hook called when the tournament has a winner. Game shows its victory screen."""
+        pass
+
+    def _continue_after_heat(self):
+        """Continue to the next heat or finals after transition screen."""
+        self.eliminated.clear()  # Clear heat eliminations for next heat
+
+        # Handle preliminary round completion - start main tournament with winning group's movies
+        if self.pending_start_main_tournament:
+            self.pending_start_main_tournament = False
+            self.is_preliminary = False
+            self._start_main_tournament_with_movies(self.preliminary_winning_movies)
+            return
+
+        # Normal tournament flow
+        if self.pending_is_finals:
+            self.is_finals = True
+        self._start_heat(self.pending_next_heat)
+        self.state = STATE_BATTLE
+
+    def _start_main_tournament_with_movies(self, movie_list: list):
+        """Start the main tournament using the winning group's movies."""
+        # Reset tournament state for main tournament
+        self.eliminated.clear()
+        self.all_eliminated.clear()
+        self.heat_winners.clear()
+        self.current_heat = 0
+        self.is_finals = False
+
+        movie_list = movie_list.copy()
+
+        # Assign abilities NOW (after preliminary group selection)
+        # This ensures each ability is used once before repeating
+        movie_list = self._assign_abilities_to_movies(movie_list)
+
+        # Set up heats for the main tournament
+        if len(movie_list) <= self.max_per_heat:
+            self.heats = [movie_list]
+        else:
+            self.heats = []
+            for i in range(0, len(movie_list), self.max_per_heat):
+                heat = movie_list[i:i + self.max_per_heat]
+                if heat:
+                    self.heats.append(heat)
+
+        # Start first heat of main tournament
+        self._start_heat(0)
+        self.state = STATE_BATTLE
@@ -2,47 +2,69 @@ import pygame
 import random
 import math
 import os
+import time
 import threading
 from .constants import (
-    WINDOW_WIDTH, WINDOW_HEIGHT, FPS, UI_BG, WHITE, LIGHT_BLUE,
+    WINDOW_WIDTH, WINDOW_HEIGHT, FPS, IDLE_FPS, IDLE_AFTER_MS, UI_BG, WHITE, LIGHT_BLUE,
     STATE_INPUT, STATE_BATTLE, STATE_HEAT_TRANSITION, STATE_VICTORY, STATE_LEADERBOARD,
     STATE_DOCKET_CLAIM, STATE_DOCKET_SELECT, STATE_DOCKET_SPIN, STATE_DOCKET_RESULT, STATE_DOCKET_ZOOM,
     STATE_DIRECTOR_WHEEL, STATE_ACTOR_WHEEL, STATE_PERSON_WHEEL_RESULT,
-    BEYBLADE_COLORS, ABILITY_CHANCE, ABILITIES, ARENA_RADIUS, AVATAR_ABILITIES
+    ABILITY_CHANCE, ABILITIES, ARENA_RADIUS, AVATAR_ABILITIES
+)
+from .config import ModeConfig
+from .engine import BattleEngine
+from .projectiles import (
+    FIREBALL, ICE, ICE_TRAIL, GRENADE, KAMEHAMEHA, WATER_WAVE, BULLET,
+    KAMEHAMEHA_WIDTH, WATER_WAVE_WIDTH
 )
-from .config import get_config, ModeConfig
-from .beyblade import Beyblade, check_collision, resolve_collision, is_immune_to_damage, deal_damage, apply_knockback
-from .arena import Arena
 from .effects import EffectsManager
-from .avatar import AvatarManager, AvatarState
 from .ui import (InputScreen, BattleHUD, HeatTransitionScreen, VictoryScreen, LeaderboardScreen,
                  DocketClaimScreen, ParticipantSelectScreen, DocketResultScreen, DocketSpinScreen,
-                 PersonWheelScreen, PersonWheelResultScreen, create_fonts)
+                 PersonWheelScreen, PersonWheelResultScreen, TEXT_INSERT, create_fonts, get_font)
 from .docket import DocketWheel, DocketZoomTransition
 
+# States that sit still unless someone interacts - the loop drops to IDLE_FPS on them
+IDLE_STATES = (STATE_INPUT, STATE_LEADERBOARD, STATE_VICTORY, STATE_DOCKET_RESULT)
 
-class Game:
-    def __init__(self, config=None, web_mode=False):
-        pygame.init()
+IDLE_POLL_MS = 20  # How often an idle wait in a window checks for local events
 
-        # Mode configuration
-        self.config = config if config else get_config()
 
-        # Web mode flag for streaming to browsers
+class Game(BattleEngine):
+    def __init__(self, config=None, web_mode=False):
+        # Web mode streams frames to browsers and never opens a window, so it needs no X server
         self.web_mode = web_mode
+        if web_mode:
+            os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+        pygame.init()
+
         if web_mode:
             print(f"[Game] Starting in web mode, cwd: {os.getcwd()}")
-        self.frame_callback = None  # Called after each frame with screen surface
-        self.external_events = []  # Events injected from web clients
+        self.frame_callback = None  # Called after each changed frame with screen surface; may return False to decline it
+        self._stream_pending = False  # Last presented frame was declined by frame_callback
+        self.suspend_check = None  # Called before each frame; may block to park the loop (idle web sessions)
+        self._presented_state = None  # State of the last frame shown (menu screens redraw fully on change)
+        self.render_battles = True  # False while every web viewer draws battles itself from state snapshots
+        self.external_events = []  # (perf_counter when injected, event dict) from web clients
         self._external_events_lock = threading.Lock()  # Thread safety for web events
         self._web_mouse_pos = (0, 0)  # Mouse position from web client
+        self._pending_mouse_move = None  # [(x, y), perf_counter of the first move] - moves since last frame, coalesced
+        self.input_events = 0  # Web events handled, and the seconds between injecting and handling them
+        self.input_moves_coalesced = 0
+        self.input_latency_total = 0.0
+        self.input_latency_max = 0.0
+        self._last_input_ticks = 0  # pygame ticks of the last local or injected event
+        self._input_ready = threading.Event()  # Set by inject_event, so an idle wait wakes up for web input
 
-        # Make window resizable
-        self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.RESIZABLE)
+        if web_mode:
+            # Offscreen frame buffer: frame_callback streams it, nothing is presented
+            self.screen = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+        else:
+            # Make window resizable
+            self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.RESIZABLE)
 
-        # Scrap (clipboard) must be initialized after display
-        pygame.scrap.init()
-        pygame.display.set_caption("Movie Beyblade Battle")
+            # Scrap (clipboard) must be initialized after display
+            pygame.scrap.init()
+            pygame.display.set_caption("Movie Beyblade Battle")
 
         # Get actual window size (may differ from requested due to WM)
         actual_size = self.screen.get_size()
@@ -52,9 +74,9 @@ class Game:
         self.clock = pygame.time.Clock()
         self.fonts = create_fonts()
 
-        self.arena = Arena()
-        self.effects = EffectsManager()
-        self.avatar_manager = AvatarManager()
+        # Battle simulation state (arena, beyblades, projectiles, tournament)
+        super().__init__(config, effects=EffectsManager())
+        self.verbose = web_mode
 
         self.input_screen = InputScreen(self.fonts, self.config)
         self.battle_hud = BattleHUD(self.fonts, self.config)
@@ -95,448 +117,25 @@ class Game:
         self.docket_result_screen.update_layout(self.window_width, self.window_height)
         self.person_wheel_result_screen.update_layout(self.window_width, self.window_height)
 
-        self.beyblades: list[Beyblade] = []
-        self.eliminated: list[str] = []  # Current heat eliminations
-        self.all_eliminated: list[str] = []  # Full tournament elimination order
-        self.state = STATE_INPUT
-        self.speed_multiplier = 1
-        self.winner = None
-        self.round_number = 1
-        self.ability_win_recorded = False  # Prevent double-recording ability wins
-        self.games_entered_recorded = set()  # Track abilities credited with games_entered this tournament
         self.is_queue_battle = False  # True if battling queue.txt movies
         self.is_sequel_battle = False  # True if battling sequels.txt movies
         self.is_simulation = False  # True if running simulation (no movie list changes)
         self.sim_auto_advance_timer = 0  # Auto-advance timer for simulation mode (frames)
 
-        # Tournament state
-        self.heats: list[list[str]] = []
-        self.current_heat = 0
-        self.heat_winners: list[str] = []
-        self.current_heat_participants: list[str] = []  # Participants in current heat (for stats)
-        self.is_finals = False
-        self.advancers_per_heat = 2  # Top N from each heat advance
-        self.max_per_heat = 11  # Max beyblades per heat
-
-        # Preliminary round state (for large tournaments >54 movies)
-        self.preliminary_groups: list[list[str]] = []  # Groups of movies for preliminary battles
-        self.preliminary_winning_movies: list[str] = []  # Movies from the winning group
-        self.is_preliminary = False  # True when running preliminary rounds
-        self.preliminary_max_size = 54  # Max movies per preliminary group
-
-        # Persistent movie data (survives across heats)
-        self.movie_abilities: dict[str, tuple] = {}  # name -> (ability_key, color)
-        self.zombie_used: set[str] = set()  # Track which movies have used zombie (persists across heats)
-        self.swamp_thing_used: set[str] = set()  # Track which movies have used swamp thing (persists across heats)
-        self.andy_respawn_used: set[str] = set()  # Track which movies have used Andy Dufresne respawn
-
-        # Portal state: [{'x': float, 'y': float, 'partner_idx': int}]
-        self.portals: list[dict] = []
-        self.portal_cooldown = 0  # Cooldown between portal uses
-
-        # Countdown state
-        self.countdown_timer = 0
-        self.countdown_active = False
-        self.countdown_last_num = 0  # Track which number was last shown for sound
-
-        # Fireballs list: [{'x', 'y', 'vx', 'vy', 'owner_name', 'color'}]
-        self.fireballs = []
-
-        # Ice projectiles list: [{'x', 'y', 'vx', 'vy', 'owner_name', 'color', 'lifetime'}]
-        self.ice_projectiles = []
-
-        # Ice trails list: [{'x', 'y', 'lifetime', 'color'}]
-        self.ice_trails = []
-
-        # Grenades list: [{'x', 'y', 'target_x', 'target_y', 'progress', 'owner_name', 'color'}]
-        # progress 0-1 represents flight, 1 = landed/explode
-        self.grenades = []
-
-        # Kamehameha beams list: [{'start_x', 'start_y', 'angle', 'length', 'width', 'lifetime', 'owner_name', 'color'}]
-        self.kamehameha_beams = []
-
-        # Water waves list: [{'x', 'y', 'angle', 'width', 'progress', 'owner_name'}]
-        self.water_waves = []
-
-        # Obelisk bumpers spawned by The Obelisk ability
-        self.obelisk_bumpers = []
-
-        # Kevin McAllister traps: [{'x', 'y', 'type', 'owner_name', 'lifetime'}]
-        self.traps = []
-
-        # John Wick bullets: [{'x', 'y', 'vx', 'vy', 'owner_name', 'lifetime'}]
-        self.bullets = []
-
-        # Interstellar black holes: [{'x', 'y', 'owner_name'}]
-        self.black_holes = []
-
-        # Neo heat reset tracking
-        self.heat_start_frame = 0
-        self.current_frame = 0
-        self.neo_reset_used_this_heat = False
-        self.neo_reset_countdown = 0  # Frames to show reset message
-        self.neo_reset_name = ""  # Name of Neo who triggered reset
-
-        # Once-per-game ability tracking
-        self.barry_lyndon_used = set()
-        self.oppenheimer_used = set()
-
-        # Transition state
-        self.pending_next_heat = 0
-        self.pending_is_finals = False
-        self.pending_start_main_tournament = False
-
         self.running = True
 
     def start_battle(self, movie_list: list):
         """Initialize a new tournament with the given movie list."""
-        # Deduplicate movie list (preserve order, keep first occurrence)
-        # Case-insensitive and whitespace-tolerant
-        seen = set()
-        unique_movies = []
-        for movie in movie_list:
-            normalized = movie.strip().lower()
-            if normalized not in seen:
-                seen.add(normalized)
-                unique_movies.append(movie)
-        movie_list = unique_movies
-
-        self.eliminated.clear()
-        self.all_eliminated.clear()
-        self.effects.clear()
-        self.winner = None
-        self.round_number = 1
-        self.ability_win_recorded = False  # Reset for new tournament
-        self.games_entered_recorded = set()  # Track abilities credited with games_entered this tournament
-        self.heat_winners.clear()
-        self.current_heat = 0
-        self.is_finals = False
-        self.movie_abilities.clear()  # Fresh abilities for new tournament
-        self.zombie_used.clear()  # Fresh zombie uses for new tournament
-        self.swamp_thing_used.clear()  # Fresh swamp thing uses for new tournament
-        self.portals.clear()
-        self.andy_respawn_used = set()  # Track Andy Dufresne respawns
-
-        # Shuffle movies for random placement
-        random.shuffle(movie_list)
-
-        # Check if we need a preliminary round (>54 movies)
-        # If so, DON'T assign abilities yet - wait until winning group is determined
-        if len(movie_list) > self.preliminary_max_size:
-            # Split movies into groups of max 54
-            self.preliminary_groups = []
-            for i in range(0, len(movie_list), self.preliminary_max_size):
-                group = movie_list[i:i + self.preliminary_max_size]
-                if group:
-                    self.preliminary_groups.append(group)
-
-            self.is_preliminary = True
-
-            # Create group names showing actual movie count in each group
-            group_names = [f"Group {i+1} ({len(g)} movies)" for i, g in enumerate(self.preliminary_groups)]
-
-            # All group beyblades get the SAME random ability (amadeus, prestige, copycat, deadpool banned)
-            banned_group_abilities = {'amadeus', 'the_prestige', 'copycat', 'deadpool'}
-            group_ability_pool = [k for k in ABILITIES.keys() if k not in banned_group_abilities]
-            shared_ability = random.choice(group_ability_pool)
-            for i, group_name in enumerate(group_names):
-                color = BEYBLADE_COLORS[i % len(BEYBLADE_COLORS)]
-                self.movie_abilities[group_name] = (shared_ability, color)
-
-            # Set up the preliminary battle with group beyblades
-            self.heats = [group_names]
-            self._start_heat(0)
-        else:
-            # Normal tournament flow - assign abilities now (no preliminary)
-            self.is_preliminary = False
-            self.preliminary_groups.clear()
-
-            # Assign abilities to movies
-            movie_list = self._assign_abilities_to_movies(movie_list)
-
-            # If few movies, just run single battle (no heats needed)
-            if len(movie_list) <= self.max_per_heat:
-                self.heats = [movie_list.copy()]  # Use copy to avoid reference issues
-                if self.web_mode:
-                    print(f"[Battle] Single heat with {len(movie_list)} movies")
-            else:
-                # Split into heats (slicing creates new lists)
-                self.heats = []
-                for i in range(0, len(movie_list), self.max_per_heat):
-                    heat = movie_list[i:i + self.max_per_heat]
-                    if heat:
-                        self.heats.append(heat)
-                if self.web_mode:
-                    print(f"[Battle] {len(self.heats)} heats created: {[len(h) for h in self.heats]} movies each")
-
-            # Start first heat
-            self._start_heat(0)
-
-        self.state = STATE_BATTLE
-        self.speed_multiplier = 1
+        super().start_battle(movie_list)
         self.battle_hud.current_speed = 1
 
-    def _assign_abilities_to_movies(self, movie_list: list) -> list:
-        """Assign abilities to movies. Each ability is used once before repeating.
-        Returns the updated movie list (with prestige duplicates added)."""
-        ability_keys = list(ABILITIES.keys())
-        ability_pool = []
-
-        # Build pool: each ability appears once per "round", shuffle each round
-        # This ensures each ability is used once before any repeats
-        num_rounds = (len(movie_list) // len(ability_keys)) + 2  # Extra rounds for prestige duplicates
-        for _ in range(num_rounds):
-            round_abilities = ability_keys.copy()
-            random.shuffle(round_abilities)
-            ability_pool.extend(round_abilities)
-
-        pool_index = 0
-        prestige_movies = []
-
-        for movie in movie_list:
-            ability_key = ability_pool[pool_index]
-            pool_index += 1
-
-            if ability_key == 'the_prestige':
-                prestige_movies.append(movie)
-                # Store ability for both copies
-                color = BEYBLADE_COLORS[len(self.movie_abilities) % len(BEYBLADE_COLORS)]
-                self.movie_abilities[movie] = (ability_key, color)
-                self.movie_abilities[f"{movie} (Double)"] = (ability_key, color)
-            else:
-                color = BEYBLADE_COLORS[len(self.movie_abilities) % len(BEYBLADE_COLORS)]
-                self.movie_abilities[movie] = (ability_key, color)
-
-        # Add prestige duplicates to movie list
-        for movie in prestige_movies:
-            movie_list.append(f"{movie} (Double)")
-
-        # Shuffle to mix in prestige duplicates
-        random.shuffle(movie_list)
-
-        return movie_list
-
-    def _start_heat(self, heat_index: int, is_neo_reset: bool = False):
-        """Start a specific heat battle."""
-        self.current_heat = heat_index
-        self.round_number = 1
-        self.beyblades.clear()
-        self.effects.clear()
-        self.fireballs.clear()
-        self.ice_projectiles.clear()
-        self.ice_trails.clear()
-        self.grenades.clear()
-        self.kamehameha_beams.clear()
-        self.water_waves.clear()
-        self.portals.clear()
-        self.portal_cooldown = 0
-        self.obelisk_bumpers.clear()
-        self.traps.clear()
-        self.bullets.clear()
-        self.black_holes.clear()
-        self.heat_start_frame = self.current_frame
-
-        # Only reset Neo flag if this is a normal heat start, not a Neo reset
-        if not is_neo_reset:
-            self.neo_reset_used_this_heat = False
-
-        if self.is_finals:
-            movies = self.heat_winners
-        else:
-            movies = self.heats[heat_index]
-
-        # Use rectangle finals arena for the deciding battle (not for preliminary rounds)
-        is_final_battle = (self.is_finals or len(self.heats) == 1) and not self.is_preliminary
-        self.arena.set_finals_mode(is_final_battle)
-
-        # Use normal arena for all non-finals battles (including preliminary)
-        if not is_final_battle:
-            self.arena.set_preliminary_mode(False)
-
-        self._spawn_beyblades(movies)
-
-        # Track participants for this heat (for ability stats)
-        self.current_heat_participants = [b.name for b in self.beyblades if not b.is_clone and not getattr(b, 'barbie_is_fragment', False)]
-
-        # Start countdown (3 seconds at 60 FPS = 180 frames)
-        self.countdown_timer = 180
-        self.countdown_active = True
-        self.countdown_last_num = 4  # Start above 3 so first beep plays
-        self.effects.sound.play('countdown_beep')  # Play first beep immediately
-
-    def _spawn_beyblades(self, movie_list: list):
-        """Spawn beyblades with positions and tangential velocities."""
-        # Create a copy to shuffle for spawn positions without modifying original
-        # Defensive: deduplicate to prevent mystery duplicate spawns
-        seen = set()
-        movies_to_spawn = []
-        for movie in movie_list:
-            if movie not in seen:
-                seen.add(movie)
-                movies_to_spawn.append(movie)
-        random.shuffle(movies_to_spawn)
-        spawns = self.arena.get_spawn_positions(len(movies_to_spawn))
-
-        for i, (movie, spawn) in enumerate(zip(movies_to_spawn, spawns)):
-            x, y, vx, vy = spawn
-            beyblade = Beyblade(movie, x, y, i)
-            beyblade.vx = vx
-            beyblade.vy = vy
-
-            # Restore or store persistent data (ability and color)
-            if movie in self.movie_abilities:
-                # Returning movie - restore its ability and color
-                ability_key, color = self.movie_abilities[movie]
-                beyblade.ability = ability_key
-                if ability_key:
-                    beyblade.ability_data = ABILITIES[ability_key].copy()
-                    # Reapply size modifiers
-                    if ability_key == 'giant':
-                        beyblade.radius = int(beyblade.base_radius * 1.4)
-                    elif ability_key == 'tiny':
-                        beyblade.radius = int(beyblade.base_radius * 0.7)
-                beyblade.color = color
-            else:
-                # New movie - store its generated ability and color
-                self.movie_abilities[movie] = (beyblade.ability, beyblade.color)
-
-            # Initialize ability timers
-            if beyblade.ability == 'timebomb':
-                beyblade.timebomb_timer = 1200  # 20 seconds
-            if beyblade.ability == 'earthquake':
-                beyblade.earthquake_timer = 900  # 15 seconds
-            if beyblade.ability == 'lightning_storm':
-                beyblade.lightning_timer = 600  # 10 seconds
-            if beyblade.ability == 'doomsday':
-                beyblade.doomsday_timer = 1800  # 30 seconds
-
-            # Zoro: starts going the opposite direction (counterclockwise, lost as usual)
-            if beyblade.ability == 'zoro':
-                beyblade.vx = -beyblade.vx
-                beyblade.vy = -beyblade.vy
-
-            # Truman: spawn in center of arena
-            if beyblade.ability == 'truman':
-                beyblade.x = self.arena.center_x
-                beyblade.y = self.arena.center_y
-                beyblade.vx = random.uniform(-2, 2)
-                beyblade.vy = random.uniform(-2, 2)
-
-            # Interstellar: record spawn position for black hole
-            if beyblade.ability == 'interstellar':
-                beyblade.interstellar_spawn_x = beyblade.x
-                beyblade.interstellar_spawn_y = beyblade.y
-                self.black_holes.append({
-                    'x': beyblade.x,
-                    'y': beyblade.y,
-                    'owner_name': beyblade.name
-                })
+    def _show_heat_transition(self, advancers: list, heat_number: int, total_heats: int, **kwargs):
+        self.heat_transition_screen.set_advancers(advancers, heat_number, total_heats, **kwargs)
+        self.sim_auto_advance_timer = 60  # 1 second at 60 FPS
 
-            # Neo: record spawn frame for reset check
-            if beyblade.ability == 'neo':
-                beyblade.neo_spawn_frame = self.current_frame
-
-            # Marty McFly: record spawn position for teleport ability
-            if beyblade.ability == 'marty_mcfly':
-                beyblade.marty_mcfly_spawn_x = beyblade.x
-                beyblade.marty_mcfly_spawn_y = beyblade.y
-                beyblade.marty_mcfly_used = False
-
-            self.beyblades.append(beyblade)
-
-            # Naruto: create 5 clones, each with 1/6 HP (including original = 6 total)
-            if beyblade.ability == 'naruto' and not beyblade.naruto_cloned:
-                beyblade.naruto_cloned = True
-                # Split HP into sixths
-                sixth_hp = beyblade.max_stamina / 6
-                beyblade.stamina = sixth_hp
-                beyblade.max_stamina = sixth_hp
-
-                # Create 5 clones - spawn in distinct positions to avoid immediate collision
-                clone_offsets = [
-                    (80, 0),    # Clone 1: right
-                    (-80, 0),   # Clone 2: left
-                    (40, 70),   # Clone 3: down-right
-                    (-40, 70),  # Clone 4: down-left
-                    (0, -80),   # Clone 5: up
-                ]
-                for clone_num in range(5):
-                    offset_x, offset_y = clone_offsets[clone_num]
-                    clone = Beyblade(f"{movie} (Clone {clone_num + 1})", x, y, i)
-                    clone.vx = vx + random.uniform(-2, 2)
-                    clone.vy = vy + random.uniform(-2, 2)
-                    clone.x = x + offset_x + random.uniform(-10, 10)
-                    clone.y = y + offset_y + random.uniform(-10, 10)
-                    clone.ability = 'naruto'
-                    clone.ability_data = beyblade.ability_data.copy() if beyblade.ability_data else None
-                    clone.color = beyblade.color
-                    clone.stamina = sixth_hp
-                    clone.max_stamina = sixth_hp
-                    clone.is_clone = True
-                    clone.original_name = movie
-                    clone.naruto_cloned = True  # Prevent clones from cloning
-                    self.beyblades.append(clone)
-
-        # Create avatars for this batch of beyblades
-        self.avatar_manager.create_avatars(self.beyblades, self.arena)
-
-        # Post-spawn ability setup
-        from .arena import ObeliskBumper
-        for beyblade in self.beyblades:
-            # Kill Bill: select a random target for this heat
-            if beyblade.ability == 'kill_bill':
-                targets = [b for b in self.beyblades if b != beyblade and b.name != beyblade.name]
-                if targets:
-                    beyblade.kill_bill_target = random.choice(targets).name
-                    self.effects.spawn_ability_notification(
-                        beyblade.name, f'TARGET: {beyblade.kill_bill_target[:12]}', ABILITIES['kill_bill']['color'], 'ability', 'Kill Bill'
-                    )
-
-            # The Obelisk: spawn a bumper at random arena position
-            if beyblade.ability == 'the_obelisk':
-                if self.arena.finals_mode:
-                    bx = random.uniform(self.arena.rect_left + 80, self.arena.rect_right - 80)
-                    by = random.uniform(self.arena.rect_top + 80, self.arena.rect_bottom - 80)
-                else:
-                    angle = random.uniform(0, 2 * math.pi)
-                    dist = random.uniform(50, self.arena.radius * 0.6)
-                    bx = self.arena.center_x + math.cos(angle) * dist
-                    by = self.arena.center_y + math.sin(angle) * dist
-                # Create 2001-style monolith obelisk
-                bumper = ObeliskBumper(int(bx), int(by), width=25, height=70)
-                self.obelisk_bumpers.append(bumper)
-                self.effects.spawn_ability_notification(beyblade.name, 'OBELISK RISES!', ABILITIES['the_obelisk']['color'], 'ability')
-
-            # American Psycho: initialize damage tracking
-            if beyblade.ability == 'american_psycho':
-                beyblade.american_psycho_timer = 1200  # 20 seconds
-                beyblade.american_psycho_stored_stamina = beyblade.stamina
-
-            # Amadeus: pick a rival for this heat
-            if beyblade.ability == 'amadeus':
-                targets = [b for b in self.beyblades if b != beyblade and b.name != beyblade.name]
-                if targets:
-                    beyblade.amadeus_rival = random.choice(targets).name
-                    self.effects.spawn_ability_notification(
-                        beyblade.name, f'RIVAL: {beyblade.amadeus_rival[:12]}', ABILITIES['amadeus']['color'], 'ability', 'Amadeus'
-                    )
-
-            # Terminator: pick a target for this heat
-            if beyblade.ability == 'terminator':
-                targets = [b for b in self.beyblades if b != beyblade and b.name != beyblade.name]
-                if targets:
-                    beyblade.terminator_target = random.choice(targets).name
-                    beyblade.terminator_no_hit_timer = 0
-                    self.effects.spawn_ability_notification(
-                        beyblade.name, f'TARGET: {beyblade.terminator_target[:12]}', ABILITIES['terminator']['color'], 'ability', 'Terminator'
-                    )
-
-            # Ferris Bueller: starts hidden, spawns 5 seconds late
-            if beyblade.ability == 'ferris_bueller' and beyblade.ferris_late_entry:
-                beyblade.alive = False
-                beyblade.x = -1000  # Off screen
-                beyblade.y = -1000
-                beyblade.ferris_timer = 300  # 5 seconds
+    def _show_victory(self, winner: str):
+        self.victory_screen.set_winner(winner)
+        self.sim_auto_advance_timer = 60  # 1 second at 60 FPS
 
     def _handle_resize(self, new_width, new_height):
         """Handle window resize - updates all layouts."""
@@ -563,30 +162,87 @@ class Game:
         self.person_wheel_result_screen.update_layout(new_width, new_height)
         if self.participant_select_screen:
             self.participant_select_screen.update_layout(new_width, new_height)
+        self.request_redraw()
+
+    def request_redraw(self):
+        """Repaint and re-send the next frame in full (resize, new web client)."""
+        self._presented_state = None
+
+    def _menu_screen(self):
+        """The current screen if it tracks dirty regions, else None (repainted every frame)."""
+        if self.state == STATE_INPUT:
+            return self.input_screen
+        if self.state == STATE_LEADERBOARD:
+            return self.leaderboard_screen
+        if self.state == STATE_DOCKET_SELECT:
+            return self.participant_select_screen
+        if self.state == STATE_DOCKET_RESULT:
+            return self.docket_result_screen
+        return None
 
     def inject_event(self, event_dict):
-        """Inject an event from external source (web client)."""
+        """Inject an event from external source (web client).
+
+        Mouse moves between two frames collapse into the latest position, so a
+        fast-moving pointer costs one lock and one wake-up per frame rather
+        than one per browser event.
+        """
+        now = time.perf_counter()
         with self._external_events_lock:
-            self.external_events.append(event_dict)
+            if event_dict['type'] == 'mousemove':
+                wake = self._pending_mouse_move is None
+                if wake:
+                    self._pending_mouse_move = [(event_dict['x'], event_dict['y']), now]
+                else:
+                    self._pending_mouse_move[0] = (event_dict['x'], event_dict['y'])
+                    self.input_moves_coalesced += 1
+            else:
+                if event_dict['type'] in ('mousedown', 'mouseup'):
+                    self._pending_mouse_move = None  # The click's own position is newer
+                self.external_events.append((now, event_dict))
+                wake = True
+            if wake:  # Unless the first move since the last frame already woke the loop
+                self._input_ready.set()
+
+    def input_stats(self) -> dict:
+        """Web input handled so far and how long it waited between inject_event and handle_events."""
+        return {
+            'events': self.input_events,
+            'moves_coalesced': self.input_moves_coalesced,
+            'latency_avg_ms': round(1000 * self.input_latency_total / max(1, self.input_events), 2),
+            'latency_max_ms': round(1000 * self.input_latency_max, 2),
+        }
 
     def handle_events(self):
         mouse_clicked = False
 
         # Check for window size changes every frame (works better with tiling WMs like i3)
-        current_size = self.screen.get_size()
-        if current_size[0] != self.window_width or current_size[1] != self.window_height:
-            self._handle_resize(current_size[0], current_size[1])
+        if not self.web_mode:
+            current_size = self.screen.get_size()
+            if current_size[0] != self.window_width or current_size[1] != self.window_height:
+                self._handle_resize(current_size[0], current_size[1])
 
         # Process external events from web clients (thread-safe)
         with self._external_events_lock:
-            events_to_process = self.external_events[:]
-            self.external_events.clear()
-        for ext in events_to_process:
+            self._input_ready.clear()  # Anything injected from here on wakes the next wait
+            events_to_process = self.external_events
+            self.external_events = []
+            mouse_move = self._pending_mouse_move
+            self._pending_mouse_move = None
+        if events_to_process or mouse_move:
+            self._last_input_ticks = pygame.time.get_ticks()
+        for _, ext in events_to_process:
             event = self._convert_external_event(ext)
             if event:
                 pygame.event.post(event)
+        if mouse_move:
+            # Made after any queued click (inject_event drops moves older than a click)
+            self._web_mouse_pos = mouse_move[0]
+            events_to_process.append((mouse_move[1], None))
 
         for event in pygame.event.get():
+            self._last_input_ticks = pygame.time.get_ticks()
+
             if event.type == pygame.QUIT:
                 self.running = False
 
@@ -596,6 +252,12 @@ class Game:
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 mouse_clicked = True
 
+            # Clicks, keys and scrolling can change anything on a menu screen
+            if event.type in (pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN, pygame.MOUSEWHEEL, TEXT_INSERT):
+                menu_screen = self._menu_screen()
+                if menu_screen:
+                    menu_screen.dirty.mark_all()
+
             if self.state == STATE_INPUT:
                 self.input_screen.handle_event(event)
 
@@ -617,20 +279,28 @@ class Game:
             if self.state == STATE_DOCKET_SELECT and self.participant_select_screen:
                 self.participant_select_screen.handle_event(event)
 
+        if events_to_process:
+            handled_at = time.perf_counter()
+            for injected_at, _ in events_to_process:
+                latency = handled_at - injected_at
+                self.input_latency_total += latency
+                self.input_latency_max = max(self.input_latency_max, latency)
+            self.input_events += len(events_to_process)
+
         return mouse_clicked
 
     def _convert_external_event(self, ext):
         """Convert external event dict to pygame event."""
         try:
             if ext['type'] == 'mousedown':
+                self._web_mouse_pos = (ext['x'], ext['y'])
                 return pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=ext.get('button', 1), pos=(ext['x'], ext['y']))
             elif ext['type'] == 'mouseup':
-                return pygame.event.Event(pygame.MOUSEBUTTONUP, button=ext.get('button', 1), pos=(ext['x'], ext['y']))
-            elif ext['type'] == 'mousemove':
-                # Pygame doesn't have a move event, but we track position via get_pos()
-                # We'll handle this differently - set a stored position
                 self._web_mouse_pos = (ext['x'], ext['y'])
-                return None
+                return pygame.event.Event(pygame.MOUSEBUTTONUP, button=ext.get('button', 1), pos=(ext['x'], ext['y']))
+            elif ext['type'] == 'text':
+                # A whole paste: the focused text box inserts it in one edit
+                return pygame.event.Event(TEXT_INSERT, text=ext.get('text', ''))
             elif ext['type'] == 'keydown':
                 key = ext.get('key', 0)
                 mod = ext.get('mod', 0)
@@ -742,29 +412,7 @@ class Game:
 
             # Handle countdown
             if self.countdown_active:
-                self.countdown_timer -= 1
-                # Update avatars during countdown (for launch animation)
-                self.avatar_manager.update()
-
-                # Determine current number and play sound on change
-                if self.countdown_timer > 120:
-                    current_num = 3
-                elif self.countdown_timer > 60:
-                    current_num = 2
-                elif self.countdown_timer > 0:
-                    current_num = 1
-                else:
-                    current_num = 0  # GO!
-
-                if current_num != self.countdown_last_num:
-                    self.countdown_last_num = current_num
-                    if current_num == 0:
-                        self.effects.sound.play('countdown_go')
-                    elif current_num > 0:
-                        self.effects.sound.play('countdown_beep')
-
-                if self.countdown_timer <= 0:
-                    self.countdown_active = False
+                self.update_countdown()
             else:
                 # Update physics multiple times for speed multiplier
                 for _ in range(self.speed_multiplier):
@@ -959,1204 +607,6 @@ class Game:
                     self.person_wheel_result_screen.movie
                 )
 
-    def update_battle(self):
-        # Increment frame counter
-        self.current_frame += 1
-
-        # Update arena (bumper animations)
-        self.arena.update()
-
-        # Interstellar: black holes pull ALL beyblades on the map (Batman immune)
-        for black_hole in self.black_holes:
-            for beyblade in self.beyblades:
-                if beyblade.alive and beyblade.name != black_hole['owner_name'] and beyblade.ability != 'batman':
-                    dx = black_hole['x'] - beyblade.x
-                    dy = black_hole['y'] - beyblade.y
-                    dist = math.sqrt(dx * dx + dy * dy)
-                    if dist > 5:  # Avoid division issues when very close
-                        # Constant pull strength across entire map, weaker but always active
-                        pull_strength = 0.08
-                        beyblade.vx += (dx / dist) * pull_strength
-                        beyblade.vy += (dy / dist) * pull_strength
-
-        # Deadpool: regenerate health over time
-        for beyblade in self.beyblades:
-            if beyblade.alive and beyblade.ability == 'deadpool':
-                regen_rate = 0.05  # HP per frame
-                beyblade.stamina = min(beyblade.max_stamina, beyblade.stamina + regen_rate)
-
-        # Update Amadeus rival status (needed for edge bounce check)
-        alive_names = {b.name for b in self.beyblades if b.alive}
-        for beyblade in self.beyblades:
-            if beyblade.ability == 'amadeus' and beyblade.amadeus_rival:
-                beyblade.amadeus_rival_alive = beyblade.amadeus_rival in alive_names
-
-        # Update all beyblades
-        for beyblade in self.beyblades:
-            beyblade.update()
-            if beyblade.alive:
-                # Marty McFly: teleport back to spawn when within 10% of edge (once per heat)
-                if beyblade.ability == 'marty_mcfly' and not beyblade.marty_mcfly_used:
-                    near_edge = False
-                    if self.arena.finals_mode:
-                        # Rectangle arena: check distance from closing left/right edges
-                        arena_width = self.arena.current_rect_right - self.arena.current_rect_left
-                        edge_threshold = arena_width * 0.1
-                        if (beyblade.x < self.arena.current_rect_left + edge_threshold or
-                            beyblade.x > self.arena.current_rect_right - edge_threshold):
-                            near_edge = True
-                    else:
-                        # Circular arena: check distance from center vs radius
-                        dx = beyblade.x - self.arena.center_x
-                        dy = beyblade.y - self.arena.center_y
-                        dist_from_center = math.sqrt(dx**2 + dy**2)
-                        if dist_from_center > self.arena.radius * 0.9:
-                            near_edge = True
-
-                    if near_edge:
-                        # Teleport back to spawn position
-                        beyblade.x = beyblade.marty_mcfly_spawn_x
-                        beyblade.y = beyblade.marty_mcfly_spawn_y
-                        beyblade.vx = 0
-                        beyblade.vy = 0
-                        beyblade.marty_mcfly_used = True
-                        self.effects.spawn_ability_notification(
-                            beyblade.name, 'BACK IN TIME!', ABILITIES['marty_mcfly']['color'], 'ability', 'Marty McFly'
-                        )
-                        self.effects.sound.play('teleport')
-
-                bumper_hit = self.arena.apply_boundary(beyblade)
-                if bumper_hit:
-                    # Spawn sparks and play sound for bumper hit
-                    self.effects.spawn_collision_sparks(beyblade.x, beyblade.y, 1.5)
-                    self.effects.sound.play('bumper')
-
-        # Check for collisions
-        alive_beyblades = [b for b in self.beyblades if b.alive]
-        for i, b1 in enumerate(alive_beyblades):
-            for b2 in alive_beyblades[i+1:]:
-                if check_collision(b1, b2):
-                    collision_x, collision_y, intensity, triggers = resolve_collision(b1, b2)
-                    if intensity > 0.5:
-                        self.effects.spawn_collision_sparks(collision_x, collision_y, intensity)
-                        # Play hit sound
-                        if intensity > 5:
-                            self.effects.sound.play('big_hit')
-                        else:
-                            self.effects.sound.play('hit')
-                    # Process ability triggers with appropriate sounds
-                    for trigger in triggers:
-                        if len(trigger) == 4:
-                            name, text, color, ability_name = trigger
-                        else:
-                            name, text, color = trigger
-                            ability_name = None
-                        sound = self._get_ability_sound(text)
-                        self.effects.spawn_ability_notification(name, text, color, sound, ability_name)
-
-        # Handle parasite damage sharing
-        for beyblade in self.beyblades:
-            if beyblade.alive and beyblade.parasite_target:
-                # Find the target and share damage (both take stamina drain)
-                target = next((b for b in self.beyblades if b.name == beyblade.parasite_target and b.alive), None)
-                if target:
-                    # Slowly drain both (parasitic relationship hurts both)
-                    drain = 0.02
-                    beyblade.stamina -= drain
-                    target.stamina -= drain
-                    # If either dies, break the link
-                    if beyblade.stamina <= 0 or target.stamina <= 0:
-                        beyblade.parasite_target = None
-                        target.parasite_host = None
-                else:
-                    # Target is dead, clear the link
-                    beyblade.parasite_target = None
-
-        # Check for explosive triggers
-        for beyblade in self.beyblades:
-            if beyblade.explosive_triggered:
-                beyblade.explosive_triggered = False
-                # Push all alive beyblades away
-                for other in self.beyblades:
-                    if other.alive and other != beyblade:
-                        dx = other.x - beyblade.x
-                        dy = other.y - beyblade.y
-                        dist = math.sqrt(dx**2 + dy**2)
-                        if dist < 300 and dist > 0:  # Explosion radius
-                            force = 15 * (1 - dist / 300)  # Stronger when closer
-                            apply_knockback(other, beyblade, dx, dy, force)
-                # Visual and sound
-                self.effects.spawn_collision_sparks(beyblade.x, beyblade.y, 5.0)
-                self.effects.spawn_ability_notification(beyblade.name, 'EXPLOSION!', ABILITIES['explosive']['color'], 'burst')
-
-        # Handle fireball ability - avatars shoot fireballs toward arena (continues after death)
-        for beyblade in self.beyblades:
-            if beyblade.ability == 'fireball':
-                avatar = self.avatar_manager.avatars.get(beyblade.name)
-                if avatar and avatar.state not in (AvatarState.ELIMINATED, AvatarState.LAUNCHING):
-                    avatar.fireball_cooldown -= 1
-                    if avatar.fireball_cooldown <= 0:
-                        # Spawn a fireball from avatar toward a random point in arena
-                        dx = self.arena.center_x - avatar.x
-                        dy = self.arena.center_y - avatar.y
-                        base_angle = math.atan2(dy, dx)
-                        # Add randomness to direction
-                        shoot_angle = base_angle + random.uniform(-0.6, 0.6)
-                        speed = 8
-                        self.fireballs.append({
-                            'x': avatar.x,
-                            'y': avatar.y,
-                            'vx': math.cos(shoot_angle) * speed,
-                            'vy': math.sin(shoot_angle) * speed,
-                            'owner_name': beyblade.name,
-                            'color': beyblade.color,
-                            'lifetime': 180,  # 3 seconds max
-                        })
-                        avatar.fireball_cooldown = 90  # 1.5 second cooldown
-
-        # Update fireballs - movement and collision
-        fireballs_to_remove = []
-        for fireball in self.fireballs:
-            fireball['x'] += fireball['vx']
-            fireball['y'] += fireball['vy']
-            fireball['lifetime'] -= 1
-
-            # Check collision with beyblades
-            for beyblade in self.beyblades:
-                if beyblade.alive and beyblade.name != fireball['owner_name']:
-                    dx = beyblade.x - fireball['x']
-                    dy = beyblade.y - fireball['y']
-                    dist = math.sqrt(dx**2 + dy**2)
-                    if dist < beyblade.radius + 8:  # 8 is fireball radius
-                        # Marty Mauser: reflect projectiles back
-                        if beyblade.ability == 'marty_mauser':
-                            fireball['vx'] = -fireball['vx']
-                            fireball['vy'] = -fireball['vy']
-                            fireball['owner_name'] = beyblade.name
-                            fireball['lifetime'] = 180
-                            self.effects.spawn_collision_sparks(fireball['x'], fireball['y'], 0.5)
-                            self.effects.spawn_ability_notification(beyblade.name, 'REFLECT!', ABILITIES['marty_mauser']['color'], 'ability', 'Marty Mauser')
-                            break
-                        # Hit! Apply knockback
-                        owner = next((b for b in self.beyblades if b.name == fireball['owner_name']), None)
-                        if owner:
-                            apply_knockback(beyblade, owner, dx, dy, 10)
-                        self.effects.spawn_collision_sparks(fireball['x'], fireball['y'], 1.5)
-                        self.effects.sound.play('hit')
-                        fireballs_to_remove.append(fireball)
-                        break
-
-            # Remove if expired or out of arena
-            if fireball['lifetime'] <= 0:
-                fireballs_to_remove.append(fireball)
-
-        for fb in fireballs_to_remove:
-            if fb in self.fireballs:
-                self.fireballs.remove(fb)
-
-        # Handle ice ability - avatars shoot ice toward arena (continues after death)
-        for beyblade in self.beyblades:
-            if beyblade.ability == 'ice':
-                avatar = self.avatar_manager.avatars.get(beyblade.name)
-                if avatar and avatar.state not in (AvatarState.ELIMINATED, AvatarState.LAUNCHING):
-                    avatar.ice_cooldown -= 1
-                    if avatar.ice_cooldown <= 0:
-                        # Spawn an ice projectile from avatar toward a random point in arena
-                        dx = self.arena.center_x - avatar.x
-                        dy = self.arena.center_y - avatar.y
-                        base_angle = math.atan2(dy, dx)
-                        # Add randomness to direction
-                        shoot_angle = base_angle + random.uniform(-0.6, 0.6)
-                        speed = 6  # Slower than fireball
-                        self.ice_projectiles.append({
-                            'x': avatar.x,
-                            'y': avatar.y,
-                            'vx': math.cos(shoot_angle) * speed,
-                            'vy': math.sin(shoot_angle) * speed,
-                            'owner_name': beyblade.name,
-                            'color': (150, 220, 255),
-                            'lifetime': 240,  # 4 seconds max
-                        })
-                        avatar.ice_cooldown = 120  # 2 second cooldown
-
-        # Update ice projectiles - movement, trails, and collision
-        ice_to_remove = []
-        for ice in self.ice_projectiles:
-            ice['x'] += ice['vx']
-            ice['y'] += ice['vy']
-            ice['lifetime'] -= 1
-
-            # Leave ice trail every few frames
-            if ice['lifetime'] % 3 == 0:
-                self.ice_trails.append({
-                    'x': ice['x'],
-                    'y': ice['y'],
-                    'lifetime': 600,  # 10 seconds
-                    'color': (150, 220, 255),
-                })
-
-            # Check collision with beyblades
-            for beyblade in self.beyblades:
-                if beyblade.alive and beyblade.name != ice['owner_name']:
-                    dx = beyblade.x - ice['x']
-                    dy = beyblade.y - ice['y']
-                    dist = math.sqrt(dx**2 + dy**2)
-                    if dist < beyblade.radius + 10:  # 10 is ice radius
-                        # Marty Mauser: reflect projectiles back
-                        if beyblade.ability == 'marty_mauser':
-                            ice['vx'] = -ice['vx']
-                            ice['vy'] = -ice['vy']
-                            ice['owner_name'] = beyblade.name
-                            ice['lifetime'] = 240
-                            self.effects.spawn_collision_sparks(ice['x'], ice['y'], 0.5)
-                            self.effects.spawn_ability_notification(beyblade.name, 'REFLECT!', ABILITIES['marty_mauser']['color'], 'ability', 'Marty Mauser')
-                            break
-                        # Hit! Freeze the beyblade
-                        owner = next((b for b in self.beyblades if b.name == ice['owner_name']), None)
-                        if owner and not is_immune_to_damage(beyblade, owner):
-                            beyblade.ice_frozen_timer = 60  # 1 second freeze
-                            beyblade.vx = 0
-                            beyblade.vy = 0
-                            self.effects.spawn_ability_notification(beyblade.name, 'FROZEN!', ABILITIES['ice']['color'], 'ability', 'Ice')
-                        self.effects.spawn_collision_sparks(ice['x'], ice['y'], 1.5)
-                        ice_to_remove.append(ice)
-                        break
-
-            # Remove if expired
-            if ice['lifetime'] <= 0:
-                ice_to_remove.append(ice)
-
-        for ice in ice_to_remove:
-            if ice in self.ice_projectiles:
-                self.ice_projectiles.remove(ice)
-
-        # Handle ice freeze (prevent movement during freeze)
-        for beyblade in self.beyblades:
-            if beyblade.ice_frozen_timer > 0:
-                beyblade.ice_frozen_timer -= 1
-                beyblade.vx = 0
-                beyblade.vy = 0
-
-        # Handle beyblades slipping on ice trails (Batman immune)
-        for beyblade in self.beyblades:
-            if beyblade.alive and beyblade.ice_frozen_timer <= 0 and beyblade.ability != 'batman':
-                for trail in self.ice_trails:
-                    dx = beyblade.x - trail['x']
-                    dy = beyblade.y - trail['y']
-                    dist = math.sqrt(dx**2 + dy**2)
-                    if dist < beyblade.radius + 8:  # Close enough to ice
-                        # Slip effect: slight angle change and speed boost
-                        if beyblade.speed > 0.5:
-                            # Rotate velocity by small random angle
-                            angle_change = random.uniform(-0.15, 0.15)
-                            cos_a = math.cos(angle_change)
-                            sin_a = math.sin(angle_change)
-                            new_vx = beyblade.vx * cos_a - beyblade.vy * sin_a
-                            new_vy = beyblade.vx * sin_a + beyblade.vy * cos_a
-                            beyblade.vx = new_vx * 1.03  # Small speed boost
-                            beyblade.vy = new_vy * 1.03
-                        break  # Only slip on one trail per frame
-
-        # Update ice trail lifetimes
-        trails_to_remove = []
-        for trail in self.ice_trails:
-            trail['lifetime'] -= 1
-            if trail['lifetime'] <= 0:
-                trails_to_remove.append(trail)
-        for trail in trails_to_remove:
-            self.ice_trails.remove(trail)
-
-        # Handle grenade ability - avatars throw grenades toward center of arena
-        for beyblade in self.beyblades:
-            if beyblade.ability == 'grenade':  # Continues after death
-                avatar = self.avatar_manager.avatars.get(beyblade.name)
-                if avatar and avatar.state not in (AvatarState.ELIMINATED, AvatarState.LAUNCHING):
-                    avatar.grenade_cooldown -= 1
-                    if avatar.grenade_cooldown <= 0:
-                        # Pick random target near center of arena (inner ~35% radius)
-                        if self.arena.finals_mode:
-                            # For rectangle, target the middle third
-                            rect_width = self.arena.rect_right - self.arena.rect_left
-                            rect_height = self.arena.rect_bottom - self.arena.rect_top
-                            center_x = (self.arena.rect_left + self.arena.rect_right) / 2
-                            center_y = (self.arena.rect_top + self.arena.rect_bottom) / 2
-                            target_x = center_x + random.uniform(-rect_width * 0.2, rect_width * 0.2)
-                            target_y = center_y + random.uniform(-rect_height * 0.2, rect_height * 0.2)
-                        else:
-                            angle = random.uniform(0, 2 * math.pi)
-                            dist = random.uniform(0, self.arena.radius * 0.35)
-                            target_x = self.arena.center_x + math.cos(angle) * dist
-                            target_y = self.arena.center_y + math.sin(angle) * dist
-
-                        self.grenades.append({
-                            'start_x': avatar.x,
-                            'start_y': avatar.y,
-                            'target_x': target_x,
-                            'target_y': target_y,
-                            'progress': 0.0,
-                            'owner_name': beyblade.name,
-                            'color': beyblade.color,
-                        })
-                        avatar.grenade_cooldown = 180  # 3 second cooldown
-
-        # Update grenades - flight and explosion
-        grenades_to_remove = []
-        for grenade in self.grenades:
-            grenade['progress'] += 0.02  # Takes ~50 frames (less than 1 second) to land
-
-            if grenade['progress'] >= 1.0:
-                # Grenade landed - EXPLODE!
-                tx, ty = grenade['target_x'], grenade['target_y']
-                explosion_radius = 100
-                owner = next((b for b in self.beyblades if b.name == grenade['owner_name']), None)
-
-                for beyblade in self.beyblades:
-                    if beyblade.alive and owner:
-                        dx = beyblade.x - tx
-                        dy = beyblade.y - ty
-                        dist = math.sqrt(dx**2 + dy**2)
-                        if dist < explosion_radius:
-                            # Strong knockback and significant damage
-                            damage_mult = 1 - (dist / explosion_radius)  # 100% at center, 0% at edge
-                            apply_knockback(beyblade, owner, dx, dy, 15 * damage_mult)
-                            deal_damage(beyblade, owner, 20 * damage_mult)
-
-                self.effects.spawn_collision_sparks(tx, ty, 5.0)
-                self.effects.sound.play('big_hit')
-                grenades_to_remove.append(grenade)
-
-        for grenade in grenades_to_remove:
-            self.grenades.remove(grenade)
-
-        # Handle kamehameha ability - avatars charge and fire beams (continues after death)
-        for beyblade in self.beyblades:
-            if beyblade.ability == 'kamehameha':
-                avatar = self.avatar_manager.avatars.get(beyblade.name)
-                if avatar and avatar.state not in (AvatarState.ELIMINATED, AvatarState.LAUNCHING):
-                    if avatar.kamehameha_charging:
-                        avatar.kamehameha_charge_timer -= 1
-                        if avatar.kamehameha_charge_timer <= 0:
-                            # FIRE THE BEAM!
-                            # Calculate beam direction toward arena
-                            dx = self.arena.center_x - avatar.x
-                            dy = self.arena.center_y - avatar.y
-                            base_angle = math.atan2(dy, dx)
-                            # Add some randomness to the angle
-                            beam_angle = base_angle + random.uniform(-0.5, 0.5)
-
-                            self.kamehameha_beams.append({
-                                'start_x': avatar.x,
-                                'start_y': avatar.y,
-                                'angle': beam_angle,
-                                'length': 0,
-                                'max_length': 900,
-                                'width': 30,
-                                'lifetime': 45,  # Beam lasts 0.75 seconds
-                                'owner_name': beyblade.name,
-                                'color': (100, 180, 255),
-                                'hit_targets': set(),  # Track who we've hit
-                            })
-
-                            avatar.kamehameha_charging = False
-                            avatar.kamehameha_cooldown = random.randint(600, 900)  # 10-15 seconds
-                            self.effects.spawn_ability_notification(beyblade.name, 'KAMEHAMEHA!', ABILITIES['kamehameha']['color'], 'burst')
-                    else:
-                        avatar.kamehameha_cooldown -= 1
-                        if avatar.kamehameha_cooldown <= 0:
-                            # Start charging
-                            avatar.kamehameha_charging = True
-                            avatar.kamehameha_charge_timer = 90  # 1.5 second charge
-
-        # Update kamehameha beams
-        beams_to_remove = []
-        for beam in self.kamehameha_beams:
-            # Extend beam length
-            if beam['length'] < beam['max_length']:
-                beam['length'] += 40  # Fast beam extension
-
-            beam['lifetime'] -= 1
-
-            # Check collision with beyblades along the beam
-            start_x, start_y = beam['start_x'], beam['start_y']
-            angle = beam['angle']
-            length = beam['length']
-
-            for beyblade in self.beyblades:
-                if beyblade.alive and beyblade.name != beam['owner_name'] and beyblade.name not in beam['hit_targets']:
-                    # Check if beyblade is within beam rectangle
-                    # Project beyblade position onto beam axis
-                    dx = beyblade.x - start_x
-                    dy = beyblade.y - start_y
-
-                    # Distance along beam
-                    along_beam = dx * math.cos(angle) + dy * math.sin(angle)
-                    # Distance perpendicular to beam
-                    perp_beam = abs(-dx * math.sin(angle) + dy * math.cos(angle))
-
-                    if 0 < along_beam < length and perp_beam < beam['width'] / 2 + beyblade.radius:
-                        # HIT! Apply hitstun then knockback
-                        beam['hit_targets'].add(beyblade.name)
-                        owner = next((b for b in self.beyblades if b.name == beam['owner_name']), None)
-                        if owner and not is_immune_to_damage(beyblade, owner):
-                            beyblade.hitstun_timer = 15  # 0.25 second hitstun
-                            beyblade.vx = 0
-                            beyblade.vy = 0
-                            # Store knockback to apply after hitstun
-                            knockback_force = 18
-                            beyblade.hitstun_knockback = (
-                                math.cos(angle) * knockback_force,
-                                math.sin(angle) * knockback_force
-                            )
-                        self.effects.spawn_collision_sparks(beyblade.x, beyblade.y, 2.5)
-
-            if beam['lifetime'] <= 0:
-                beams_to_remove.append(beam)
-
-        for beam in beams_to_remove:
-            self.kamehameha_beams.remove(beam)
-
-        # Handle hitstun (freeze then knockback)
-        for beyblade in self.beyblades:
-            if beyblade.hitstun_timer > 0:
-                beyblade.hitstun_timer -= 1
-                beyblade.vx = 0
-                beyblade.vy = 0
-                if beyblade.hitstun_timer == 0:
-                    # Apply the stored knockback
-                    beyblade.vx, beyblade.vy = beyblade.hitstun_knockback
-                    beyblade.hitstun_knockback = (0, 0)
-
-        # Handle water ability - avatars create waves that push everything
-        for beyblade in self.beyblades:
-            if beyblade.ability == 'water':  # Continues after death
-                avatar = self.avatar_manager.avatars.get(beyblade.name)
-                if avatar and avatar.state not in (AvatarState.ELIMINATED, AvatarState.LAUNCHING):
-                    avatar.water_cooldown -= 1
-                    if avatar.water_cooldown <= 0:
-                        # Spawn a wave from avatar toward arena
-                        dx = self.arena.center_x - avatar.x
-                        dy = self.arena.center_y - avatar.y
-                        base_angle = math.atan2(dy, dx)
-                        # Add randomness to direction
-                        wave_angle = base_angle + random.uniform(-0.4, 0.4)
-
-                        self.water_waves.append({
-                            'start_x': avatar.x,
-                            'start_y': avatar.y,
-                            'angle': wave_angle,
-                            'progress': 0.0,
-                            'width': 300,
-                            'owner_name': beyblade.name,
-                            'color': (50, 150, 255),
-                            'hit_targets': set(),
-                        })
-                        avatar.water_cooldown = random.randint(600, 900)  # 10-15 seconds
-                        self.effects.spawn_ability_notification(beyblade.name, 'WAVE!', ABILITIES['water']['color'], 'ability', 'Water')
-
-        # Update water waves
-        waves_to_remove = []
-        for wave in self.water_waves:
-            wave['progress'] += 0.025  # Wave moves across arena
-
-            # Calculate wave front position
-            max_dist = 700  # How far wave travels
-            current_dist = wave['progress'] * max_dist
-            wave_x = wave['start_x'] + math.cos(wave['angle']) * current_dist
-            wave_y = wave['start_y'] + math.sin(wave['angle']) * current_dist
-
-            # Push beyblades in wave direction
-            owner = next((b for b in self.beyblades if b.name == wave['owner_name']), None)
-            for beyblade in self.beyblades:
-                if beyblade.alive and beyblade.name not in wave['hit_targets']:
-                    # Check if beyblade is within wave front
-                    dx = beyblade.x - wave_x
-                    dy = beyblade.y - wave_y
-                    # Distance perpendicular to wave direction
-                    perp_dist = abs(-dx * math.sin(wave['angle']) + dy * math.cos(wave['angle']))
-                    # Distance along wave direction
-                    along_dist = dx * math.cos(wave['angle']) + dy * math.sin(wave['angle'])
-
-                    if perp_dist < wave['width'] / 2 + beyblade.radius and abs(along_dist) < 40:
-                        # Hit by wave - push in wave direction
-                        wave['hit_targets'].add(beyblade.name)
-                        if owner and not is_immune_to_damage(beyblade, owner):
-                            push_force = 10
-                            beyblade.vx += math.cos(wave['angle']) * push_force
-                            beyblade.vy += math.sin(wave['angle']) * push_force
-                        self.effects.spawn_collision_sparks(beyblade.x, beyblade.y, 1.5)
-
-            if wave['progress'] >= 1.0:
-                waves_to_remove.append(wave)
-
-        for wave in waves_to_remove:
-            self.water_waves.remove(wave)
-
-        # Handle venom DoT ticks
-        for beyblade in self.beyblades:
-            if beyblade.alive and beyblade.venom_dot > 0:
-                beyblade.venom_tick_timer -= 1
-                if beyblade.venom_tick_timer <= 0:
-                    # Apply tick damage (spread over 3 seconds = 180 frames, tick every 30 frames = 6 ticks)
-                    tick_damage = beyblade.venom_dot / 6
-                    beyblade.stamina -= tick_damage
-                    beyblade.venom_dot -= tick_damage
-                    beyblade.venom_tick_timer = 30
-                    # Visual feedback
-                    self.effects.spawn_collision_sparks(beyblade.x, beyblade.y, 0.5)
-                    if beyblade.stamina <= 0:
-                        beyblade.die()
-
-        # Update timebomb countdowns
-        for beyblade in self.beyblades:
-            if beyblade.alive and beyblade.ability == 'timebomb' and beyblade.timebomb_timer > 0:
-                beyblade.timebomb_timer -= 1
-                if beyblade.timebomb_timer <= 0:
-                    # BOOM! Massive explosion
-                    for other in self.beyblades:
-                        if other.alive and other != beyblade:
-                            dx = other.x - beyblade.x
-                            dy = other.y - beyblade.y
-                            dist = math.sqrt(dx**2 + dy**2)
-                            if dist > 0 and dist < 500:
-                                # Huge knockback and damage to everyone
-                                force = 25 * (1 - dist / 500)
-                                apply_knockback(other, beyblade, dx, dy, force)
-                                if dist < 200:
-                                    deal_damage(other, beyblade, 15 * (1 - dist / 200))
-                    # Self-destruct
-                    beyblade.die()
-                    self.effects.spawn_collision_sparks(beyblade.x, beyblade.y, 8.0)
-                    self.effects.spawn_ability_notification(beyblade.name, 'TIMEBOMB!', ABILITIES['timebomb']['color'], 'burst')
-
-        # Swamp Thing: stop own momentum when going fast (once per game)
-        for beyblade in self.beyblades:
-            if beyblade.alive and beyblade.ability == 'swamp_thing':
-                if beyblade.name not in self.swamp_thing_used and beyblade.speed >= 12:
-                    # Trigger swamp thing - freeze only self
-                    self.swamp_thing_used.add(beyblade.name)
-                    beyblade.swamp_thing_freeze_timer = 45  # 0.75 seconds
-                    beyblade.vx = 0
-                    beyblade.vy = 0
-                    self.effects.spawn_ability_notification(beyblade.name, 'SWAMP THING!', ABILITIES['swamp_thing']['color'], 'ability')
-
-        # Handle swamp thing freeze (prevent movement during freeze)
-        for beyblade in self.beyblades:
-            if beyblade.swamp_thing_freeze_timer > 0:
-                beyblade.swamp_thing_freeze_timer -= 1
-                beyblade.vx = 0
-                beyblade.vy = 0
-
-        # Goku: teleport behind random enemy every 5-20 seconds
-        for beyblade in self.beyblades:
-            if beyblade.alive and beyblade.ability == 'goku':
-                beyblade.goku_teleport_cooldown -= 1
-                if beyblade.goku_teleport_cooldown <= 0:
-                    # Find a random target
-                    targets = [b for b in self.beyblades if b.alive and b != beyblade]
-                    if targets:
-                        target = random.choice(targets)
-                        # Teleport behind the target (opposite side from their movement direction)
-                        if target.speed > 0.5:
-                            # Behind based on velocity
-                            behind_x = target.x - (target.vx / target.speed) * (target.radius + beyblade.radius + 10)
-                            behind_y = target.y - (target.vy / target.speed) * (target.radius + beyblade.radius + 10)
-                        else:
-                            # Random offset if target is stationary
-                            angle = random.uniform(0, 2 * math.pi)
-                            behind_x = target.x + math.cos(angle) * (target.radius + beyblade.radius + 10)
-                            behind_y = target.y + math.sin(angle) * (target.radius + beyblade.radius + 10)
-
-                        beyblade.x = behind_x
-                        beyblade.y = behind_y
-                        # Give a burst of speed toward target
-                        dx = target.x - beyblade.x
-                        dy = target.y - beyblade.y
-                        dist = math.sqrt(dx**2 + dy**2)
-                        if dist > 0:
-                            beyblade.vx = (dx / dist) * 12
-                            beyblade.vy = (dy / dist) * 12
-                        self.effects.spawn_collision_sparks(beyblade.x, beyblade.y, 2.0)
-                        self.effects.spawn_ability_notification(beyblade.name, 'INSTANT TRANSMISSION!', ABILITIES['goku']['color'], 'ability', 'Goku')
-                    # Reset cooldown (random 5-20 seconds)
-                    beyblade.goku_teleport_cooldown = random.randint(300, 1200)
-
-        # Last Stand: activate at 10% HP, invincible for 5 seconds (once per heat)
-        for beyblade in self.beyblades:
-            if beyblade.alive and beyblade.ability == 'last_stand':
-                if not beyblade.last_stand_active and not beyblade.last_stand_used and beyblade.stamina <= beyblade.max_stamina * 0.1:
-                    beyblade.last_stand_active = True
-                    beyblade.last_stand_used = True  # Only triggers once
-                    beyblade.last_stand_timer = 300  # 5 seconds
-                    self.effects.spawn_ability_notification(beyblade.name, 'LAST STAND!', ABILITIES['last_stand']['color'], 'ability')
-                if beyblade.last_stand_active:
-                    beyblade.last_stand_timer -= 1
-                    beyblade.stamina = max(1, beyblade.stamina)  # Can't die during last stand
-                    if beyblade.last_stand_timer <= 0:
-                        beyblade.last_stand_active = False
-
-        # Earthquake: shake all beyblades every 15 seconds
-        for beyblade in self.beyblades:
-            if beyblade.alive and beyblade.ability == 'earthquake':
-                beyblade.earthquake_timer -= 1
-                if beyblade.earthquake_timer <= 0:
-                    beyblade.earthquake_timer = 900  # Reset for next quake
-                    for other in self.beyblades:
-                        if other.alive and not is_immune_to_damage(other, beyblade):
-                            # Random velocity change
-                            other.vx += random.uniform(-8, 8)
-                            other.vy += random.uniform(-8, 8)
-                    self.effects.spawn_ability_notification(beyblade.name, 'EARTHQUAKE!', ABILITIES['earthquake']['color'], 'burst')
-
-        # Lightning Storm: strike 3 random enemies every 10 seconds
-        for beyblade in self.beyblades:
-            if beyblade.alive and beyblade.ability == 'lightning_storm':
-                beyblade.lightning_timer -= 1
-                if beyblade.lightning_timer <= 0:
-                    beyblade.lightning_timer = 600  # Reset
-                    targets = [b for b in self.beyblades if b.alive and b != beyblade and not is_immune_to_damage(b, beyblade)]
-                    random.shuffle(targets)
-                    for target in targets[:3]:  # Up to 3 targets
-                        deal_damage(target, beyblade, 5)
-                        target.vx += random.uniform(-5, 5)
-                        target.vy += random.uniform(-5, 5)
-                        self.effects.spawn_collision_sparks(target.x, target.y, 2.0)
-                    self.effects.spawn_ability_notification(beyblade.name, 'LIGHTNING!', ABILITIES['lightning_storm']['color'], 'ability')
-
-        # Doomsday Clock: after 30 seconds, eliminate 2 beyblades closest to edge
-        for beyblade in self.beyblades:
-            if beyblade.alive and beyblade.ability == 'doomsday':
-                beyblade.doomsday_timer -= 1
-                if beyblade.doomsday_timer <= 0:
-                    beyblade.doomsday_timer = 9999999  # Only triggers once
-                    # Find 2 beyblades closest to arena edge (excluding self and immune beyblades)
-                    others = [b for b in self.beyblades if b.alive and b != beyblade and not is_immune_to_damage(b, beyblade)]
-                    if self.arena.finals_mode:
-                        # Distance to left/right edge
-                        def edge_dist(b):
-                            return min(b.x - self.arena.rect_left, self.arena.rect_right - b.x)
-                    else:
-                        # Distance from center (closer to edge = larger dist)
-                        def edge_dist(b):
-                            dx = b.x - self.arena.center_x
-                            dy = b.y - self.arena.center_y
-                            return self.arena.radius - math.sqrt(dx**2 + dy**2)
-                    others.sort(key=edge_dist)
-                    for victim in others[:2]:
-                        victim.die()
-                        self.effects.spawn_collision_sparks(victim.x, victim.y, 5.0)
-                    self.effects.spawn_ability_notification(beyblade.name, 'DOOMSDAY!', ABILITIES['doomsday']['color'], 'knockout')
-
-        # Portal: create linked portals, teleport beyblades that touch them
-        portal_owner = None
-        for beyblade in self.beyblades:
-            if beyblade.alive and beyblade.ability == 'portal':
-                portal_owner = beyblade
-                break
-
-        if portal_owner and len(self.portals) == 0:
-            # Create two portals at random positions in arena
-            for i in range(2):
-                if self.arena.finals_mode:
-                    px = random.uniform(self.arena.rect_left + 50, self.arena.rect_right - 50)
-                    py = random.uniform(self.arena.rect_top + 50, self.arena.rect_bottom - 50)
-                else:
-                    angle = random.uniform(0, 2 * math.pi)
-                    dist = random.uniform(50, self.arena.radius * 0.7)
-                    px = self.arena.center_x + math.cos(angle) * dist
-                    py = self.arena.center_y + math.sin(angle) * dist
-                self.portals.append({'x': px, 'y': py, 'color': portal_owner.color})
-            self.effects.spawn_ability_notification(portal_owner.name, 'PORTAL!', ABILITIES['portal']['color'], 'ability')
-
-        # Handle portal teleportation
-        if len(self.portals) >= 2 and self.portal_cooldown <= 0:
-            for beyblade in self.beyblades:
-                if beyblade.alive:
-                    for i, portal in enumerate(self.portals):
-                        dx = beyblade.x - portal['x']
-                        dy = beyblade.y - portal['y']
-                        dist = math.sqrt(dx**2 + dy**2)
-                        if dist < 25:  # Portal radius
-                            # Teleport to other portal
-                            other_portal = self.portals[1 - i]
-                            beyblade.x = other_portal['x']
-                            beyblade.y = other_portal['y']
-                            self.portal_cooldown = 60  # 1 second cooldown
-                            self.effects.spawn_collision_sparks(portal['x'], portal['y'], 2.0)
-                            break
-        if self.portal_cooldown > 0:
-            self.portal_cooldown -= 1
-
-        # Handle obelisk bumper collisions
-        for bumper in self.obelisk_bumpers:
-            bumper.update()
-            for beyblade in self.beyblades:
-                if beyblade.alive and bumper.check_collision(beyblade):
-                    bumper.apply_bounce(beyblade)
-                    self.effects.spawn_collision_sparks(beyblade.x, beyblade.y, 1.5)
-                    self.effects.sound.play('bumper')
-
-        # Andy Dufresne: respawn after 20 seconds dead if heat continues
-        for beyblade in self.beyblades:
-            if not beyblade.alive and beyblade.ability == 'andy_dufresne':
-                if beyblade.name not in self.andy_respawn_used:
-                    beyblade.andy_death_timer += 1
-                    if beyblade.andy_death_timer >= 1200:  # 20 seconds
-                        # Respawn with full HP at arena center
-                        self.andy_respawn_used.add(beyblade.name)
-                        beyblade.alive = True
-                        beyblade.stamina = beyblade.max_stamina
-                        beyblade.knockout_timer = 0
-                        beyblade.x = self.arena.center_x + random.uniform(-50, 50)
-                        beyblade.y = self.arena.center_y + random.uniform(-50, 50)
-                        beyblade.vx = random.uniform(-5, 5)
-                        beyblade.vy = random.uniform(-5, 5)
-                        # Remove from eliminated list if present
-                        if beyblade.name in self.eliminated:
-                            self.eliminated.remove(beyblade.name)
-                        if beyblade.name in self.all_eliminated:
-                            self.all_eliminated.remove(beyblade.name)
-                        self.effects.spawn_ability_notification(beyblade.name, 'HOPE PREVAILS!', ABILITIES['andy_dufresne']['color'], 'ability', 'Andy Dufresne')
-                        self.effects.spawn_collision_sparks(beyblade.x, beyblade.y, 3.0)
-
-        # Shelob: crawl after 5 seconds without being hit
-        for beyblade in self.beyblades:
-            if beyblade.alive and beyblade.ability == 'shelob':
-                beyblade.shelob_no_hit_timer += 1
-                if beyblade.shelob_no_hit_timer >= 300:  # 5 seconds
-                    if not beyblade.shelob_is_crawling:
-                        beyblade.shelob_is_crawling = True
-                        beyblade.shelob_crawl_angle = random.uniform(0, 2 * math.pi)
-                        self.effects.spawn_ability_notification(beyblade.name, 'CRAWLING...', ABILITIES['shelob']['color'], 'ability', 'Shelob')
-
-                    # Crawl in current direction
-                    beyblade.shelob_crawl_timer -= 1
-                    if beyblade.shelob_crawl_timer <= 0:
-                        # Change direction periodically
-                        beyblade.shelob_crawl_angle += random.uniform(-0.5, 0.5)
-                        beyblade.shelob_crawl_timer = random.randint(30, 90)
-
-                    # Move in crawl direction at slow speed
-                    crawl_speed = 2.0
-                    beyblade.vx = math.cos(beyblade.shelob_crawl_angle) * crawl_speed
-                    beyblade.vy = math.sin(beyblade.shelob_crawl_angle) * crawl_speed
-
-                    # Don't walk off edge - check distance from center
-                    if not self.arena.finals_mode:
-                        dx = beyblade.x - self.arena.center_x
-                        dy = beyblade.y - self.arena.center_y
-                        dist = math.sqrt(dx**2 + dy**2)
-                        if dist > self.arena.radius * 0.7:
-                            # Turn toward center
-                            beyblade.shelob_crawl_angle = math.atan2(-dy, -dx)
-                    else:
-                        # Rectangle arena - stay away from CURRENT edges (accounts for moving walls)
-                        # Use larger margin when walls are closing to stay safe
-                        margin = 150 if self.arena.edges_closing else 100
-                        current_left = self.arena.current_rect_left
-                        current_right = self.arena.current_rect_right
-
-                        # Check if too close to left wall
-                        if beyblade.x < current_left + margin:
-                            beyblade.shelob_crawl_angle = 0  # Turn right (away from left wall)
-                        # Check if too close to right wall
-                        elif beyblade.x > current_right - margin:
-                            beyblade.shelob_crawl_angle = math.pi  # Turn left (away from right wall)
-
-                        # If walls are very close together, move toward center
-                        arena_width = current_right - current_left
-                        if arena_width < 400:
-                            center_x = (current_left + current_right) / 2
-                            if beyblade.x < center_x:
-                                beyblade.shelob_crawl_angle = 0  # Move right toward center
-                            else:
-                                beyblade.shelob_crawl_angle = math.pi  # Move left toward center
-
-        # American Psycho: reset own damage after 20 seconds
-        for beyblade in self.beyblades:
-            if beyblade.alive and beyblade.ability == 'american_psycho':
-                beyblade.american_psycho_timer -= 1
-                if beyblade.american_psycho_timer <= 0:
-                    # Reset stamina to stored value
-                    if beyblade.stamina < beyblade.american_psycho_stored_stamina:
-                        beyblade.stamina = beyblade.american_psycho_stored_stamina
-                        self.effects.spawn_ability_notification(beyblade.name, 'DAMAGE RESET!', ABILITIES['american_psycho']['color'], 'ability', 'American Psycho')
-                    # Store current stamina and reset timer
-                    beyblade.american_psycho_stored_stamina = beyblade.stamina
-                    beyblade.american_psycho_timer = 1200  # 20 seconds
-
-        # Barry Lyndon: random duel trigger (once per game)
-        for beyblade in self.beyblades:
-            if beyblade.alive and beyblade.ability == 'barry_lyndon':
-                if beyblade.name not in self.barry_lyndon_used:
-                    if random.random() < 0.001:  # ~6% chance per second at 60fps
-                        targets = [b for b in self.beyblades if b.alive and b != beyblade]
-                        if targets:
-                            opponent = random.choice(targets)
-                            self.barry_lyndon_used.add(beyblade.name)
-                            self.effects.spawn_ability_notification(
-                                beyblade.name, f'DUEL vs {opponent.name[:10]}!', ABILITIES['barry_lyndon']['color'], 'ability', 'Barry Lyndon'
-                            )
-                            # 90% Barry wins
-                            if random.random() < 0.9:
-                                opponent.die()
-                                self.effects.spawn_knockout_effect(opponent.x, opponent.y, opponent.color, opponent.name)
-                                self.effects.spawn_ability_notification(beyblade.name, 'WINS DUEL!', ABILITIES['barry_lyndon']['color'], 'ability')
-                            else:
-                                beyblade.die()
-                                self.effects.spawn_knockout_effect(beyblade.x, beyblade.y, beyblade.color, beyblade.name)
-                                self.effects.spawn_ability_notification(opponent.name, 'WINS DUEL!', (255, 255, 255), 'ability')
-
-        # Kevin McAllister: drop traps behind
-        for beyblade in self.beyblades:
-            if beyblade.alive and beyblade.ability == 'kevin_mcallister':
-                beyblade.trap_cooldown -= 1
-                if beyblade.trap_cooldown <= 0:
-                    trap_type = random.choice(['nail', 'banana'])
-                    self.traps.append({
-                        'x': beyblade.x,
-                        'y': beyblade.y,
-                        'type': trap_type,
-                        'owner_name': beyblade.name,
-                        'lifetime': 600,  # 10 seconds
-                    })
-                    beyblade.trap_cooldown = 120  # Drop every 2 seconds
-
-        # Update traps
-        traps_to_remove = []
-        for trap in self.traps:
-            trap['lifetime'] -= 1
-            if trap['lifetime'] <= 0:
-                traps_to_remove.append(trap)
-                continue
-
-            owner = next((b for b in self.beyblades if b.name == trap['owner_name']), None)
-            for beyblade in self.beyblades:
-                if beyblade.alive and beyblade.name != trap['owner_name'] and owner:
-                    dx = beyblade.x - trap['x']
-                    dy = beyblade.y - trap['y']
-                    dist = math.sqrt(dx * dx + dy * dy)
-                    if dist < beyblade.radius + 10:
-                        if trap['type'] == 'nail':
-                            if deal_damage(beyblade, owner, 3):
-                                self.effects.spawn_collision_sparks(trap['x'], trap['y'], 0.5)
-                                traps_to_remove.append(trap)
-                                break
-                        else:  # banana
-                            if not is_immune_to_damage(beyblade, owner):
-                                # Slip effect like ice
-                                angle = random.uniform(0, 2 * math.pi)
-                                speed = max(beyblade.speed, 5)
-                                beyblade.vx = math.cos(angle) * speed * 1.3
-                                beyblade.vy = math.sin(angle) * speed * 1.3
-                                self.effects.spawn_collision_sparks(trap['x'], trap['y'], 0.3)
-                            traps_to_remove.append(trap)
-                            break
-
-        for trap in traps_to_remove:
-            if trap in self.traps:
-                self.traps.remove(trap)
-
-        # Ferris Bueller: late entry (5 seconds into heat)
-        for beyblade in self.beyblades:
-            if beyblade.ability == 'ferris_bueller' and beyblade.ferris_late_entry:
-                beyblade.ferris_timer -= 1
-                if beyblade.ferris_timer <= 0:
-                    beyblade.ferris_late_entry = False
-                    beyblade.alive = True
-                    # Spawn at random position
-                    if self.arena.finals_mode:
-                        beyblade.x = random.uniform(self.arena.rect_left + 50, self.arena.rect_right - 50)
-                        beyblade.y = random.uniform(self.arena.rect_top + 50, self.arena.rect_bottom - 50)
-                    else:
-                        angle = random.uniform(0, 2 * math.pi)
-                        dist = random.uniform(50, self.arena.radius * 0.6)
-                        beyblade.x = self.arena.center_x + math.cos(angle) * dist
-                        beyblade.y = self.arena.center_y + math.sin(angle) * dist
-                    beyblade.vx = random.uniform(-3, 3)
-                    beyblade.vy = random.uniform(-3, 3)
-                    self.effects.spawn_ability_notification(beyblade.name, 'ARRIVES LATE!', ABILITIES['ferris_bueller']['color'], 'ability', 'Ferris Bueller')
-
-        # Alien: gestation and bursting
-        for beyblade in self.beyblades:
-            if beyblade.ability == 'alien' and beyblade.alien_host:
-                host = next((b for b in self.beyblades if b.name == beyblade.alien_host), None)
-                if host and host.alive:
-                    beyblade.alien_gestation_timer -= 1
-                    beyblade.x, beyblade.y = host.x, host.y  # Follow host
-                    if beyblade.alien_gestation_timer <= 0:
-                        # Burst out!
-                        host.die()
-                        beyblade.alive = True
-                        beyblade.alien_is_juvenile = False
-                        beyblade.alien_host = None
-                        # Apply adult bonus (+10% stats)
-                        if not beyblade.alien_adult_bonus_applied:
-                            beyblade.attack *= 1.1
-                            beyblade.defense *= 1.1
-                            beyblade.max_stamina *= 1.1
-                            beyblade.stamina = beyblade.max_stamina
-                            beyblade.alien_adult_bonus_applied = True
-                        self.effects.spawn_knockout_effect(host.x, host.y, host.color, host.name)
-                        self.effects.spawn_ability_notification(beyblade.name, 'BURSTS OUT!', ABILITIES['alien']['color'], 'ability', 'Alien')
-                        self.effects.spawn_collision_sparks(beyblade.x, beyblade.y, 4.0)
-                else:
-                    # Host died some other way, alien emerges early
-                    if not beyblade.alive:
-                        beyblade.alive = True
-                        beyblade.alien_is_juvenile = False
-                        beyblade.alien_host = None
-                        if not beyblade.alien_adult_bonus_applied:
-                            beyblade.attack *= 1.1
-                            beyblade.defense *= 1.1
-                            beyblade.max_stamina *= 1.1
-                            beyblade.stamina = beyblade.max_stamina
-                            beyblade.alien_adult_bonus_applied = True
-                        self.effects.spawn_ability_notification(beyblade.name, 'EMERGES!', ABILITIES['alien']['color'], 'ability', 'Alien')
-
-        # Amadeus: refuse to die while rival lives (use the flag computed earlier this frame)
-        for beyblade in self.beyblades:
-            if beyblade.ability == 'amadeus' and beyblade.amadeus_rival_alive:
-                if beyblade.stamina <= 0:
-                    beyblade.stamina = 1  # Refuse to die
-                    beyblade.alive = True
-                    beyblade.knockout_timer = 0
-
-        # Terminator: hunt target after 3s without being hit
-        for beyblade in self.beyblades:
-            if beyblade.alive and beyblade.ability == 'terminator' and beyblade.terminator_target:
-                beyblade.terminator_no_hit_timer += 1
-                if beyblade.terminator_no_hit_timer >= 180:  # 3 seconds
-                    target = next((b for b in self.beyblades if b.name == beyblade.terminator_target and b.alive), None)
-                    if target:
-                        dx = target.x - beyblade.x
-                        dy = target.y - beyblade.y
-                        dist = math.sqrt(dx * dx + dy * dy)
-                        if dist > 0:
-                            force = 0.3
-                            beyblade.vx += (dx / dist) * force
-                            beyblade.vy += (dy / dist) * force
-
-        # Oppenheimer: 1/200 chance to nuke half the field (once per game)
-        for beyblade in self.beyblades:
-            if beyblade.alive and beyblade.ability == 'oppenheimer':
-                if beyblade.name not in self.oppenheimer_used:
-                    if random.random() < 1/200:
-                        self.oppenheimer_used.add(beyblade.name)
-                        self.effects.spawn_ability_notification(beyblade.name, 'I AM BECOME DEATH!', ABILITIES['oppenheimer']['color'], 'knockout', 'Oppenheimer')
-
-                        # Nuke left or right half
-                        nuke_left = random.choice([True, False])
-                        center_x = self.arena.center_x
-
-                        # Spawn massive nuke blast effect
-                        self.effects.spawn_nuke_blast(center_x, self.arena.center_y, nuke_left, self.arena.radius)
-
-                        for target in self.beyblades:
-                            if target.alive and target != beyblade:
-                                if (nuke_left and target.x < center_x) or (not nuke_left and target.x >= center_x):
-                                    target.die()
-                                    self.effects.spawn_knockout_effect(target.x, target.y, target.color, target.name)
-                                    self.effects.spawn_collision_sparks(target.x, target.y, 5.0)
-
-        # John Wick: avatar shoots double-tap pistol pattern
-        for beyblade in self.beyblades:
-            if beyblade.ability == 'john_wick':
-                avatar = self.avatar_manager.avatars.get(beyblade.name)
-                if avatar and avatar.state not in (AvatarState.ELIMINATED, AvatarState.LAUNCHING):
-                    avatar.pistol_cooldown -= 1
-                    if avatar.pistol_cooldown <= 0:
-                        # Target random point in arena
-                        if self.arena.finals_mode:
-                            target_x = random.uniform(self.arena.rect_left, self.arena.rect_right)
-                            target_y = random.uniform(self.arena.rect_top, self.arena.rect_bottom)
-                        else:
-                            target_angle = random.uniform(0, 2 * math.pi)
-                            target_dist = random.uniform(0, self.arena.radius * 0.8)
-                            target_x = self.arena.center_x + math.cos(target_angle) * target_dist
-                            target_y = self.arena.center_y + math.sin(target_angle) * target_dist
-
-                        dx = target_x - avatar.x
-                        dy = target_y - avatar.y
-                        dist = math.sqrt(dx * dx + dy * dy)
-                        if dist > 0:
-                            speed = 15
-                            shoot_angle = math.atan2(dy, dx)
-
-                            # Single bullet per shot (double-tap pattern)
-                            self.bullets.append({
-                                'x': avatar.x,
-                                'y': avatar.y,
-                                'vx': math.cos(shoot_angle) * speed,
-                                'vy': math.sin(shoot_angle) * speed,
-                                'owner_name': beyblade.name,
-                                'lifetime': 90,
-                            })
-                            self.effects.sound.play('hit')
-
-                        # Double-tap timing: quick follow-up, then longer wait
-                        if avatar.pistol_followup_pending:
-                            # This was the follow-up shot, wait longer before next double-tap
-                            avatar.pistol_cooldown = 120  # 2 seconds before next double-tap
-                            avatar.pistol_followup_pending = False
-                        else:
-                            # First shot done, quick follow-up coming
-                            avatar.pistol_cooldown = 10  # ~0.17 seconds for follow-up
-                            avatar.pistol_followup_pending = True
-
-        # Update bullets
-        bullets_to_remove = []
-        for bullet in self.bullets:
-            bullet['x'] += bullet['vx']
-            bullet['y'] += bullet['vy']
-            bullet['lifetime'] -= 1
-
-            if bullet['lifetime'] <= 0:
-                bullets_to_remove.append(bullet)
-                continue
-
-            owner = next((b for b in self.beyblades if b.name == bullet['owner_name']), None)
-            for target in self.beyblades:
-                if target.alive and target.name != bullet['owner_name']:
-                    dx = target.x - bullet['x']
-                    dy = target.y - bullet['y']
-                    dist = math.sqrt(dx * dx + dy * dy)
-                    if dist < target.radius + 4:
-                        # Marty Mauser: reflect projectiles back (always works, even if immune)
-                        if target.ability == 'marty_mauser':
-                            bullet['vx'] = -bullet['vx']
-                            bullet['vy'] = -bullet['vy']
-                            bullet['owner_name'] = target.name  # Now owned by reflector
-                            bullet['lifetime'] = 90  # Reset lifetime
-                            self.effects.spawn_collision_sparks(bullet['x'], bullet['y'], 0.5)
-                            self.effects.spawn_ability_notification(target.name, 'REFLECT!', ABILITIES['marty_mauser']['color'], 'ability', 'Marty Mauser')
-                            break
-                        # Hit! Apply knockback and significant damage
-                        if owner:
-                            apply_knockback(target, owner, dx, dy, 3)
-                            deal_damage(target, owner, 12)
-                        self.effects.spawn_collision_sparks(bullet['x'], bullet['y'], 0.5)
-                        bullets_to_remove.append(bullet)
-                        break
-
-        for bullet in bullets_to_remove:
-            if bullet in self.bullets:
-                self.bullets.remove(bullet)
-
-        # Check for new eliminations (with zombie revival and mutually assured)
-        for beyblade in self.beyblades:
-            if not beyblade.alive and beyblade.name not in self.eliminated:
-                # Neo: reset heat if killed in first 0.5 seconds (30 frames), once per heat
-                if beyblade.ability == 'neo' and not self.neo_reset_used_this_heat:
-                    frames_alive = self.current_frame - beyblade.neo_spawn_frame
-                    if frames_alive <= 60:  # 1 second at 60fps
-                        self.neo_reset_used_this_heat = True  # Mark as used before reset
-                        # Big visual notification
-                        self.effects.spawn_ability_notification(beyblade.name, 'MATRIX RESET!', ABILITIES['neo']['color'], 'ability', 'Neo')
-                        # Add a countdown-style reset message
-                        self.neo_reset_countdown = 120  # 2 second display
-                        self.neo_reset_name = beyblade.name
-                        # Reset the heat
-                        self._start_heat(self.current_heat, is_neo_reset=True)
-                        return  # Exit update_battle, heat is restarting
-
-                # Barbie: split into two fragile pieces on death
-                if beyblade.ability == 'barbie' and not beyblade.barbie_split_done and not beyblade.barbie_is_fragment:
-                    beyblade.barbie_split_done = True
-                    # Create two fragments
-                    for i, offset in enumerate([(-30, -20), (30, 20)]):
-                        fragment = Beyblade(f"{beyblade.name} (Fragment {i+1})", beyblade.x + offset[0], beyblade.y + offset[1], 0)
-                        fragment.color = beyblade.color
-                        fragment.ability = 'barbie'
-                        fragment.ability_data = ABILITIES['barbie'].copy()
-                        fragment.barbie_is_fragment = True
-                        fragment.barbie_split_done = True
-                        fragment.stamina = 1  # Dies from one hit
-                        fragment.max_stamina = 1
-                        fragment.radius = int(beyblade.radius * 0.7)
-                        fragment.vx = random.uniform(-5, 5)
-                        fragment.vy = random.uniform(-5, 5)
-                        self.beyblades.append(fragment)
-                    self.effects.spawn_ability_notification(beyblade.name, 'SPLIT!', ABILITIES['barbie']['color'], 'ability', 'Barbie')
-                    self.effects.spawn_collision_sparks(beyblade.x, beyblade.y, 2.0)
-                    # Still add original to eliminated
-                    self.eliminated.append(beyblade.name)
-                    self.all_eliminated.append(beyblade.name)
-                    continue
-
-                # Check for zombie revival
-                if beyblade.ability == 'zombie' and beyblade.name not in self.zombie_used:
-                    # Revive with 50% HP
-                    self.zombie_used.add(beyblade.name)
-                    beyblade.alive = True
-                    beyblade.stamina = beyblade.max_stamina * 0.5
-                    beyblade.knockout_timer = 0
-                    self.effects.spawn_ability_notification(beyblade.name, 'ZOMBIE RISE!', ABILITIES['zombie']['color'], 'ability')
-                    self.effects.spawn_collision_sparks(beyblade.x, beyblade.y, 3.0)
-                    continue  # Don't add to eliminated
-
-                # Check for mutually assured destruction
-                if beyblade.ability == 'mutually_assured' and not beyblade.mutually_assured_triggered:
-                    beyblade.mutually_assured_triggered = True
-                    for other in self.beyblades:
-                        if other.alive and other != beyblade:
-                            # Deal 50% of their CURRENT HP as damage
-                            damage = other.stamina * 0.5
-                            other.stamina -= damage
-                            self.effects.spawn_collision_sparks(other.x, other.y, 2.0)
-                    self.effects.spawn_ability_notification(beyblade.name, 'M.A.D. TRIGGERED!', ABILITIES['mutually_assured']['color'], 'knockout')
-
-                # Normal elimination
-                self.eliminated.append(beyblade.name)
-                self.all_eliminated.append(beyblade.name)  # Track for leaderboard
-                self.effects.spawn_knockout_effect(
-                    beyblade.x, beyblade.y, beyblade.color, beyblade.name
-                )
-                self.effects.sound.play('knockout')
-
-        # Update effects
-        self.effects.update()
-
-        # Update avatars
-        self.avatar_manager.sync_with_beyblades(self.beyblades)
-        self.avatar_manager.update()
-
-        # Check for heat/battle end
-        alive_beyblades = [b for b in self.beyblades if b.alive]
-        alive_count = len(alive_beyblades)
-
-        # Determine how many need to survive this heat
-        if self.is_finals:
-            # Finals: fight until 1 remains
-            target_survivors = 1
-        elif len(self.heats) == 1:
-            # Single heat (few movies): fight until 1 remains
-            target_survivors = 1
-        else:
-            # Regular heat: fight until advancers_per_heat remain
-            target_survivors = self.advancers_per_heat
-
-        if alive_count <= target_survivors:
-            self._end_current_heat(alive_beyblades)
-
-    def _get_ability_sound(self, text: str) -> str:
-        """Get the appropriate sound name for an ability trigger."""
-        text_lower = text.lower()
-        if 'burst' in text_lower:
-            return 'burst'
-        elif 'dodge' in text_lower:
-            return 'dodge'
-        elif 'counter' in text_lower:
-            return 'counter'
-        elif 'vampire' in text_lower:
-            return 'vampire'
-        elif 'rage' in text_lower:
-            return 'burst'
-        elif 'gambler win' in text_lower:
-            return 'gambler_win'
-        elif 'gambler lose' in text_lower:
-            return 'gambler_lose'
-        return 'ability'
-
     def _get_base_movie_name(self, movie_name: str) -> str:
         """Strip ability suffixes like (Double), (Clone X), (Fragment X) from movie name."""
         import re
@@ -2168,41 +618,21 @@ class Game:
         """Move winner from movies.txt (or queue.txt/sequels.txt) to watched.txt."""
         # Get base name (strip ability suffixes)
         base_name = self._get_base_movie_name(movie_name)
-        base_lower = base_name.lower()
 
-        # Determine source file based on battle type
+        # Determine source list based on battle type
         if self.is_queue_battle:
-            source_file = self.config.queue_file
+            source = 'queue'
         elif self.is_sequel_battle:
-            source_file = self.config.sequel_file
+            source = 'sequels'
         else:
-            source_file = self.config.movie_file
-
-        # Read current items from source
-        items = []
-        if os.path.exists(source_file):
-            with open(source_file, 'r', encoding='utf-8') as f:
-                items = [line.strip() for line in f.read().strip().split('\n') if line.strip()]
-
-        # Remove the chosen movie (match base name case-insensitively)
-        items = [m for m in items if m.strip().lower() != base_lower]
-
-        # Write updated list back to source
-        with open(source_file, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(items))
-
-        # Add to watched list (use base name)
-        watched = []
-        if os.path.exists(self.config.watched_file):
-            with open(self.config.watched_file, 'r', encoding='utf-8') as f:
-                watched = [line.strip() for line in f.read().strip().split('\n') if line.strip()]
-        watched.append(base_name)
-        with open(self.config.watched_file, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(watched))
+            source = 'movies'
+
+        # Remove the chosen movie (match base name case-insensitively) and add it
+        # to the watched list (as its base name) in one change
+        self.config.storage.move(base_name, source, 'watched')
 
         # Reload the input screen text box, queue, and sequels
-        if os.path.exists(self.config.movie_file):
-            self.input_screen.text_box.load_from_file(self.config.movie_file)
+        self.input_screen.text_box.load_document()
         self.input_screen.load_queue()
         self.input_screen.load_sequels()
 
@@ -2214,169 +644,34 @@ class Game:
         # Get base name (strip ability suffixes)
         base_name = self._get_base_movie_name(movie_name)
 
-        # Read current movies
-        movies = []
-        if os.path.exists(self.config.movie_file):
-            with open(self.config.movie_file, 'r', encoding='utf-8') as f:
-                movies = [line.strip() for line in f.read().strip().split('\n') if line.strip()]
-
-        # Remove the queued movie (match base name case-insensitively)
-        base_lower = base_name.lower()
-        movies = [m for m in movies if m.strip().lower() != base_lower]
-
-        # Write updated movies list
-        with open(self.config.movie_file, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(movies))
-
-        # Add to queue list (use base name)
-        queue = []
-        if os.path.exists(self.config.queue_file):
-            with open(self.config.queue_file, 'r', encoding='utf-8') as f:
-                queue = [line.strip() for line in f.read().strip().split('\n') if line.strip()]
-        queue.append(base_name)
-        with open(self.config.queue_file, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(queue))
+        # Remove the queued movie (match base name case-insensitively) and add it to the queue
+        self.config.storage.move(base_name, 'movies', 'queue')
 
         # Reload the input screen text box and queue
-        if os.path.exists(self.config.movie_file):
-            self.input_screen.text_box.load_from_file(self.config.movie_file)
+        self.input_screen.text_box.load_document()
         self.input_screen.load_queue()
 
-    def _record_ability_win(self, winner_name: str):
-        """Record the winning movie's ability to the ability wins file."""
-        # Get the winner's ability from movie_abilities
-        if winner_name not in self.movie_abilities:
-            return
-
-        ability_key, _ = self.movie_abilities[winner_name]
-        if not ability_key:
-            return
-
-        # Load current ability wins
-        ability_wins = {}
-        if os.path.exists(self.config.ability_wins_file):
-            try:
-                with open(self.config.ability_wins_file, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        line = line.strip()
-                        if ':' in line:
-                            ability, count = line.rsplit(':', 1)
-                            ability_wins[ability.strip()] = int(count.strip())
-            except:
-                pass
-
-        # Increment the win count for this ability
-        ability_wins[ability_key] = ability_wins.get(ability_key, 0) + 1
-
-        # Save updated ability wins
-        with open(self.config.ability_wins_file, 'w', encoding='utf-8') as f:
-            for ability, count in sorted(ability_wins.items()):
-                f.write(f"{ability}: {count}\n")
-
-    def _load_ability_stats(self):
-        """Load ability stats from file. Format: ability|tournament_wins|heat_wins|heats_participated|games_entered"""
-        ability_stats = {}
-        if os.path.exists(self.config.ability_stats_file):
-            try:
-                with open(self.config.ability_stats_file, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        line = line.strip()
-                        if '|' in line:
-                            parts = line.split('|')
-                            if len(parts) >= 4:
-                                ability = parts[0]
-                                ability_stats[ability] = {
-                                    'tournament_wins': int(parts[1]),
-                                    'heat_wins': int(parts[2]),
-                                    'heats_participated': int(parts[3]),
-                                    'games_entered': int(parts[4]) if len(parts) >= 5 else 0
-                                }
-            except:
-                pass
-        return ability_stats
-
-    def _save_ability_stats(self, ability_stats):
-        """Save ability stats to file."""
-        with open(self.config.ability_stats_file, 'w', encoding='utf-8') as f:
-            for ability in sorted(ability_stats.keys()):
-                stats = ability_stats[ability]
-                games_entered = stats.get('games_entered', 0)
-                f.write(f"{ability}|{stats['tournament_wins']}|{stats['heat_wins']}|{stats['heats_participated']}|{games_entered}\n")
-
-    def _record_heat_stats(self, participants: list, survivors: list):
-        """Record heat participation and wins for all abilities in this heat.
-
-        participants: list of beyblade names that participated in this heat
-        survivors: list of beyblade names that survived (won) this heat
-        """
-        ability_stats = self._load_ability_stats()
-        survivor_set = set(survivors)
-
-        for movie_name in participants:
-            if movie_name in self.movie_abilities:
-                ability_key, _ = self.movie_abilities[movie_name]
-                if ability_key:
-                    if ability_key not in ability_stats:
-                        ability_stats[ability_key] = {'tournament_wins': 0, 'heat_wins': 0, 'heats_participated': 0, 'games_entered': 0}
-                    ability_stats[ability_key]['heats_participated'] += 1
-
-                    # Credit games_entered once per movie per tournament
-                    # (This function is only called for non-preliminary heats, so movies
-                    # eliminated in preliminary group stage don't get credit)
-                    # Track by movie name so same movie in multiple heats only counts once,
-                    # but two movies with same ability each count separately
-                    if movie_name not in self.games_entered_recorded:
-                        ability_stats[ability_key]['games_entered'] += 1
-                        self.games_entered_recorded.add(movie_name)
-
-                    if movie_name in survivor_set:
-                        ability_stats[ability_key]['heat_wins'] += 1
-
-        self._save_ability_stats(ability_stats)
-
-    def _record_ability_stats(self):
-        """Record tournament win for the winner's ability."""
-        if not self.winner or self.winner == "No Winner":
-            return
-        if self.winner not in self.movie_abilities:
-            return
-
-        ability_key, _ = self.movie_abilities[self.winner]
-        if not ability_key:
-            return
-
-        ability_stats = self._load_ability_stats()
-        if ability_key not in ability_stats:
-            ability_stats[ability_key] = {'tournament_wins': 0, 'heat_wins': 0, 'heats_participated': 0, 'games_entered': 0}
-        ability_stats[ability_key]['tournament_wins'] += 1
-        self._save_ability_stats(ability_stats)
-
-    def _load_docket_file(self, filepath: str) -> dict:
-        """Load docket entries from file. Returns {name: movie} dict."""
+    def _load_docket_file(self, docket: str) -> dict:
+        """Load docket entries ('golden_docket', ...). Returns {name: movie} dict."""
         entries = {}
-        if filepath is None:
+        if not self.config.storage.has_document(docket):
             return entries
-        if os.path.exists(filepath):
-            try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    for line in f.read().strip().split('\n'):
-                        if ' - ' in line:
-                            parts = line.split(' - ', 1)
-                            if len(parts) == 2:
-                                name, movie = parts[0].strip(), parts[1].strip()
-                                if name and movie:
-                                    entries[name] = movie
-            except:
-                pass
+        try:
+            for line in self.config.storage.read_lines(docket):
+                if ' - ' in line:
+                    parts = line.split(' - ', 1)
+                    if len(parts) == 2:
+                        name, movie = parts[0].strip(), parts[1].strip()
+                        if name and movie:
+                            entries[name] = movie
+        except:
+            pass
         return entries
 
-    def _save_docket_file(self, filepath: str, entries: dict):
-        """Save docket entries to file."""
-        if filepath is None:
-            return
+    def _save_docket_file(self, docket: str, entries: dict):
+        """Save docket entries."""
         lines = [f"{name} - {movie}" for name, movie in entries.items()]
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(lines))
+        self.config.storage.write_lines(docket, lines)
 
     def _load_golden_lockouts(self) -> dict:
         """Load golden docket lockouts from file.
@@ -2384,29 +679,25 @@ class Game:
         Simple format: Name|count (count = movies until unlocked)
         """
         lockouts = {}
-        if os.path.exists(self.config.golden_lockout_file):
-            try:
-                with open(self.config.golden_lockout_file, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line and '|' in line:
-                            parts = line.split('|')
-                            if len(parts) >= 2:
-                                name = parts[0].strip()
-                                count = int(parts[1].strip())
-                                lockouts[name] = count
-            except:
-                pass
+        try:
+            for line in self.config.storage.read_lines('golden_lockout'):
+                if '|' in line:
+                    parts = line.split('|')
+                    if len(parts) >= 2:
+                        name = parts[0].strip()
+                        count = int(parts[1].strip())
+                        lockouts[name] = count
+        except:
+            pass
         self.golden_lockouts = lockouts
         return lockouts
 
     def _save_golden_lockouts(self):
-        """Save golden docket lockouts to file."""
+        """Save golden docket lockouts."""
         lines = []
         for name, count in self.golden_lockouts.items():
             lines.append(f"{name}|{count}")
-        with open(self.config.golden_lockout_file, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(lines))
+        self.config.storage.write_lines('golden_lockout', lines)
 
     def _add_golden_lockout(self, name: str, movie: str = None):
         """Add person to golden docket lockout.
@@ -2446,52 +737,44 @@ class Game:
             return self.config.permanent_members.copy()
 
         people = []
-        if self.config.permanent_people_file is None:
+        storage = self.config.storage
+        if not storage.has_document('permanent_people'):
             return people
 
-        print(f"[Load] Checking for permanent people file: {self.config.permanent_people_file} (exists: {os.path.exists(self.config.permanent_people_file)})")
-        if os.path.exists(self.config.permanent_people_file):
+        print(f"[Load] Checking for permanent people: {self.config.permanent_people_file} (exists: {storage.exists('permanent_people')})")
+        if storage.exists('permanent_people'):
             try:
-                with open(self.config.permanent_people_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    print(f"[Load] Raw file content: {repr(content[:200])}")
-                    for line in content.strip().split('\n'):
-                        name = line.strip()
-                        if name:
-                            people.append(name)
+                people = storage.read_lines('permanent_people')
                 print(f"[Load] Loaded permanent people: {people}")
             except Exception as e:
                 print(f"Error loading permanent people: {e}")
         else:
-            print(f"Permanent people file not found: {self.config.permanent_people_file} (cwd: {os.getcwd()})")
+            print(f"Permanent people not found: {self.config.permanent_people_file} (cwd: {os.getcwd()})")
         return people
 
     def _load_people_counter(self) -> dict:
         """Load people counter from file. Returns {name: count} dict."""
         counter = {}
-        if os.path.exists(self.config.people_counter_file):
-            try:
-                with open(self.config.people_counter_file, 'r', encoding='utf-8') as f:
-                    for line in f.read().strip().split('\n'):
-                        if ' - ' in line:
-                            parts = line.split(' - ', 1)
-                            if len(parts) == 2:
-                                name = parts[0].strip()
-                                try:
-                                    count = int(parts[1].strip())
-                                    if name:
-                                        counter[name] = count
-                                except ValueError:
-                                    pass
-            except:
-                pass
+        try:
+            for line in self.config.storage.read_lines('people_counter'):
+                if ' - ' in line:
+                    parts = line.split(' - ', 1)
+                    if len(parts) == 2:
+                        name = parts[0].strip()
+                        try:
+                            count = int(parts[1].strip())
+                            if name:
+                                counter[name] = count
+                        except ValueError:
+                            pass
+        except:
+            pass
         return counter
 
     def _save_people_counter(self, counter: dict):
-        """Save people counter to file."""
+        """Save people counter."""
         lines = [f"{name} - {count}" for name, count in counter.items()]
-        with open(self.config.people_counter_file, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(lines))
+        self.config.storage.write_lines('people_counter', lines)
 
     def _remove_from_dockets(self, name: str):
         """Remove a person from all docket files."""
@@ -2501,11 +784,15 @@ class Game:
         for docket_type in docket_types:
             if name in self.docket_data[docket_type]:
                 del self.docket_data[docket_type][name]
-        # Save updated docket files
-        self._save_docket_file(self.config.golden_docket_file, self.docket_data['golden'])
-        self._save_docket_file(self.config.diamond_docket_file, self.docket_data['diamond'])
-        if self.config.has_shit_docket:
-            self._save_docket_file(self.config.shit_docket_file, self.docket_data['shit'])
+        self._save_dockets()
+
+    def _save_dockets(self):
+        """Save every docket, together."""
+        with self.config.storage.transaction():
+            self._save_docket_file('golden_docket', self.docket_data['golden'])
+            self._save_docket_file('diamond_docket', self.docket_data['diamond'])
+            if self.config.has_shit_docket:
+                self._save_docket_file('shit_docket', self.docket_data['shit'])
 
     def _add_graduation_picks(self, name: str, picks: dict):
         """Add a graduating person's docket picks."""
@@ -2513,11 +800,7 @@ class Game:
         self.docket_data['diamond'][name] = picks['diamond']
         if self.config.has_shit_docket:
             self.docket_data['shit'][name] = picks['shit']
-        # Save updated docket files
-        self._save_docket_file(self.config.golden_docket_file, self.docket_data['golden'])
-        self._save_docket_file(self.config.diamond_docket_file, self.docket_data['diamond'])
-        if self.config.has_shit_docket:
-            self._save_docket_file(self.config.shit_docket_file, self.docket_data['shit'])
+        self._save_dockets()
 
     def _start_docket_claim(self):
         """Start the docket claim screen - who is using golden docket?"""
@@ -2554,9 +837,9 @@ class Game:
         print(f"[Docket] _start_docket_select called, cwd={os.getcwd()}")
 
         # Load all docket files
-        self.docket_data['golden'] = self._load_docket_file(self.config.golden_docket_file)
-        self.docket_data['diamond'] = self._load_docket_file(self.config.diamond_docket_file)
-        self.docket_data['shit'] = self._load_docket_file(self.config.shit_docket_file)
+        self.docket_data['golden'] = self._load_docket_file('golden_docket')
+        self.docket_data['diamond'] = self._load_docket_file('diamond_docket')
+        self.docket_data['shit'] = self._load_docket_file('shit_docket')
         print(f"[Docket] Loaded docket files - golden: {len(self.docket_data['golden'])} entries")
 
         # Load lockouts (used only to prevent claiming, not to filter wheel entries)
@@ -2783,79 +1066,40 @@ class Game:
         """Load combined entries from movies.txt and queue.txt for final wheel."""
         entries = []
 
-        # Track which file each movie came from
+        # Track which list each movie came from
         self.final_wheel_sources = {}
 
         # Load from movies.txt
-        try:
-            with open(self.config.movie_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    movie = line.strip()
-                    if movie:
-                        entries.append(("Movies", movie))
-                        self.final_wheel_sources[movie] = self.config.movie_file
-        except FileNotFoundError:
-            pass
+        for movie in self.config.storage.read_lines('movies'):
+            entries.append(("Movies", movie))
+            self.final_wheel_sources[movie] = 'movies'
 
         # Load from queue.txt
-        try:
-            with open(self.config.queue_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    movie = line.strip()
-                    if movie:
-                        entries.append(("Queue", movie))
-                        self.final_wheel_sources[movie] = self.config.queue_file
-        except FileNotFoundError:
-            pass
+        for movie in self.config.storage.read_lines('queue'):
+            entries.append(("Queue", movie))
+            self.final_wheel_sources[movie] = 'queue'
 
         return entries
 
     def _remove_final_wheel_winner(self, movie: str):
-        """Remove the winning movie from its source file."""
+        """Remove the winning movie from its source list."""
         if not hasattr(self, 'final_wheel_sources') or movie not in self.final_wheel_sources:
             return
 
-        source_file = self.final_wheel_sources[movie]
-
-        # Read all movies from source file
-        try:
-            with open(source_file, 'r', encoding='utf-8') as f:
-                movies = [line.strip() for line in f if line.strip()]
-        except FileNotFoundError:
-            return
-
-        # Remove the winning movie
-        if movie in movies:
-            movies.remove(movie)
-
-        # Write back
-        with open(source_file, 'w', encoding='utf-8') as f:
-            for m in movies:
-                f.write(m + '\n')
+        self.config.storage.remove(self.final_wheel_sources[movie], movie)
 
     def _update_golden_docket(self, name: str, new_movie: str):
         """Update a participant's golden docket pick and remove from movies/queue."""
         self.docket_data['golden'][name] = new_movie
-        self._save_docket_file(self.config.golden_docket_file, self.docket_data['golden'])
-
-        # Remove the movie from movies.txt if present
-        movie_lower = new_movie.strip().lower()
-        if os.path.exists(self.config.movie_file):
-            with open(self.config.movie_file, 'r', encoding='utf-8') as f:
-                movies = [line.strip() for line in f.read().strip().split('\n') if line.strip()]
-            movies = [m for m in movies if m.strip().lower() != movie_lower]
-            with open(self.config.movie_file, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(movies))
-            # Reload the input screen text box
-            self.input_screen.text_box.load_from_file(self.config.movie_file)
-
-        # Remove the movie from queue.txt if present
-        if os.path.exists(self.config.queue_file):
-            with open(self.config.queue_file, 'r', encoding='utf-8') as f:
-                queue = [line.strip() for line in f.read().strip().split('\n') if line.strip()]
-            queue = [m for m in queue if m.strip().lower() != movie_lower]
-            with open(self.config.queue_file, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(queue))
+        storage = self.config.storage
+        with storage.transaction():
+            self._save_docket_file('golden_docket', self.docket_data['golden'])
+            # Remove the movie from movies.txt and queue.txt if present
+            storage.remove('movies', new_movie)
+            storage.remove('queue', new_movie)
+
+        # Reload the input screen text box
+        self.input_screen.text_box.load_document()
 
     def _start_director_wheel(self, director_name: str, movies: list):
         """Start the director movie selection wheel."""
@@ -2881,20 +1125,13 @@ class Game:
         """Handle the result of a director/actor wheel spin."""
         print(f"[Wheel] {person_type.title()} wheel result: {person_name} - {movie}")
 
-        # Remove movie from the person's list
-        if person_type == 'director':
-            self.input_screen.remove_movie_from_director(person_name, movie)
-        else:
-            self.input_screen.remove_movie_from_actor(person_name, movie)
-
-        # Add movie to watched
-        watched = []
-        if os.path.exists(self.config.watched_file):
-            with open(self.config.watched_file, 'r', encoding='utf-8') as f:
-                watched = [line.strip() for line in f.read().strip().split('\n') if line.strip()]
-        watched.append(movie)
-        with open(self.config.watched_file, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(watched))
+        # Remove movie from the person's list and add it to watched, together
+        with self.config.storage.transaction():
+            if person_type == 'director':
+                self.input_screen.remove_movie_from_director(person_name, movie)
+            else:
+                self.input_screen.remove_movie_from_actor(person_name, movie)
+            self.config.storage.append('watched', movie)
 
         # Update lockouts (this movie was watched)
         self._update_lockouts_on_movie_watched(movie)
@@ -2902,154 +1139,6 @@ class Game:
         # Return to input screen
         self.state = STATE_INPUT
 
-    def _end_current_heat(self, survivors: list):
-        """Handle end of a heat - advance winners or end tournament."""
-        survivor_names = [b.name for b in survivors]
-
-        # Record heat stats for abilities (skip clones and fragments)
-        real_survivor_names = [b.name for b in survivors if not b.is_clone and not getattr(b, 'barbie_is_fragment', False)]
-        if self.current_heat_participants and not self.is_preliminary:
-            self._record_heat_stats(self.current_heat_participants, real_survivor_names)
-
-        # Handle preliminary round ending
-        if self.is_preliminary:
-            # Determine winner - either last survivor or last eliminated
-            if survivor_names:
-                winner_name = survivor_names[0]
-            elif self.all_eliminated:
-                winner_name = self.all_eliminated[-1]
-            else:
-                winner_name = "Group 1"  # Fallback
-
-            # Extract group index from winner name (e.g., "Group 2 (55 movies)" -> index 1)
-            try:
-                group_num = int(winner_name.split()[1])
-                winning_group_index = group_num - 1
-            except (IndexError, ValueError):
-                winning_group_index = 0
-
-            # Store the winning group's movies
-            self.preliminary_winning_movies = self.preliminary_groups[winning_group_index].copy()
-
-            # Show transition screen
-            self.heat_transition_screen.set_advancers(
-                [winner_name],
-                1,
-                len(self.preliminary_groups),
-                is_to_finals=False,
-                is_preliminary=True,
-                is_preliminary_complete=True
-            )
-            self.pending_start_main_tournament = True
-            self.sim_auto_advance_timer = 60  # 1 second at 60 FPS
-            self.state = STATE_HEAT_TRANSITION
-            return
-
-        if self.is_finals or len(self.heats) == 1:
-            # Tournament over - we have a winner
-            if survivor_names:
-                self.winner = survivor_names[0]
-                self.victory_screen.set_winner(survivor_names[0])
-            elif self.all_eliminated:
-                self.winner = self.all_eliminated[-1]
-                self.victory_screen.set_winner(self.all_eliminated[-1])
-            else:
-                self.winner = "No Winner"
-                self.victory_screen.set_winner("No Winner")
-            # Record ability stats (only once per tournament)
-            if not self.ability_win_recorded:
-                if self.winner and self.winner != "No Winner":
-                    self._record_ability_win(self.winner)
-                self._record_ability_stats()
-                self.ability_win_recorded = True
-            self.effects.sound.play('victory')
-            self.avatar_manager.sync_with_beyblades(self.beyblades, winner_name=self.winner)
-            self.sim_auto_advance_timer = 60  # 1 second at 60 FPS
-            self.state = STATE_VICTORY
-        else:
-            # Add survivors to heat winners (skip clones and fragments to prevent duplicates)
-            # When Naruto clones or Barbie fragments survive, only the original should advance
-            # Otherwise the clone/fragment would spawn AND the original would create new clones
-            for survivor in survivors:
-                if survivor.is_clone or survivor.barbie_is_fragment:
-                    continue  # Skip clones and fragments
-                # Defensive: also skip if name already in heat_winners (prevents mystery duplicates)
-                if survivor.name in self.heat_winners:
-                    continue
-                self.heat_winners.append(survivor.name)
-
-            # Check if more heats remain
-            if self.current_heat < len(self.heats) - 1:
-                # Show transition screen before next heat
-                self.heat_transition_screen.set_advancers(
-                    survivor_names,
-                    self.current_heat + 1,
-                    len(self.heats),
-                    is_to_finals=False
-                )
-                self.pending_next_heat = self.current_heat + 1
-                self.pending_is_finals = False
-                self.sim_auto_advance_timer = 60  # 1 second at 60 FPS
-                self.state = STATE_HEAT_TRANSITION
-            else:
-                # All heats done - show transition to finals
-                self.heat_transition_screen.set_advancers(
-                    self.heat_winners,
-                    len(self.heats),
-                    len(self.heats),
-                    is_to_finals=True
-                )
-                self.pending_next_heat = 0
-                self.pending_is_finals = True
-                self.sim_auto_advance_timer = 60  # 1 second at 60 FPS
-                self.state = STATE_HEAT_TRANSITION
-
-    def _continue_after_heat(self):
-        """Continue to the next heat or finals after transition screen."""
-        self.eliminated.clear()  # Clear heat eliminations for next heat
-
-        # Handle preliminary round completion - start main tournament with winning group's movies
-        if self.pending_start_main_tournament:
-            self.pending_start_main_tournament = False
-            self.is_preliminary = False
-            self._start_main_tournament_with_movies(self.preliminary_winning_movies)
-            return
-
-        # Normal tournament flow
-        if self.pending_is_finals:
-            self.is_finals = True
-        self._start_heat(self.pending_next_heat)
-        self.state = STATE_BATTLE
-
-    def _start_main_tournament_with_movies(self, movie_list: list):
-        """Start the main tournament using the winning group's movies."""
-        # Reset tournament state for main tournament
-        self.eliminated.clear()
-        self.all_eliminated.clear()
-        self.heat_winners.clear()
-        self.current_heat = 0
-        self.is_finals = False
-
-        movie_list = movie_list.copy()
-
-        # Assign abilities NOW (after preliminary group selection)
-        # This ensures each ability is used once before repeating
-        movie_list = self._assign_abilities_to_movies(movie_list)
-
-        # Set up heats for the main tournament
-        if len(movie_list) <= self.max_per_heat:
-            self.heats = [movie_list]
-        else:
-            self.heats = []
-            for i in range(0, len(movie_list), self.max_per_heat):
-                heat = movie_list[i:i + self.max_per_heat]
-                if heat:
-                    self.heats.append(heat)
-
-        # Start first heat of main tournament
-        self._start_heat(0)
-        self.state = STATE_BATTLE
-
     def _draw_ability_legend(self):
         """Draw a legend showing current movies, their abilities, and descriptions."""
         # Get unique beyblades (excluding clones and fragments for cleaner display)
@@ -3083,9 +1172,9 @@ class Game:
         legend_entries = legend_entries[:max_entries]
 
         # Drawing parameters - doubled font sizes for readability
-        font_name = pygame.font.Font(None, 32)
-        font_desc = pygame.font.Font(None, 24)
-        font_title = pygame.font.Font(None, 36)
+        font_name = get_font(32)
+        font_desc = get_font(24)
+        font_title = get_font(36)
         line_height = 55
         padding = 12
         box_width = 420
@@ -3147,7 +1236,7 @@ class Game:
 
         # Create large font for countdown
         font_size = 150
-        font = pygame.font.Font(None, font_size)
+        font = get_font(font_size)
 
         # Scale effect: start big and shrink, with a pop at the start
         if progress < 0.1:
@@ -3194,8 +1283,8 @@ class Game:
         self.screen.blit(overlay, (0, 0))
 
         # Create large font
-        font_large = pygame.font.Font(None, 100)
-        font_small = pygame.font.Font(None, 50)
+        font_large = get_font(100)
+        font_small = get_font(50)
 
         # Main message
         main_text = "MATRIX RESET"
@@ -3216,7 +1305,7 @@ class Game:
         self.screen.blit(sub_surface, (sub_x, sub_y))
 
         # Add some matrix-style falling characters effect
-        font_matrix = pygame.font.Font(None, 24)
+        font_matrix = get_font(24)
         for i in range(20):
             char = random.choice("01アイウエオカキクケコサシスセソタチツテト")
             char_x = random.randint(0, self.window_width)
@@ -3226,6 +1315,17 @@ class Game:
             self.screen.blit(char_surface, (char_x, char_y))
 
     def draw(self):
+        menu_screen = self._menu_screen()
+        if menu_screen:
+            self._draw_menu_screen(menu_screen)
+            return
+        self._presented_state = self.state
+
+        if self.state == STATE_BATTLE and not self.render_battles:
+            # Nobody is watching pixels: frame_callback sends the battle state instead
+            self._stream_frame(True)
+            return
+
         if self.state == STATE_INPUT:
             self.input_screen.draw(self.screen)
 
@@ -3295,8 +1395,9 @@ class Game:
                     pygame.draw.line(self.screen, (200, 150, 255), (px, py), (int(ex), int(ey)), 2)
 
             # Draw fireballs
-            for fireball in self.fireballs:
-                fx, fy = int(fireball['x']), int(fireball['y'])
+            store = self.projectiles
+            for slot in store.slots(FIREBALL).tolist():
+                fx, fy = int(store.x[slot]), int(store.y[slot])
                 # Outer glow
                 pygame.draw.circle(self.screen, (255, 200, 50), (fx, fy), 12)
                 # Core
@@ -3305,20 +1406,21 @@ class Game:
                 pygame.draw.circle(self.screen, (255, 255, 200), (fx, fy), 4)
 
             # Draw ice trails (underneath everything else, so draw first)
-            for trail in self.ice_trails:
-                tx, ty = int(trail['x']), int(trail['y'])
+            for slot in store.slots(ICE_TRAIL).tolist():
+                tx, ty = int(store.x[slot]), int(store.y[slot])
+                lifetime = int(store.lifetime[slot])
                 # Fade based on lifetime
-                alpha = min(1.0, trail['lifetime'] / 300)
+                alpha = min(1.0, lifetime / 300)
                 # Icy blue color
                 color = (int(100 * alpha), int(180 * alpha), int(220 * alpha))
                 pygame.draw.circle(self.screen, color, (tx, ty), 6)
                 # Sparkle highlight
-                if trail['lifetime'] % 20 < 10:
+                if lifetime % 20 < 10:
                     pygame.draw.circle(self.screen, (200, 240, 255), (tx - 2, ty - 2), 2)
 
             # Draw ice projectiles
-            for ice in self.ice_projectiles:
-                ix, iy = int(ice['x']), int(ice['y'])
+            for slot in store.slots(ICE).tolist():
+                ix, iy = int(store.x[slot]), int(store.y[slot])
                 # Outer glow
                 pygame.draw.circle(self.screen, (100, 180, 220), (ix, iy), 14)
                 # Main body
@@ -3329,11 +1431,11 @@ class Game:
                 pygame.draw.circle(self.screen, (255, 255, 255), (ix - 3, iy - 3), 2)
 
             # Draw grenades in flight
-            for grenade in self.grenades:
-                p = grenade['progress']
+            for slot in store.slots(GRENADE).tolist():
+                p = float(store.progress[slot])
                 # Interpolate position with arc
-                start_x, start_y = grenade['start_x'], grenade['start_y']
-                target_x, target_y = grenade['target_x'], grenade['target_y']
+                start_x, start_y = float(store.x[slot]), float(store.y[slot])
+                target_x, target_y = float(store.target_x[slot]), float(store.target_y[slot])
                 # Linear interpolation for x/y
                 gx = start_x + (target_x - start_x) * p
                 gy = start_y + (target_y - start_y) * p
@@ -3369,11 +1471,11 @@ class Game:
                         pygame.draw.circle(self.screen, (200, 230, 255), (ax, ay), charge_size // 2)
 
             # Draw kamehameha beams
-            for beam in self.kamehameha_beams:
-                start_x, start_y = beam['start_x'], beam['start_y']
-                angle = beam['angle']
-                length = beam['length']
-                width = beam['width']
+            for slot in store.slots(KAMEHAMEHA).tolist():
+                start_x, start_y = float(store.x[slot]), float(store.y[slot])
+                angle = float(store.angle[slot])
+                length = float(store.length[slot])
+                width = KAMEHAMEHA_WIDTH
 
                 # Calculate beam end point
                 end_x = start_x + math.cos(angle) * length
@@ -3397,11 +1499,11 @@ class Game:
                     pygame.draw.circle(self.screen, (200, 230, 255), (int(bx), int(by)), int(segment_width * 0.4))
 
             # Draw water waves
-            for wave in self.water_waves:
-                start_x, start_y = wave['start_x'], wave['start_y']
-                angle = wave['angle']
-                progress = wave['progress']
-                wave_width = wave['width']
+            for slot in store.slots(WATER_WAVE).tolist():
+                start_x, start_y = float(store.x[slot]), float(store.y[slot])
+                angle = float(store.angle[slot])
+                progress = float(store.progress[slot])
+                wave_width = WATER_WAVE_WIDTH
 
                 # Wave travels outward from start position
                 max_distance = ARENA_RADIUS * 2.5
@@ -3478,8 +1580,8 @@ class Game:
                     pygame.draw.arc(self.screen, (255, 220, 0), (tx + 2, ty - 8, 10, 10), 0, 3.14, 2)
 
             # Draw John Wick bullets
-            for bullet in self.bullets:
-                bx, by = int(bullet['x']), int(bullet['y'])
+            for slot in store.slots(BULLET).tolist():
+                bx, by = int(store.x[slot]), int(store.y[slot])
                 pygame.draw.circle(self.screen, (220, 220, 220), (bx, by), 4)
                 pygame.draw.circle(self.screen, (150, 150, 150), (bx, by), 4, 1)
 
@@ -3490,14 +1592,7 @@ class Game:
             alive_count = len(alive_beyblades)
             total_count = len(self.beyblades)
             survivor_names = [b.name for b in alive_beyblades]
-            heat_info = None
-            if self.is_preliminary:
-                heat_info = (f"PRELIMINARY ({len(self.preliminary_groups)} groups)", len(self.preliminary_groups))
-            elif len(self.heats) > 1:
-                if self.is_finals:
-                    heat_info = ("FINALS", len(self.heat_winners))
-                else:
-                    heat_info = (f"Heat {self.current_heat + 1}/{len(self.heats)}", len(self.heats[self.current_heat]))
+            heat_info = self.heat_info()
             self.battle_hud.draw(self.screen, alive_count, total_count, self.eliminated, survivor_names, self.round_number, heat_info)
 
             # Draw ability legend in bottom right
@@ -3560,17 +1655,80 @@ class Game:
         elif self.state == STATE_PERSON_WHEEL_RESULT:
             self.person_wheel_result_screen.draw(self.screen)
 
-        pygame.display.flip()
+        self._present()
+        self._stream_frame(True)
 
-        # Call frame callback for web streaming
-        if self.frame_callback:
-            self.frame_callback(self.screen)
+    def _draw_menu_screen(self, menu_screen):
+        """Repaint only what changed on a mostly static screen.
+
+        Unchanged frames skip drawing, presenting and streaming entirely.
+        Partial changes are redrawn with the screen clipped to the union of
+        the dirty rects, and only those rects are pushed to the display.
+        """
+        if self._presented_state != self.state:
+            menu_screen.dirty.mark_all()
+            self._presented_state = self.state
+        full, rects = menu_screen.dirty.take()
+
+        if full:
+            menu_screen.draw(self.screen)
+            self._present()
+        elif rects:
+            self.screen.set_clip(rects[0].unionall(rects[1:]))
+            menu_screen.draw(self.screen)
+            self.screen.set_clip(None)
+            self._present(rects)
+        self._stream_frame(full or bool(rects))
+
+    def _present(self, rects=None):
+        """Show the frame in the window (all of it, or just `rects`). Web mode has no window."""
+        if self.web_mode:
+            return
+        if rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(rects)
+
+    def _stream_frame(self, changed: bool):
+        """Hand the frame to frame_callback (web streaming) if it changed or was declined last time."""
+        if self.frame_callback and (changed or self._stream_pending):
+            self._stream_pending = self.frame_callback(self.screen) is False
+
+    def _target_fps(self) -> int:
+        """FPS while anything moves or someone is interacting, IDLE_FPS on a still screen."""
+        if self.state not in IDLE_STATES:
+            return FPS  # Battles, wheels, countdowns and transitions always animate
+        if pygame.time.get_ticks() - self._last_input_ticks < IDLE_AFTER_MS:
+            return FPS
+        if self.state == STATE_INPUT and self.input_screen.battle_wheel_spinning:
+            return FPS
+        if self.state == STATE_VICTORY and self.is_simulation:
+            return FPS  # Auto-advance timer counts frames
+        return IDLE_FPS
+
+    def _wait_for_next_frame(self):
+        fps = self._target_fps()
+        if fps == FPS:
+            self.clock.tick(FPS)
+            return
+        # Sleep until the idle frame is due, waking early for any event
+        if self.web_mode:
+            # Every event arrives through inject_event, so block without polling
+            self._input_ready.wait(1 / fps)
+        else:
+            # peek() leaves events queued, so handle_events still sees them in order
+            deadline = pygame.time.get_ticks() + 1000 // fps
+            while not pygame.event.peek() and pygame.time.get_ticks() < deadline:
+                pygame.time.wait(IDLE_POLL_MS)
+        self.clock.tick()
 
     def run(self):
         while self.running:
+            if self.suspend_check:
+                self.suspend_check()
             mouse_clicked = self.handle_events()
             self.update(mouse_clicked)
             self.draw()
-            self.clock.tick(FPS)
+            self._wait_for_next_frame()
 
         pygame.quit()
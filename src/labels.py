@@ -0,0 +1,73 @@
+# Rendered text label cache - names and ability tags drawn above every beyblade
+
+from collections import OrderedDict
+import pygame
+
+LABEL_CACHE_SIZE = 512  # Enough for a 54-top preliminary heat plus Copycat changes
+
+OUTLINE_OFFSETS = [(-1, -1), (-1, 1), (1, -1), (1, 1), (0, -1), (0, 1), (-1, 0), (1, 0)]
+
+
+class LabelCache:
+    """LRU cache of text labels keyed on (style, text, font, colour).
+
+    Each label comes back with its background box or outline already
+    composited, stored with premultiplied alpha, so drawing it is one
+    blit with special_flags=pygame.BLEND_PREMULTIPLIED. A Copycat ability
+    change simply asks for a new key; the stale label ages out.
+    """
+
+    def __init__(self, max_size: int = LABEL_CACHE_SIZE):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._labels: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+
+    def __len__(self):
+        return len(self._labels)
+
+    def _get(self, key: tuple, build) -> pygame.Surface:
+        label = self._labels.get(key)
+        if label is not None:
+            self.hits += 1
+            self._labels.move_to_end(key)
+            return label
+        self.misses += 1
+        label = self._labels[key] = build()
+        if len(self._labels) > self.max_size:
+            self._labels.popitem(last=False)
+        return label
+
+    def boxed(self, text: str, font: pygame.font.Font, color: tuple,
+              background: tuple = (0, 0, 0, 150), padding: tuple = (8, 4)) -> pygame.Surface:
+        """Text on a translucent box `padding` pixels larger than the text."""
+        def build():
+            text_surface = font.render(text, True, color).premul_alpha()
+            width, height = text_surface.get_size()
+            label = pygame.Surface((width + padding[0], height + padding[1]), pygame.SRCALPHA)
+            label.fill(background)
+            label = label.premul_alpha()
+            label.blit(text_surface, (padding[0] // 2, padding[1] // 2), special_flags=pygame.BLEND_PREMULTIPLIED)
+            return label
+        return self._get(('boxed', text, font, color, background, padding), build)
+
+    def outlined(self, text: str, font: pygame.font.Font, color: tuple, outline: tuple = (0, 0, 0)) -> pygame.Surface:
+        """Text with a one-pixel outline on every side (including diagonals)."""
+        def build():
+            shadow_surface = font.render(text, True, outline).premul_alpha()
+            text_surface = font.render(text, True, color).premul_alpha()
+            width, height = text_surface.get_size()
+            label = pygame.Surface((width + 2, height + 2), pygame.SRCALPHA)
+            for dx, dy in OUTLINE_OFFSETS:
+                label.blit(shadow_surface, (1 + dx, 1 + dy), special_flags=pygame.BLEND_PREMULTIPLIED)
+            label.blit(text_surface, (1, 1), special_flags=pygame.BLEND_PREMULTIPLIED)
+            return label
+        return self._get(('outlined', text, font, color, outline), build)
+
+    def clear(self):
+        """Drop every label (the font set changed)."""
+        self._labels.clear()
+
+
+# Shared by every Beyblade.draw call
+label_cache = LabelCache()
@@ -0,0 +1,201 @@
+# Physics helpers shared by the battle engine
+
+import numpy as np
+from .constants import MAX_SPEED, FRICTION, ARENA_SLOPE_STRENGTH
+from .beyblade import check_collision
+
+# Below this many live beyblades the plain pairwise loop is cheaper than building a grid
+BROAD_PHASE_MIN_COUNT = 24
+
+# Below this many eligible beyblades, gathering into arrays costs more than it saves
+VECTOR_PHYSICS_MIN_COUNT = 32
+
+# Abilities that change movement/boundary rules (or act between movement and boundary)
+# always use Beyblade.update / Arena.apply_boundary
+PER_OBJECT_ABILITIES = {'flash', 'luffy', 'amadeus', 'marty_mcfly'}
+
+
+class SpatialHash:
+    """Uniform grid keyed on beyblade radius for collision broad phase.
+
+    The cell size is at least the largest collision distance (two max radii),
+    so any two touching beyblades are always in the same or adjacent cells.
+    """
+
+    def __init__(self, cell_size: float):
+        self.cell_size = cell_size
+        self.cells: dict[tuple, list[int]] = {}
+        self.cell_of: dict[int, tuple] = {}
+
+    def _key(self, x: float, y: float) -> tuple:
+        return (int(x // self.cell_size), int(y // self.cell_size))
+
+    def insert(self, index: int, x: float, y: float):
+        key = self._key(x, y)
+        self.cells.setdefault(key, []).append(index)
+        self.cell_of[index] = key
+
+    def move(self, index: int, x: float, y: float) -> bool:
+        """Re-bucket an entry after it moved. Returns True if its cell changed."""
+        key = self._key(x, y)
+        old_key = self.cell_of[index]
+        if key == old_key:
+            return False
+        self.cells[old_key].remove(index)
+        self.cells.setdefault(key, []).append(index)
+        self.cell_of[index] = key
+        return True
+
+    def nearby(self, x: float, y: float) -> list[int]:
+        """Indices in the 3x3 block of cells around a point."""
+        cx, cy = self._key(x, y)
+        found = []
+        for gx in (cx - 1, cx, cx + 1):
+            for gy in (cy - 1, cy, cy + 1):
+                cell = self.cells.get((gx, gy))
+                if cell:
+                    found.extend(cell)
+        return found
+
+
+def _build_grid(beyblades: list) -> SpatialHash:
+    grid = SpatialHash(2 * max(b.radius for b in beyblades))
+    for index, beyblade in enumerate(beyblades):
+        grid.insert(index, beyblade.x, beyblade.y)
+    return grid
+
+
+def colliding_pairs(beyblades: list):
+    """Yield (b1, b2) for every colliding pair, in the same order as testing
+    each beyblade against every later one in the list.
+
+    Meant to be consumed while resolving: the generator resumes after the
+    caller has resolved a pair, so separation pushes, Reversal swaps and
+    Inflation/Shrinking radius changes are seen by the pairs tested after it,
+    exactly as in the plain nested loop.
+    """
+    count = len(beyblades)
+    if count < 2:
+        return
+    if count < BROAD_PHASE_MIN_COUNT:
+        for i, b1 in enumerate(beyblades):
+            for b2 in beyblades[i+1:]:
+                if check_collision(b1, b2):
+                    yield b1, b2
+        return
+
+    grid = _build_grid(beyblades)
+    for i, b1 in enumerate(beyblades):
+        if not b1.alive:
+            continue
+        candidates = sorted(j for j in grid.nearby(b1.x, b1.y) if j > i)
+        k = 0
+        while k < len(candidates):
+            j = candidates[k]
+            k += 1
+            b2 = beyblades[j]
+            if not check_collision(b1, b2):
+                continue
+
+            yield b1, b2
+
+            # Resolution may have pushed, swapped or resized either beyblade
+            if max(b1.radius, b2.radius) * 2 > grid.cell_size:
+                grid = _build_grid(beyblades)
+                b1_moved = True
+            else:
+                b1_moved = grid.move(i, b1.x, b1.y)
+                grid.move(j, b2.x, b2.y)
+            if b1_moved:
+                candidates = sorted(n for n in grid.nearby(b1.x, b1.y) if n > j)
+                k = 0
+
+
+def step_vector_physics(beyblades: list, arena) -> list:
+    """Movement, friction, speed clamp, rotation, stamina decay and circle-arena
+    boundary for every eligible live beyblade in one vectorized pass.
+
+    Mirrors Beyblade.update followed by Arena._apply_circle_boundary.
+    Positions and velocities are gathered into structure-of-arrays
+    NumPy buffers, stepped, and written back. Returns the beyblades it
+    stepped; the rest (dead tops, PER_OBJECT_ABILITIES, rectangle finals)
+    still need the per-object path.
+    """
+    if arena.finals_mode:
+        return []
+    movers = [b for b in beyblades if b.alive and b.ability not in PER_OBJECT_ABILITIES]
+    count = len(movers)
+    if count < VECTOR_PHYSICS_MIN_COUNT:
+        return []
+
+    x = np.fromiter((b.x for b in movers), float, count)
+    y = np.fromiter((b.y for b in movers), float, count)
+    vx = np.fromiter((b.vx for b in movers), float, count)
+    vy = np.fromiter((b.vy for b in movers), float, count)
+    stamina = np.fromiter((b.stamina for b in movers), float, count)
+    max_stamina = np.fromiter((b.max_stamina for b in movers), float, count)
+    spin_power = np.fromiter((b.spin_power for b in movers), float, count)
+    rotation = np.fromiter((b.rotation for b in movers), float, count)
+
+    # --- Beyblade.update ---
+    x += vx
+    y += vy
+
+    # Friction increases as stamina runs down
+    effective_friction = FRICTION - (1 - stamina / max_stamina) * 0.01
+    vx *= effective_friction
+    vy *= effective_friction
+
+    speed = np.sqrt(vx * vx + vy * vy)
+    too_fast = speed > MAX_SPEED
+    if too_fast.any():
+        scale = np.where(too_fast, MAX_SPEED / np.maximum(speed, 1e-12), 1.0)
+        vx *= scale
+        vy *= scale
+
+    rotation += spin_power * 0.1
+    rotation -= np.where(rotation > 360, 360.0, 0.0)
+
+    stamina -= 0.005
+    worn_out = stamina <= 0
+
+    # --- Arena._apply_circle_boundary (only for tops still spinning) ---
+    dx = x - arena.center_x
+    dy = y - arena.center_y
+    dist = np.sqrt(dx * dx + dy * dy)
+    arena_radius = arena.effective_radius
+    in_play = ~worn_out & (dist != 0)
+    safe_dist = np.where(dist != 0, dist, 1.0)
+    nx = dx / safe_dist
+    ny = dy / safe_dist
+
+    # Bowl slope pulls toward the center
+    edge_proximity = dist / arena_radius
+    slope_force = np.where(in_play, ARENA_SLOPE_STRENGTH * edge_proximity ** 1.5, 0.0)
+    vx -= nx * slope_force
+    vy -= ny * slope_force
+
+    # Tangential force for orbital motion
+    orbiting = in_play & (np.sqrt(vx * vx + vy * vy) > 0.5)
+    cross = vx * nx + vy * ny  # vx * ty - vy * tx with (tx, ty) = (-ny, nx)
+    spin_dir = np.where(cross > 0, 1.0, -1.0)
+    tangent_force = np.where(orbiting, 0.02 * edge_proximity * spin_dir, 0.0)
+    vx += -ny * tangent_force
+    vy += nx * tangent_force
+
+    ring_out = in_play & (dist > arena_radius)
+
+    # Write back, then let the objects handle deaths (explosive triggers etc.)
+    for beyblade, bx, by, bvx, bvy, bstamina, brotation, dead, out in zip(
+            movers, x.tolist(), y.tolist(), vx.tolist(), vy.tolist(),
+            stamina.tolist(), rotation.tolist(), worn_out.tolist(), ring_out.tolist()):
+        beyblade.x = bx
+        beyblade.y = by
+        beyblade.vx = bvx
+        beyblade.vy = bvy
+        beyblade.stamina = bstamina
+        beyblade.rotation = brotation
+        if dead or out:
+            beyblade.die()
+
+    return movers
@@ -0,0 +1,146 @@
+# Pooled projectile storage - every fireball, ice shard, trail, grenade, beam, wave and bullet
+
+import numpy as np
+
+# Projectile kinds
+FIREBALL = 0
+ICE = 1
+ICE_TRAIL = 2
+GRENADE = 3
+KAMEHAMEHA = 4
+WATER_WAVE = 5
+BULLET = 6
+KIND_COUNT = 7
+
+KAMEHAMEHA_WIDTH = 30
+KAMEHAMEHA_MAX_LENGTH = 900
+WATER_WAVE_WIDTH = 300
+
+# Float columns shared by all kinds. What each kind keeps in them:
+#   FIREBALL, ICE, BULLET: x, y, vx, vy, lifetime
+#   ICE_TRAIL:             x, y, lifetime
+#   GRENADE:               x, y (thrower), target_x, target_y, progress (0-1 flight, 1 = explode)
+#   KAMEHAMEHA:            x, y (beam start), angle, cos, sin, length, lifetime
+#   WATER_WAVE:            x, y (wave start), angle, cos, sin, progress
+FLOAT_COLUMNS = ('x', 'y', 'vx', 'vy', 'lifetime', 'angle', 'cos', 'sin',
+                 'length', 'progress', 'target_x', 'target_y')
+
+
+class ProjectileStore:
+    """Structure-of-arrays pool with preallocated, typed slots.
+
+    Slots [0, count) are live. Removal swaps the last live slot into the
+    hole, so the pool never fragments; a per-slot spawn sequence number keeps
+    "in spawn order" iteration identical to the old append-only lists.
+    Owners are beyblade field indices (Beyblade.field_index), -1 for none.
+    """
+
+    def __init__(self, capacity: int = 256):
+        self.count = 0
+        self.next_seq = 0
+        self.live = [0] * KIND_COUNT  # Live projectiles per kind, so idle kinds cost nothing
+        self._empty = np.zeros(0, dtype=np.intp)
+        self._allocate(capacity)
+
+    def _allocate(self, capacity: int):
+        self.capacity = capacity
+        for column in FLOAT_COLUMNS:
+            setattr(self, column, np.zeros(capacity, dtype=np.float64))
+        self.kind = np.zeros(capacity, dtype=np.int8)
+        self.owner = np.full(capacity, -1, dtype=np.int32)
+        self.seq = np.zeros(capacity, dtype=np.int64)
+        self.hit_targets = [None] * capacity  # Beams/waves: field indices already hit
+
+    def _grow(self):
+        count = self.count
+        old = {column: getattr(self, column) for column in FLOAT_COLUMNS}
+        kind, owner, seq, hit_targets = self.kind, self.owner, self.seq, self.hit_targets
+        self._allocate(self.capacity * 2)
+        for column, values in old.items():
+            getattr(self, column)[:count] = values[:count]
+        self.kind[:count] = kind[:count]
+        self.owner[:count] = owner[:count]
+        self.seq[:count] = seq[:count]
+        self.hit_targets[:count] = hit_targets[:count]
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        self.hit_targets[:self.count] = [None] * self.count
+        self.count = 0
+        self.live = [0] * KIND_COUNT
+
+    def spawn(self, kind: int, x: float, y: float, owner: int = -1, **columns) -> int:
+        """Claim a slot for a new projectile. Unset columns are zeroed. Returns the slot."""
+        if self.count == self.capacity:
+            self._grow()
+        slot = self.count
+        self.count += 1
+        for column in FLOAT_COLUMNS:
+            getattr(self, column)[slot] = 0.0
+        self.x[slot] = x
+        self.y[slot] = y
+        for column, value in columns.items():
+            getattr(self, column)[slot] = value
+        self.kind[slot] = kind
+        self.live[kind] += 1
+        self.owner[slot] = owner
+        self.seq[slot] = self.next_seq
+        self.next_seq += 1
+        if kind in (KAMEHAMEHA, WATER_WAVE):
+            self.hit_targets[slot] = set()
+        return slot
+
+    def slots(self, kind: int) -> np.ndarray:
+        """Live slots of one kind, oldest first."""
+        if not self.live[kind]:
+            return self._empty
+        found = (self.kind[:self.count] == kind).nonzero()[0]
+        if len(found) > 1:
+            found = found[np.argsort(self.seq[found], kind='stable')]
+        return found
+
+    def advance(self, slots: np.ndarray):
+        """Move the given projectiles one frame along their velocity and age them."""
+        self.x[slots] += self.vx[slots]
+        self.y[slots] += self.vy[slots]
+        self.lifetime[slots] -= 1
+
+    def within(self, slots: np.ndarray, bx: np.ndarray, by: np.ndarray, reach: np.ndarray) -> np.ndarray:
+        """Hit matrix: [i, j] is True when beyblade j is closer than reach[j] to projectile slots[i]."""
+        dx = bx[None, :] - self.x[slots][:, None]
+        dy = by[None, :] - self.y[slots][:, None]
+        return np.sqrt(dx * dx + dy * dy) < reach[None, :]
+
+    def reflect(self, slot: int, owner: int, lifetime: int):
+        """Marty Mauser: send a projectile back the way it came under a new owner."""
+        self.vx[slot] = -self.vx[slot]
+        self.vy[slot] = -self.vy[slot]
+        self.owner[slot] = owner
+        self.lifetime[slot] = lifetime
+
+    def remove(self, slots):
+        """Swap-remove slots, filling each hole with the current last live slot."""
+        for slot in sorted(set(int(s) for s in slots), reverse=True):
+            last = self.count - 1
+            self.live[self.kind[slot]] -= 1
+            if slot != last:
+                for column in FLOAT_COLUMNS:
+                    values = getattr(self, column)
+                    values[slot] = values[last]
+                self.kind[slot] = self.kind[last]
+                self.owner[slot] = self.owner[last]
+                self.seq[slot] = self.seq[last]
+                self.hit_targets[slot] = self.hit_targets[last]
+            self.hit_targets[last] = None
+            self.count = last
+
+
+def gather_positions(beyblades: list) -> tuple:
+    """Position and radius arrays for every beyblade on the field, in list order."""
+    count = len(beyblades)
+    bx = np.fromiter((b.x for b in beyblades), float, count)
+    by = np.fromiter((b.y for b in beyblades), float, count)
+    radius = np.fromiter((b.radius for b in beyblades), float, count)
+    return bx, by, radius
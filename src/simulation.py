@@ -0,0 +1,90 @@
+# Monte Carlo tournament runner - plays many headless tournaments across a process pool
+
+import os
+import random
+import time
+from multiprocessing import Pool
+from .config import ModeConfig
+from .engine import BattleEngine
+
+STAT_FIELDS = ('tournament_wins', 'heat_wins', 'heats_participated', 'games_entered')
+
+
+def load_movie_list(filepath: str) -> list:
+    """Read a movie list file (one title per line, blank lines ignored)."""
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def _run_batch(job):
+    """Worker entry point: play a batch of tournaments and return the in-memory counters."""
+    mode, movies, count, seed = job
+    random.seed(seed)
+    engine = BattleEngine(ModeConfig(mode), persist_stats=False)
+    for _ in range(count):
+        engine.run_tournament(list(movies))
+    return engine.ability_stats, engine.ability_wins
+
+
+def merge_counters(results, ability_stats=None, ability_wins=None):
+    """Merge (ability_stats, ability_wins) pairs into one set of totals in a single pass."""
+    ability_stats = ability_stats if ability_stats is not None else {}
+    ability_wins = ability_wins if ability_wins is not None else {}
+    for batch_stats, batch_wins in results:
+        for ability, stats in batch_stats.items():
+            totals = ability_stats.setdefault(ability, {field: 0 for field in STAT_FIELDS})
+            for field in STAT_FIELDS:
+                totals[field] = totals.get(field, 0) + stats.get(field, 0)
+        for ability, count in batch_wins.items():
+            ability_wins[ability] = ability_wins.get(ability, 0) + count
+    return ability_stats, ability_wins
+
+
+def run_simulations(config, movies: list, count: int, workers: int = None, seed: int = None, save: bool = True):
+    """Play `count` full tournaments of `movies` across `workers` processes.
+
+    Each tournament goes through the real start_battle -> heats -> finals flow
+    (with preliminary groups when there are more than 54 movies). Returns the
+    merged (ability_stats, ability_wins) counters for this run; with save=True
+    they are also added to the mode's abilitystats/abilitywins files.
+    """
+    workers = max(1, workers or os.cpu_count() or 1)
+    if seed is None:
+        seed = random.randrange(2**32)
+
+    # Split tournaments into one batch per worker
+    batch_sizes = [count // workers + (1 if i < count % workers else 0) for i in range(workers)]
+    jobs = [(config.mode, movies, size, seed + i) for i, size in enumerate(batch_sizes) if size > 0]
+
+    start = time.time()
+    if len(jobs) == 1:
+        results = [_run_batch(jobs[0])]
+    else:
+        with Pool(len(jobs)) as pool:
+            results = pool.map(_run_batch, jobs)
+    ability_stats, ability_wins = merge_counters(results)
+    print(f"[Simulate] {count} tournaments of {len(movies)} movies on {len(jobs)} workers "
+          f"in {time.time() - start:.1f}s")
+
+    if save:
+        # Add this run's counters to the recorded totals and write each file once
+        engine = BattleEngine(config)
+        merged_stats, merged_wins = merge_counters(
+            [(ability_stats, ability_wins)],
+            engine._load_ability_stats(), engine._load_ability_wins()
+        )
+        with config.storage.transaction():
+            engine._save_ability_stats(merged_stats)
+            engine._save_ability_wins(merged_wins)
+
+    return ability_stats, ability_wins
+
+
+def print_summary(ability_stats: dict, count: int, top: int = 15):
+    """Print the abilities with the highest tournament win rate for this run."""
+    ranked = sorted(ability_stats.items(), key=lambda item: item[1]['tournament_wins'], reverse=True)
+    print(f"{'Ability':<24}{'Wins':>8}{'Win %':>8}{'Heat W':>8}{'Heats':>8}{'Games':>8}")
+    for ability, stats in ranked[:top]:
+        win_pct = 100 * stats['tournament_wins'] / count if count else 0
+        print(f"{ability:<24}{stats['tournament_wins']:>8}{win_pct:>7.1f}%{stats['heat_wins']:>8}"
+              f"{stats['heats_participated']:>8}{stats['games_entered']:>8}")
@@ -0,0 +1,100 @@
+# Pre-rendered beyblade bodies - one blit per top instead of six draw calls
+
+import math
+from collections import OrderedDict
+import pygame
+from .constants import WHITE
+
+ROTATION_BUCKETS = 60  # Frames per 120 degrees (the three spokes repeat every 120)
+SPOKE_PERIOD = 120
+SPRITE_CACHE_KEYS = 256  # (colour, radius, flash) combinations kept before the oldest is dropped
+
+COLORKEY_CANDIDATES = [(255, 0, 255), (0, 255, 255), (1, 2, 3)]
+
+
+def _rotation_bucket(rotation: float) -> int:
+    return int((rotation % SPOKE_PERIOD) * ROTATION_BUCKETS / SPOKE_PERIOD) % ROTATION_BUCKETS
+
+
+def _draw_body(surface: pygame.Surface, color: tuple, flash: bool, radius: int, x: int, y: int, rotation: float):
+    """Outer ring, darker centre, three spinning spokes, centre dot and white rim."""
+    # Knockout flash effect
+    if flash:
+        alpha_color = tuple(min(255, c + 100) for c in color)
+    else:
+        alpha_color = color
+
+    # Draw outer ring
+    pygame.draw.circle(surface, alpha_color, (x, y), radius)
+
+    # Draw inner details (spinning pattern)
+    inner_radius = radius - 4
+    if inner_radius > 5:
+        # Darker center
+        center_color = tuple(max(0, c - 60) for c in color)
+        pygame.draw.circle(surface, center_color, (x, y), inner_radius)
+
+        # Spinning spokes
+        num_spokes = 3
+        for i in range(num_spokes):
+            angle = math.radians(rotation + i * (360 / num_spokes))
+            spoke_len = inner_radius - 3
+            end_x = x + math.cos(angle) * spoke_len
+            end_y = y + math.sin(angle) * spoke_len
+            pygame.draw.line(surface, alpha_color, (x, y), (end_x, end_y), 3)
+
+        # Center circle
+        pygame.draw.circle(surface, alpha_color, (x, y), 5)
+
+    # Draw rim highlight
+    pygame.draw.circle(surface, WHITE, (x, y), radius, 2)
+
+
+class BeybladeSpriteAtlas:
+    """Beyblade bodies pre-rendered per (colour, radius, knockout flash), each
+    with ROTATION_BUCKETS pre-rotated frames.
+
+    Frames are drawn lazily the first time a rotation bucket is needed, so a
+    top that changes size (Inflation, Shrinking, Giant, Tiny) just starts a new
+    entry; the least recently used entries are dropped past SPRITE_CACHE_KEYS.
+    """
+
+    def __init__(self, max_keys: int = SPRITE_CACHE_KEYS):
+        self.max_keys = max_keys
+        self._frames: OrderedDict[tuple, list] = OrderedDict()
+
+    def __len__(self):
+        return len(self._frames)
+
+    def get(self, color: tuple, radius: int, flash: bool, rotation: float) -> pygame.Surface:
+        """The body sprite, 2*radius square, to blit at (x - radius, y - radius)."""
+        key = (color, radius, flash)
+        frames = self._frames.get(key)
+        if frames is None:
+            frames = self._frames[key] = [None] * ROTATION_BUCKETS
+            if len(self._frames) > self.max_keys:
+                self._frames.popitem(last=False)
+        else:
+            self._frames.move_to_end(key)
+
+        bucket = _rotation_bucket(rotation)
+        sprite = frames[bucket]
+        if sprite is None:
+            sprite = frames[bucket] = self._render(color, radius, flash, bucket * SPOKE_PERIOD / ROTATION_BUCKETS)
+        return sprite
+
+    def _render(self, color: tuple, radius: int, flash: bool, rotation: float) -> pygame.Surface:
+        used = {color, tuple(min(255, c + 100) for c in color), tuple(max(0, c - 60) for c in color), WHITE}
+        colorkey = next(c for c in COLORKEY_CANDIDATES if c not in used)
+        sprite = pygame.Surface((radius * 2, radius * 2))
+        sprite.fill(colorkey)
+        _draw_body(sprite, color, flash, radius, radius, radius, rotation)
+        sprite.set_colorkey(colorkey, pygame.RLEACCEL)
+        return sprite
+
+    def clear(self):
+        self._frames.clear()
+
+
+# Shared by every Beyblade.draw call
+beyblade_sprites = BeybladeSpriteAtlas()
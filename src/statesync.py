@@ -0,0 +1,209 @@
+# Compact battle snapshots - web clients that draw the arena themselves get state, not pixels
+
+import struct
+import numpy as np
+from .constants import (
+    BEYBLADE_COLORS, ABILITIES, AVATAR_ABILITIES, UI_BG, DARK_GRAY, ARENA_FLOOR, ARENA_EDGE, ARENA_RIM,
+    ARENA_RADIUS
+)
+from .projectiles import GRENADE, KAMEHAMEHA, WATER_WAVE, ICE_TRAIL, KAMEHAMEHA_WIDTH, WATER_WAVE_WIDTH
+
+COORD_SCALE = 4  # Positions are sent in quarter pixels as int16 (+/- 8191 px)
+ANGLE_SCALE = 10000  # Radians as int16
+PROGRESS_SCALE = 10000  # 0-1 as int16
+NO_INDEX = 255  # Colour or ability not in the tables (or no ability)
+
+ABILITY_KEYS = list(ABILITIES)
+ABILITY_INDEX = {key: i for i, key in enumerate(ABILITY_KEYS)}
+COLOR_INDEX = {color: i for i, color in enumerate(BEYBLADE_COLORS)}
+
+# Snapshot (little-endian): header, then beyblades, projectiles, markers and
+# avatars as packed records. Counts are in the header; avatars are one per
+# beyblade, in the same order, with state 0 where a top has no avatar.
+#   header: frame (uint32), roster version (uint16), flags (uint8),
+#           countdown timer (uint8), arena centre x/y (int16), radius (uint16),
+#           finals rect left/top/right/bottom and closing left/right (int16),
+#           beyblade, projectile and marker counts (uint16)
+SNAPSHOT_HEADER = struct.Struct('<IHBBhhH6h3H')
+FLAG_FINALS = 1
+FLAG_PRELIMINARY = 2
+FLAG_EDGES_CLOSING = 4
+FLAG_COUNTDOWN = 8
+
+# Beyblade flags
+TOP_ALIVE = 1
+TOP_VISIBLE = 2  # Alive, or still flashing after a knockout
+TOP_FLASH = 4
+
+BEYBLADE_RECORD = np.dtype([('x', '<i2'), ('y', '<i2'), ('radius', 'u1'), ('color', 'u1'),
+                            ('stamina', 'u1'), ('ability', 'u1'), ('flags', 'u1'), ('rotation', 'u1')])
+
+# Projectile fields a, b, c by kind (kinds as in projectiles.py):
+#   GRENADE: target x, target y, progress   KAMEHAMEHA: angle, length, -
+#   WATER_WAVE: angle, -, progress          ICE_TRAIL: lifetime, -, -
+PROJECTILE_RECORD = np.dtype([('kind', 'u1'), ('x', '<i2'), ('y', '<i2'),
+                              ('a', '<i2'), ('b', '<i2'), ('c', '<i2')])
+
+# Markers: everything on the field that is just a position and a size
+MARKER_PORTAL = 0
+MARKER_BLACK_HOLE = 1
+MARKER_NAIL = 2
+MARKER_BANANA = 3
+MARKER_BUMPER = 4
+MARKER_OBELISK = 5
+MARKER_RECORD = np.dtype([('kind', 'u1'), ('x', '<i2'), ('y', '<i2'), ('size', 'u1')])
+
+AVATAR_RECORD = np.dtype([('x', '<i2'), ('y', '<i2'), ('state', 'u1'), ('charge', 'u1')])
+
+
+def _quantize(values) -> np.ndarray:
+    return np.clip(np.round(np.asarray(values, dtype=np.float64) * COORD_SCALE), -32768, 32767)
+
+
+def _byte(value: float) -> int:
+    return max(0, min(255, int(value)))
+
+
+class BattleStateEncoder:
+    """Packs the battle engine's state into one snapshot per frame.
+
+    Names, colours and ability names never go in a snapshot. They live in
+    the roster, which is rebuilt (and its version bumped) whenever the field
+    or the heat title changes; clients fetch it when a snapshot carries a
+    version they have not seen.
+    """
+
+    def __init__(self):
+        self.version = 0
+        self._roster_key = None
+        self._roster = self._build_roster([], None)
+        self.snapshots = 0
+        self.bytes_packed = 0
+
+    def roster(self) -> dict:
+        """Names, tables and heat title for the current roster version."""
+        return self._roster
+
+    def _build_roster(self, names: list, title) -> dict:
+        return {
+            'version': self.version,
+            'names': names,
+            'title': title,
+            'coord_scale': COORD_SCALE,
+            'angle_scale': ANGLE_SCALE,
+            'progress_scale': PROGRESS_SCALE,
+            'colors': BEYBLADE_COLORS,
+            'abilities': [{'name': ABILITIES[key]['name'], 'color': ABILITIES[key]['color'],
+                           'avatar': key in AVATAR_ABILITIES} for key in ABILITY_KEYS],
+            'theme': {'background': UI_BG, 'shadow': DARK_GRAY, 'floor': ARENA_FLOOR,
+                      'edge': ARENA_EDGE, 'rim': ARENA_RIM},
+            'kamehameha_width': KAMEHAMEHA_WIDTH,
+            'water_wave_width': WATER_WAVE_WIDTH,
+            'water_wave_distance': ARENA_RADIUS * 2.5,
+        }
+
+    def encode(self, engine) -> bytes:
+        """Snapshot of the current battle frame (call on the game thread)."""
+        beyblades = engine.beyblades
+        title = engine.heat_info()
+        roster_key = (tuple(b.name for b in beyblades), title)
+        if roster_key != self._roster_key:
+            self._roster_key = roster_key
+            self.version = (self.version + 1) & 0xFFFF
+            self._roster = self._build_roster(list(roster_key[0]), title and title[0])
+
+        arena = engine.arena
+        flags = ((FLAG_FINALS if arena.finals_mode else 0)
+                 | (FLAG_PRELIMINARY if arena.preliminary_mode else 0)
+                 | (FLAG_EDGES_CLOSING if arena.edges_closing else 0)
+                 | (FLAG_COUNTDOWN if engine.countdown_active else 0))
+
+        tops = self._beyblades(beyblades)
+        projectiles = self._projectiles(engine.projectiles)
+        markers = self._markers(engine)
+        avatars = self._avatars(beyblades, engine.avatar_manager.avatars)
+
+        header = SNAPSHOT_HEADER.pack(
+            engine.current_frame & 0xFFFFFFFF, self.version, flags, _byte(engine.countdown_timer),
+            int(arena.center_x), int(arena.center_y), int(arena.effective_radius),
+            int(arena.rect_left), int(arena.rect_top), int(arena.rect_right), int(arena.rect_bottom),
+            int(arena.current_rect_left), int(arena.current_rect_right),
+            len(tops), len(projectiles), len(markers))
+        packet = b''.join((header, tops.tobytes(), projectiles.tobytes(), markers.tobytes(), avatars.tobytes()))
+        self.snapshots += 1
+        self.bytes_packed += len(packet)
+        return packet
+
+    def _beyblades(self, beyblades: list) -> np.ndarray:
+        tops = np.zeros(len(beyblades), dtype=BEYBLADE_RECORD)
+        if not beyblades:
+            return tops
+        tops['x'] = _quantize([b.x for b in beyblades])
+        tops['y'] = _quantize([b.y for b in beyblades])
+        tops['radius'] = [_byte(b.radius) for b in beyblades]
+        tops['color'] = [COLOR_INDEX.get(b.color, NO_INDEX) for b in beyblades]
+        tops['stamina'] = [_byte(255 * b.stamina / b.max_stamina) for b in beyblades]
+        tops['ability'] = [ABILITY_INDEX.get(b.ability, NO_INDEX) for b in beyblades]
+        tops['flags'] = [(TOP_ALIVE | TOP_VISIBLE) if b.alive else
+                         ((TOP_VISIBLE if b.knockout_timer > 0 else 0) | (TOP_FLASH if b.flash_state else 0))
+                         for b in beyblades]
+        tops['rotation'] = [int(b.rotation % 360 * 256 / 360) & 0xFF for b in beyblades]
+        return tops
+
+    def _projectiles(self, store) -> np.ndarray:
+        count = store.count
+        records = np.zeros(count, dtype=PROJECTILE_RECORD)
+        if not count:
+            return records
+        # Oldest first, so overlapping projectiles stack as they do on screen
+        order = np.argsort(store.seq[:count], kind='stable')
+        kind = store.kind[:count][order]
+        records['kind'] = kind
+        records['x'] = _quantize(store.x[:count][order])
+        records['y'] = _quantize(store.y[:count][order])
+
+        a = np.zeros(count)
+        b = np.zeros(count)
+        c = np.zeros(count)
+        grenade = kind == GRENADE
+        a[grenade] = _quantize(store.target_x[:count][order][grenade])
+        b[grenade] = _quantize(store.target_y[:count][order][grenade])
+        angled = (kind == KAMEHAMEHA) | (kind == WATER_WAVE)
+        a[angled] = np.round(np.arctan2(np.sin(store.angle[:count][order][angled]),
+                                        np.cos(store.angle[:count][order][angled])) * ANGLE_SCALE)
+        beam = kind == KAMEHAMEHA
+        b[beam] = _quantize(store.length[:count][order][beam])
+        flight = grenade | (kind == WATER_WAVE)
+        c[flight] = np.round(np.clip(store.progress[:count][order][flight], 0, 1) * PROGRESS_SCALE)
+        trail = kind == ICE_TRAIL
+        a[trail] = np.clip(store.lifetime[:count][order][trail], 0, 32767)
+        records['a'] = a
+        records['b'] = b
+        records['c'] = c
+        return records
+
+    def _markers(self, engine) -> np.ndarray:
+        markers = [(MARKER_PORTAL, p['x'], p['y'], 30) for p in engine.portals]
+        markers += [(MARKER_BLACK_HOLE, h['x'], h['y'], 35) for h in engine.black_holes]
+        markers += [(MARKER_NAIL if t['type'] == 'nail' else MARKER_BANANA, t['x'], t['y'], 10)
+                    for t in engine.traps]
+        markers += [(MARKER_BUMPER, b.x, b.y, b.radius) for b in engine.arena.bumpers]
+        markers += [(MARKER_OBELISK, o.x, o.y, o.height) for o in engine.obelisk_bumpers]
+        records = np.zeros(len(markers), dtype=MARKER_RECORD)
+        if markers:
+            kinds, xs, ys, sizes = zip(*markers)
+            records['kind'] = kinds
+            records['x'] = _quantize(xs)
+            records['y'] = _quantize(ys)
+            records['size'] = [_byte(size) for size in sizes]
+        return records
+
+    def _avatars(self, beyblades: list, avatars: dict) -> np.ndarray:
+        records = np.zeros(len(beyblades), dtype=AVATAR_RECORD)
+        for i, beyblade in enumerate(beyblades):
+            avatar = avatars.get(beyblade.name)
+            if avatar is None:
+                continue
+            records[i] = (_quantize(avatar.x), _quantize(avatar.y), avatar.state.value,
+                          _byte(255 * (1 - avatar.kamehameha_charge_timer / 90)) if avatar.kamehameha_charging else 0)
+        return records
@@ -0,0 +1,270 @@
+# Persistent lists - movies, queue, dockets and stats as named documents, kept in text files or SQLite
+
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+
+# Document name -> the ModeConfig attribute naming its text file (None there: the mode has no such list)
+DOCUMENTS = {
+    'movies': 'movie_file',
+    'queue': 'queue_file',
+    'watched': 'watched_file',
+    'sequels': 'sequel_file',
+    'golden_docket': 'golden_docket_file',
+    'diamond_docket': 'diamond_docket_file',
+    'shit_docket': 'shit_docket_file',
+    'permanent_people': 'permanent_people_file',
+    'people_counter': 'people_counter_file',
+    'ability_wins': 'ability_wins_file',
+    'ability_stats': 'ability_stats_file',
+    'golden_lockout': 'golden_lockout_file',
+    'directors': 'director_file',
+    'actors': 'actor_file',
+}
+
+STORAGE_BACKENDS = ('text', 'sqlite')
+
+
+def _item_key(item: str) -> str:
+    """How list entries are matched: trimmed and case-insensitive, as movie titles always have been."""
+    return item.strip().lower()
+
+
+class Storage(ABC):
+    """A mode's saved lists, each a document of lines in the original text-file format.
+
+    Callers keep parsing their own formats ("Name - Movie", "Name|count");
+    backends only decide where the text lives. move() is the one operation
+    that touches two lists at once, and transaction() groups several writes.
+    """
+
+    def __init__(self, config):
+        self.config = config
+
+    def has_document(self, name: str) -> bool:
+        """Whether this mode keeps the list at all (girlfriend mode has no shit docket)."""
+        return getattr(self.config, DOCUMENTS[name]) is not None
+
+    @abstractmethod
+    def exists(self, name: str) -> bool:
+        """Whether the document has ever been written."""
+
+    @abstractmethod
+    def read_text(self, name: str):
+        """The document's text, or None if it has never been written."""
+
+    @abstractmethod
+    def write_text(self, name: str, text: str):
+        """Replace the document's text."""
+
+    def read_lines(self, name: str) -> list:
+        """Non-blank lines, trimmed."""
+        text = self.read_text(name)
+        if not text:
+            return []
+        return [line.strip() for line in text.split('\n') if line.strip()]
+
+    def write_lines(self, name: str, lines: list):
+        self.write_text(name, '\n'.join(lines))
+
+    def append(self, name: str, item: str):
+        """Add an entry to the end of a list."""
+        lines = self.read_lines(name)
+        lines.append(item)
+        self.write_lines(name, lines)
+
+    def remove(self, name: str, item: str):
+        """Drop every entry matching item (trimmed, case-insensitive) from a list that exists."""
+        if not self.exists(name):
+            return
+        key = _item_key(item)
+        self.write_lines(name, [line for line in self.read_lines(name) if _item_key(line) != key])
+
+    @abstractmethod
+    def move(self, item: str, source: str, destination: str, entry: str = None):
+        """Remove item from source and append entry (default: item) to destination, as one change."""
+
+    @contextmanager
+    def transaction(self):
+        """Group writes so they land together."""
+        yield
+
+    def close(self):
+        pass
+
+
+class TextFileStorage(Storage):
+    """One text file per list, at the paths in ModeConfig (the original layout).
+
+    Each file is replaced atomically, but a move still writes two files; the
+    source goes first, as the game always wrote them, and is only rewritten
+    when the entry was actually on it.
+    """
+
+    def _path(self, name: str):
+        return getattr(self.config, DOCUMENTS[name])
+
+    def exists(self, name: str) -> bool:
+        path = self._path(name)
+        return path is not None and os.path.exists(path)
+
+    def read_text(self, name: str):
+        path = self._path(name)
+        if path is None or not os.path.exists(path):
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+
+    def write_text(self, name: str, text: str):
+        path = self._path(name)
+        if path is None:
+            return
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(temp_path, path)
+
+    def move(self, item: str, source: str, destination: str, entry: str = None):
+        key = _item_key(item)
+        lines = self.read_lines(source)
+        remaining = [line for line in lines if _item_key(line) != key]
+        if len(remaining) < len(lines):
+            self.write_lines(source, remaining)  # Never creates a missing source file
+        self.append(destination, entry if entry is not None else item)
+
+
+class SQLiteStorage(Storage):
+    """Every list in one SQLite database, one row per line.
+
+    Rows carry a trimmed, lower-cased copy of the line, indexed per document,
+    so removing or moving a movie is an indexed delete plus an insert inside
+    one transaction - never a rewrite of two whole files.
+    """
+
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS documents (name TEXT PRIMARY KEY) WITHOUT ROWID",
+        "CREATE TABLE IF NOT EXISTS lines ("
+        " document TEXT NOT NULL, position INTEGER NOT NULL, text TEXT NOT NULL, item TEXT NOT NULL,"
+        " PRIMARY KEY (document, position)) WITHOUT ROWID",
+        "CREATE INDEX IF NOT EXISTS lines_item ON lines (document, item)",
+    )
+
+    def __init__(self, config, path: str):
+        super().__init__(config)
+        self.path = path
+        self.created = not os.path.exists(path)
+        # Autocommit; transaction() issues BEGIN/COMMIT itself. The lock lets the
+        # web server's threads share the connection.
+        self._db = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._lock = threading.RLock()
+        self._depth = 0
+        self._db.execute("PRAGMA journal_mode=WAL")
+        with self.transaction():
+            for statement in self.SCHEMA:
+                self._db.execute(statement)
+
+    @contextmanager
+    def transaction(self):
+        with self._lock:
+            if self._depth == 0:
+                self._db.execute("BEGIN IMMEDIATE")
+            self._depth += 1
+            try:
+                yield
+            except BaseException:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._db.execute("ROLLBACK")
+                raise
+            self._depth -= 1
+            if self._depth == 0:
+                self._db.execute("COMMIT")
+
+    def exists(self, name: str) -> bool:
+        with self._lock:
+            return self._db.execute("SELECT 1 FROM documents WHERE name = ?", (name,)).fetchone() is not None
+
+    def read_text(self, name: str):
+        if not self.exists(name):
+            return None
+        with self._lock:
+            rows = self._db.execute("SELECT text FROM lines WHERE document = ? ORDER BY position", (name,))
+            return '\n'.join(text for text, in rows)
+
+    def read_lines(self, name: str) -> list:
+        with self._lock:
+            rows = self._db.execute("SELECT text FROM lines WHERE document = ? AND item != '' ORDER BY position",
+                                    (name,))
+            return [text.strip() for text, in rows]
+
+    def write_text(self, name: str, text: str):
+        if not self.has_document(name):
+            return
+        with self.transaction():
+            self._db.execute("INSERT OR IGNORE INTO documents (name) VALUES (?)", (name,))
+            self._db.execute("DELETE FROM lines WHERE document = ?", (name,))
+            self._db.executemany("INSERT INTO lines (document, position, text, item) VALUES (?, ?, ?, ?)",
+                                 ((name, i, line, _item_key(line)) for i, line in enumerate(text.split('\n'))))
+
+    def append(self, name: str, item: str):
+        if not self.has_document(name):
+            return
+        with self.transaction():
+            self._db.execute("INSERT OR IGNORE INTO documents (name) VALUES (?)", (name,))
+            # Blank lines go, as they do when a text file is rewritten from read_lines()
+            self._db.execute("DELETE FROM lines WHERE document = ? AND item = ''", (name,))
+            self._db.execute(
+                "INSERT INTO lines (document, position, text, item)"
+                " SELECT ?, COALESCE(MAX(position) + 1, 0), ?, ? FROM lines WHERE document = ?",
+                (name, item, _item_key(item), name))
+
+    def remove(self, name: str, item: str):
+        with self.transaction():
+            self._db.execute("DELETE FROM lines WHERE document = ? AND item IN (?, '')", (name, _item_key(item)))
+
+    def move(self, item: str, source: str, destination: str, entry: str = None):
+        with self.transaction():
+            self.remove(source, item)
+            self.append(destination, entry if entry is not None else item)
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+def import_text_files(config, storage: Storage) -> list:
+    """Copy the mode's existing text files into storage, in one transaction. Returns the documents copied."""
+    files = TextFileStorage(config)
+    copied = []
+    with storage.transaction():
+        for name in DOCUMENTS:
+            text = files.read_text(name)
+            if text is not None:
+                storage.write_text(name, text)
+                copied.append(name)
+    return copied
+
+
+def export_text_files(storage: Storage, config) -> list:
+    """Write every document in storage back to the mode's text files. Returns the documents written."""
+    files = TextFileStorage(config)
+    written = []
+    for name in DOCUMENTS:
+        text = storage.read_text(name)
+        if text is not None and files.has_document(name):
+            files.write_text(name, text)
+            written.append(name)
+    return written
+
+
+def open_storage(config) -> Storage:
+    """The storage backend config.storage_backend names; a new SQLite database starts with the text files' contents."""
+    if config.storage_backend == 'sqlite':
+        storage = SQLiteStorage(config, config.database_file)
+        if storage.created:
+            copied = import_text_files(config, storage)
+            print(f"[Storage] Created {config.database_file} from {len(copied)} text files")
+        return storage
+    return TextFileStorage(config)
@@ -10,6 +10,63 @@ from .constants import (
     DOCKET_SHIT, DOCKET_SHIT_DARK, ABILITIES
 )
 from .config import get_config
+from .labels import label_cache
+
+# A block of pasted text (event.text) for the active text box to insert in one go
+TEXT_INSERT = pygame.event.custom_type()
+
+
+def paste_lines(text: str) -> list:
+    """Pasted text as lines, keeping only printable characters (single-line inputs submit each line)."""
+    lines = text.replace('\r\n', '\n').replace('\r', '\n').split('\n')
+    return [''.join(c for c in line if c.isprintable()) for line in lines]
+
+
+class DirtyRegions:
+    """Which parts of a menu screen changed since it was last presented.
+
+    Screens call watch() from update() with a value describing everything a
+    region's pixels depend on (hover, cursor blink, wheel angle); the region's
+    old and new rects are marked when that value changes. Clicks, typing,
+    scrolling and state changes mark the whole screen with mark_all().
+    """
+
+    def __init__(self):
+        self.full = True
+        self.rects = []
+        self._seen = {}  # key -> (value, rect)
+
+    def mark_all(self):
+        self.full = True
+
+    def mark(self, rect):
+        if not self.full and rect.width > 0 and rect.height > 0:
+            self.rects.append(pygame.Rect(rect))
+
+    def watch(self, key, value, rect):
+        seen = self._seen.get(key)
+        if seen is not None and seen[0] == value:
+            return
+        if seen is not None:
+            self.mark(seen[1])
+        rect = pygame.Rect(rect)
+        self.mark(rect)
+        self._seen[key] = (value, rect)
+
+    def take(self) -> tuple:
+        """(full, rects) changed since the last call, then start clean."""
+        full, rects = self.full, self.rects
+        self.full = False
+        self.rects = []
+        return full, rects
+
+
+def _hovered_rect(rects, mouse_pos: tuple) -> pygame.Rect:
+    """The first rect under the mouse, or an empty rect."""
+    for rect in rects:
+        if rect.collidepoint(mouse_pos):
+            return rect
+    return pygame.Rect(0, 0, 0, 0)
 
 
 class Button:
@@ -41,9 +98,14 @@ class Button:
     def is_clicked(self, mouse_pos: tuple, mouse_pressed: bool) -> bool:
         return self.enabled and self.hovered and mouse_pressed
 
+    def appearance(self) -> tuple:
+        """Everything draw() depends on besides the rect."""
+        return (self.text, self.hovered, self.enabled)
+
 
 class TextBox:
-    def __init__(self, x: int, y: int, width: int, height: int, font: pygame.font.Font, save_path: str = None):
+    def __init__(self, x: int, y: int, width: int, height: int, font: pygame.font.Font,
+                 storage=None, document: str = None):
         self.rect = pygame.Rect(x, y, width, height)
         self.font = font
         self.text = ""
@@ -51,7 +113,8 @@ class TextBox:
         self.cursor_visible = True
         self.cursor_timer = 0
         self.scroll_offset = 0
-        self.save_path = save_path  # File to auto-save to
+        self.storage = storage  # Storage and document name to auto-save to
+        self.document = document
         self._last_saved_text = ""  # Track changes for auto-save
         self.cursor_line = 0  # Which line the cursor is on
         self.cursor_pos = 0   # Position within the line
@@ -145,23 +208,7 @@ class TextBox:
                 try:
                     clipboard_text = pygame.scrap.get(pygame.SCRAP_TEXT)
                     if clipboard_text:
-                        paste_text = clipboard_text.decode('utf-8').rstrip('\x00')
-                        paste_lines = paste_text.split('\n')
-                        # Insert at cursor
-                        line = lines[self.cursor_line]
-                        if len(paste_lines) == 1:
-                            lines[self.cursor_line] = line[:self.cursor_pos] + paste_lines[0] + line[self.cursor_pos:]
-                            self.cursor_pos += len(paste_lines[0])
-                        else:
-                            # Multi-line paste
-                            after_cursor = line[self.cursor_pos:]
-                            lines[self.cursor_line] = line[:self.cursor_pos] + paste_lines[0]
-                            for i, paste_line in enumerate(paste_lines[1:-1], 1):
-                                lines.insert(self.cursor_line + i, paste_line)
-                            lines.insert(self.cursor_line + len(paste_lines) - 1, paste_lines[-1] + after_cursor)
-                            self.cursor_line += len(paste_lines) - 1
-                            self.cursor_pos = len(paste_lines[-1])
-                        text_changed = True
+                        self.insert_text(clipboard_text.decode('utf-8').rstrip('\x00'))
                 except:
                     pass
             elif event.unicode and event.unicode.isprintable():
@@ -175,6 +222,27 @@ class TextBox:
                 self.text = '\n'.join(lines)
                 self._auto_save()
 
+        if event.type == TEXT_INSERT and self.active:
+            self.insert_text(event.text)
+
+    def insert_text(self, text: str):
+        """Insert a block of text at the cursor as one edit (one auto-save, not one per character)."""
+        paste = paste_lines(text)
+        lines = self.text.split('\n')
+        line = lines[self.cursor_line]
+        after_cursor = line[self.cursor_pos:]
+        lines[self.cursor_line] = line[:self.cursor_pos] + paste[0]
+        if len(paste) > 1:
+            # Multi-line paste
+            lines[self.cursor_line + 1:self.cursor_line + 1] = paste[1:]
+            self.cursor_line += len(paste) - 1
+            self.cursor_pos = len(paste[-1])
+        else:
+            self.cursor_pos += len(paste[0])
+        lines[self.cursor_line] += after_cursor
+        self.text = '\n'.join(lines)
+        self._auto_save()
+
     def _click_to_cursor(self, pos):
         """Position cursor based on click location."""
         lines = self.text.split('\n')
@@ -213,11 +281,10 @@ class TextBox:
             self.scroll_offset = self.cursor_line - max_visible + 1
 
     def _auto_save(self):
-        """Save to file if path is set and text changed."""
-        if self.save_path and self.text != self._last_saved_text:
+        """Save to the document if one is set and text changed."""
+        if self.document and self.text != self._last_saved_text:
             try:
-                with open(self.save_path, 'w', encoding='utf-8') as f:
-                    f.write(self.text)
+                self.storage.write_text(self.document, self.text)
                 self._last_saved_text = self.text
             except:
                 pass
@@ -228,6 +295,11 @@ class TextBox:
             self.cursor_timer = 0
             self.cursor_visible = not self.cursor_visible
 
+    def appearance(self) -> tuple:
+        """Everything draw() depends on besides the rect and colors."""
+        return (self.text, self.active, self.active and self.cursor_visible,
+                self.cursor_line, self.cursor_pos, self.scroll_offset)
+
     def draw(self, screen: pygame.Surface, bg_color=None, text_color=None, show_count=True):
         # Background - use custom or default
         bg = bg_color if bg_color else UI_PANEL
@@ -316,19 +388,18 @@ class TextBox:
         entries = [line.strip() for line in lines if line.strip()]
         return entries
 
-    def load_from_file(self, filepath: str) -> bool:
-        """Load text from file. Returns True if successful."""
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                self.text = f.read()
-            self._last_saved_text = self.text  # Mark as saved
-            # Position cursor at end
-            lines = self.text.split('\n')
-            self.cursor_line = len(lines) - 1
-            self.cursor_pos = len(lines[-1]) if lines else 0
-            return True
-        except FileNotFoundError:
+    def load_document(self) -> bool:
+        """Load text from the auto-save document. Returns True if it exists."""
+        text = self.storage.read_text(self.document) if self.document else None
+        if text is None:
             return False
+        self.text = text
+        self._last_saved_text = self.text  # Mark as saved
+        # Position cursor at end
+        lines = self.text.split('\n')
+        self.cursor_line = len(lines) - 1
+        self.cursor_pos = len(lines[-1]) if lines else 0
+        return True
 
 
 class InputScreen:
@@ -339,9 +410,9 @@ class InputScreen:
         self.window_height = WINDOW_HEIGHT
         center_x = WINDOW_WIDTH // 2
 
-        self.text_box = TextBox(center_x - 300, 150, 600, 450, fonts['small'], save_path=self.config.movie_file)
-        if os.path.exists(self.config.movie_file):
-            self.text_box.load_from_file(self.config.movie_file)
+        self.text_box = TextBox(center_x - 300, 150, 600, 450, fonts['small'],
+                                storage=self.config.storage, document='movies')
+        self.text_box.load_document()
         self.battle_button = Button(center_x - 100, 620, 200, 50, "BATTLE!", fonts['medium'])
 
         # Queue Battle button (below main battle button)
@@ -426,6 +497,8 @@ class InputScreen:
         self.director_input = TextBox(565, 512, 230, 42, fonts['tiny'])
         self.load_directors()
 
+        self.dirty = DirtyRegions()
+
     def update_layout(self, window_width: int, window_height: int):
         """Update positions based on new window size."""
         self.window_width = window_width
@@ -465,34 +538,21 @@ class InputScreen:
         self.sequel_add_button.rect = pygame.Rect(sequel_panel_x + 250, sequel_input_y, 40, 42)
 
     def handle_event(self, event: pygame.event.Event):
-        # Check for Enter key in sequel input BEFORE passing to text box
+        # Check for Enter key in the single-line inputs BEFORE passing to text box
         # (to prevent newline from being added)
         if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
-            if self.sequel_input.active:
-                text = self.sequel_input.text.strip()
-                if text:
-                    self.add_sequel(text)
-                    self.sequel_input.text = ""
-                    self.sequel_input.cursor_pos = 0
-                    self.sequel_input.cursor_line = 0
+            if self._submit_line_input():
                 return  # Don't pass Enter to text boxes
-            if self.director_input.active:
-                text = self.director_input.text.strip()
-                print(f"[Input] Enter pressed in director_input, text='{text}'")
-                if text:
-                    self.add_director_from_paste(text)
-                    self.director_input.text = ""
-                    self.director_input.cursor_pos = 0
-                    self.director_input.cursor_line = 0
-                return
-            if self.actor_input.active:
-                text = self.actor_input.text.strip()
-                print(f"[Input] Enter pressed in actor_input, text='{text}'")
-                if text:
-                    self.add_actor_from_paste(text)
-                    self.actor_input.text = ""
-                    self.actor_input.cursor_pos = 0
-                    self.actor_input.cursor_line = 0
+
+        # Pasted lines go into a single-line input one at a time, each submitted as if Enter was pressed
+        if event.type == TEXT_INSERT:
+            line_input = self._active_line_input()
+            if line_input:
+                *complete_lines, last_line = paste_lines(event.text)
+                for line in complete_lines:
+                    line_input.insert_text(line)
+                    self._submit_line_input()
+                line_input.insert_text(last_line)
                 return
 
         self.text_box.handle_event(event)
@@ -500,6 +560,44 @@ class InputScreen:
         self.director_input.handle_event(event)
         self.actor_input.handle_event(event)
 
+    def _active_line_input(self):
+        """The active sequel, director or actor input, if any (Enter submits these)."""
+        for line_input in (self.sequel_input, self.director_input, self.actor_input):
+            if line_input.active:
+                return line_input
+        return None
+
+    def _submit_line_input(self) -> bool:
+        """Enter in a single-line input: add its sequel, director or actor and clear it.
+        Returns False if none of them is active."""
+        if self.sequel_input.active:
+            text = self.sequel_input.text.strip()
+            if text:
+                self.add_sequel(text)
+                self.sequel_input.text = ""
+                self.sequel_input.cursor_pos = 0
+                self.sequel_input.cursor_line = 0
+            return True
+        if self.director_input.active:
+            text = self.director_input.text.strip()
+            print(f"[Input] Enter pressed in director_input, text='{text}'")
+            if text:
+                self.add_director_from_paste(text)
+                self.director_input.text = ""
+                self.director_input.cursor_pos = 0
+                self.director_input.cursor_line = 0
+            return True
+        if self.actor_input.active:
+            text = self.actor_input.text.strip()
+            print(f"[Input] Enter pressed in actor_input, text='{text}'")
+            if text:
+                self.add_actor_from_paste(text)
+                self.actor_input.text = ""
+                self.actor_input.cursor_pos = 0
+                self.actor_input.cursor_line = 0
+            return True
+        return False
+
     def update(self, mouse_pos: tuple) -> tuple:
         """Returns (should_start, movie_list)"""
         self.text_box.update()
@@ -543,8 +641,37 @@ class InputScreen:
         if self.error_timer > 0:
             self.error_timer -= 1
 
+        self._track_dirty(mouse_pos)
         return (False, [])
 
+    def _track_dirty(self, mouse_pos: tuple):
+        """Mark the regions whose look changed this frame (hover, cursor blink, wheel)."""
+        dirty = self.dirty
+        for name in ('battle_button', 'queue_battle_button', 'sequel_battle_button', 'spin_button',
+                     'docket_button', 'quit_button', 'simulate_button', 'sequel_add_button'):
+            button = getattr(self, name)
+            dirty.watch(name, button.appearance(), button.rect)
+        for name in ('text_box', 'sequel_input', 'director_input', 'actor_input'):
+            text_box = getattr(self, name)
+            dirty.watch(name, text_box.appearance(), text_box.rect)
+
+        # Panel item hover highlights (rects are laid out by the last draw)
+        for name, rects in (('queue_hover', self.queue_rects), ('sequel_hover', self.sequel_rects),
+                            ('actor_hover', [rect for rect, _, _ in self.actor_rects]),
+                            ('director_hover', [rect for rect, _, _ in self.director_rects])):
+            hovered = _hovered_rect(rects, mouse_pos)
+            dirty.watch(name, tuple(hovered), hovered)
+
+        # Battle wheel with its title, labels and result line
+        center_x = self.window_width // 2
+        radius = self.battle_wheel_radius
+        wheel_rect = pygame.Rect(center_x - 150, self.battle_wheel_center_y - radius - 30, 300, 2 * radius + 120)
+        dirty.watch('battle_wheel', (self.battle_wheel_angle, self.battle_wheel_spinning, self.battle_wheel_result),
+                    wheel_rect)
+
+        error_rect = pygame.Rect(0, self.battle_button.rect.bottom + 10, self.window_width, 40)
+        dirty.watch('error', self.error_message if self.error_timer > 0 else "", error_rect)
+
     def check_docket(self, mouse_pos: tuple, mouse_clicked: bool) -> bool:
         """Check if docket button was clicked."""
         return self.docket_button.is_clicked(mouse_pos, mouse_clicked)
@@ -625,37 +752,27 @@ class InputScreen:
     def load_queue(self):
         """Load queue items from queue.txt."""
         self.queue_items = []
-        if os.path.exists(self.config.queue_file):
-            try:
-                with open(self.config.queue_file, 'r', encoding='utf-8') as f:
-                    lines = f.read().strip().split('\n')
-                    self.queue_items = [line.strip() for line in lines if line.strip()]
-            except:
-                pass
+        try:
+            self.queue_items = self.config.storage.read_lines('queue')
+        except:
+            pass
 
     def load_docket_picks(self):
         """Load docket picks from docket files."""
         self.docket_picks = {'golden': [], 'diamond': [], 'shit': []}
-        docket_files = {
-            'golden': self.config.golden_docket_file,
-            'diamond': self.config.diamond_docket_file,
-        }
+        docket_types = ['golden', 'diamond']
         if self.config.has_shit_docket:
-            docket_files['shit'] = self.config.shit_docket_file
-        for docket_type, filepath in docket_files.items():
-            if filepath and os.path.exists(filepath):
-                try:
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        lines = f.read().strip().split('\n')
-                        for line in lines:
-                            line = line.strip()
-                            if line and ' - ' in line:
-                                parts = line.split(' - ', 1)
-                                if len(parts) == 2:
-                                    name, movie = parts[0].strip(), parts[1].strip()
-                                    self.docket_picks[docket_type].append((name, movie))
-                except:
-                    pass
+            docket_types.append('shit')
+        for docket_type in docket_types:
+            try:
+                for line in self.config.storage.read_lines(f'{docket_type}_docket'):
+                    if ' - ' in line:
+                        parts = line.split(' - ', 1)
+                        if len(parts) == 2:
+                            name, movie = parts[0].strip(), parts[1].strip()
+                            self.docket_picks[docket_type].append((name, movie))
+            except:
+                pass
 
     def load_lockouts(self):
         """Load golden docket lockouts from file.
@@ -663,73 +780,62 @@ class InputScreen:
         Simple format: Name|count (count = movies until unlocked)
         """
         self.lockouts = {}
-        if os.path.exists(self.config.golden_lockout_file):
-            try:
-                with open(self.config.golden_lockout_file, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line and '|' in line:
-                            parts = line.split('|')
-                            if len(parts) >= 2:
-                                name = parts[0].strip()
-                                count = int(parts[1].strip())
-                                self.lockouts[name] = count
-            except:
-                pass
+        try:
+            for line in self.config.storage.read_lines('golden_lockout'):
+                if '|' in line:
+                    parts = line.split('|')
+                    if len(parts) >= 2:
+                        name = parts[0].strip()
+                        count = int(parts[1].strip())
+                        self.lockouts[name] = count
+        except:
+            pass
 
     def load_directors(self):
-        """Load director queue from file."""
+        """Load director queue."""
         self.directors = {}
-        if os.path.exists(self.config.director_file):
-            try:
-                with open(self.config.director_file, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line and '|' in line:
-                            parts = line.split('|', 1)
-                            if len(parts) == 2:
-                                name = parts[0].strip()
-                                movies = [m.strip() for m in parts[1].split(',') if m.strip()]
-                                if movies:
-                                    self.directors[name] = movies
-            except:
-                pass
+        try:
+            for line in self.config.storage.read_lines('directors'):
+                if '|' in line:
+                    parts = line.split('|', 1)
+                    if len(parts) == 2:
+                        name = parts[0].strip()
+                        movies = [m.strip() for m in parts[1].split(',') if m.strip()]
+                        if movies:
+                            self.directors[name] = movies
+        except:
+            pass
 
     def save_directors(self):
-        """Save director queue to file."""
+        """Save director queue."""
         lines = []
         for name, movies in self.directors.items():
             if movies:
                 lines.append(f"{name} | {', '.join(movies)}")
-        with open(self.config.director_file, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(lines))
+        self.config.storage.write_lines('directors', lines)
 
     def load_actors(self):
-        """Load actor queue from file."""
+        """Load actor queue."""
         self.actors = {}
-        if os.path.exists(self.config.actor_file):
-            try:
-                with open(self.config.actor_file, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line and '|' in line:
-                            parts = line.split('|', 1)
-                            if len(parts) == 2:
-                                name = parts[0].strip()
-                                movies = [m.strip() for m in parts[1].split(',') if m.strip()]
-                                if movies:
-                                    self.actors[name] = movies
-            except:
-                pass
+        try:
+            for line in self.config.storage.read_lines('actors'):
+                if '|' in line:
+                    parts = line.split('|', 1)
+                    if len(parts) == 2:
+                        name = parts[0].strip()
+                        movies = [m.strip() for m in parts[1].split(',') if m.strip()]
+                        if movies:
+                            self.actors[name] = movies
+        except:
+            pass
 
     def save_actors(self):
-        """Save actor queue to file."""
+        """Save actor queue."""
         lines = []
         for name, movies in self.actors.items():
             if movies:
                 lines.append(f"{name} | {', '.join(movies)}")
-        with open(self.config.actor_file, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(lines))
+        self.config.storage.write_lines('actors', lines)
 
     def add_director_from_paste(self, text: str):
         """Parse pasted text and add director with movies."""
@@ -794,18 +900,14 @@ class InputScreen:
     def load_sequels(self):
         """Load sequel items from sequels.txt."""
         self.sequel_items = []
-        if os.path.exists(self.config.sequel_file):
-            try:
-                with open(self.config.sequel_file, 'r', encoding='utf-8') as f:
-                    lines = f.read().strip().split('\n')
-                    self.sequel_items = [line.strip() for line in lines if line.strip()]
-            except:
-                pass
+        try:
+            self.sequel_items = self.config.storage.read_lines('sequels')
+        except:
+            pass
 
     def save_sequels(self):
         """Save sequel items to sequels.txt."""
-        with open(self.config.sequel_file, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(self.sequel_items))
+        self.config.storage.write_lines('sequels', self.sequel_items)
 
     def add_sequel(self, movie_name: str):
         """Add a movie to the sequel list."""
@@ -839,18 +941,10 @@ class InputScreen:
         """Select a sequel - removes from sequel list and adds to watched."""
         if movie_name in self.sequel_items:
             self.sequel_items.remove(movie_name)
-            self.save_sequels()
-            # Add to watched list
-            watched = []
-            if os.path.exists(self.config.watched_file):
-                try:
-                    with open(self.config.watched_file, 'r', encoding='utf-8') as f:
-                        watched = [line.strip() for line in f.read().strip().split('\n') if line.strip()]
-                except:
-                    pass
-            watched.append(movie_name)
-            with open(self.config.watched_file, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(watched))
+            # Save the sequel list and add to watched list, together
+            with self.config.storage.transaction():
+                self.save_sequels()
+                self.config.storage.append('watched', movie_name)
 
     def check_queue_click(self, mouse_pos: tuple, mouse_clicked: bool) -> str:
         """Check if a queue item was clicked. Returns the item name if clicked, None otherwise."""
@@ -865,9 +959,8 @@ class InputScreen:
         """Remove a movie from the queue and update the file."""
         if movie_name in self.queue_items:
             self.queue_items.remove(movie_name)
-            # Write updated queue to file
-            with open(self.config.queue_file, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(self.queue_items))
+            # Save updated queue
+            self.config.storage.write_lines('queue', self.queue_items)
 
     def draw(self, screen: pygame.Surface):
         screen.fill(self.config.ui_bg)
@@ -1731,6 +1824,8 @@ class LeaderboardScreen:
         self.ability_scroll_offset = 0
         self.ability_panel_rect = None  # Set during draw for scroll hit detection
 
+        self.dirty = DirtyRegions()
+
     def update_layout(self, window_width: int, window_height: int):
         self.window_width = window_width
         self.window_height = window_height
@@ -1743,48 +1838,39 @@ class LeaderboardScreen:
     def load_queue(self):
         """Load queue items from queue.txt."""
         self.queue_items = []
-        if os.path.exists(self.config.queue_file):
-            try:
-                with open(self.config.queue_file, 'r', encoding='utf-8') as f:
-                    lines = f.read().strip().split('\n')
-                    self.queue_items = [line.strip() for line in lines if line.strip()]
-            except:
-                pass
+        try:
+            self.queue_items = self.config.storage.read_lines('queue')
+        except:
+            pass
 
     def load_ability_wins(self):
         """Load ability win counts from file."""
         self.ability_wins = {}
-        if os.path.exists(self.config.ability_wins_file):
-            try:
-                with open(self.config.ability_wins_file, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        line = line.strip()
-                        if ':' in line:
-                            ability, count = line.rsplit(':', 1)
-                            self.ability_wins[ability.strip()] = int(count.strip())
-            except:
-                pass
+        try:
+            for line in self.config.storage.read_lines('ability_wins'):
+                if ':' in line:
+                    ability, count = line.rsplit(':', 1)
+                    self.ability_wins[ability.strip()] = int(count.strip())
+        except:
+            pass
 
     def load_ability_stats(self):
         """Load ability stats from file. Format: ability|tournament_wins|heat_wins|heats_participated|games_entered"""
         self.ability_stats = {}
-        if os.path.exists(self.config.ability_stats_file):
-            try:
-                with open(self.config.ability_stats_file, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        line = line.strip()
-                        if '|' in line:
-                            parts = line.split('|')
-                            if len(parts) >= 4:
-                                ability = parts[0]
-                                self.ability_stats[ability] = {
-                                    'tournament_wins': int(parts[1]),
-                                    'heat_wins': int(parts[2]),
-                                    'heats_participated': int(parts[3]),
-                                    'games_entered': int(parts[4]) if len(parts) >= 5 else 0
-                                }
-            except:
-                pass
+        try:
+            for line in self.config.storage.read_lines('ability_stats'):
+                if '|' in line:
+                    parts = line.split('|')
+                    if len(parts) >= 4:
+                        ability = parts[0]
+                        self.ability_stats[ability] = {
+                            'tournament_wins': int(parts[1]),
+                            'heat_wins': int(parts[2]),
+                            'heats_participated': int(parts[3]),
+                            'games_entered': int(parts[4]) if len(parts) >= 5 else 0
+                        }
+        except:
+            pass
 
     def set_rankings(self, winner: str, eliminated: list, force_choose: bool = False, is_simulation: bool = False):
         """Set rankings from winner (1st) and elimination order (last eliminated = 2nd)."""
@@ -1797,6 +1883,7 @@ class LeaderboardScreen:
         self.load_queue()
         self.load_ability_wins()
         self.load_ability_stats()
+        self.dirty.mark_all()
 
     def update(self, mouse_pos: tuple):
         self.choose_button.update(mouse_pos)
@@ -1806,6 +1893,10 @@ class LeaderboardScreen:
             self.queue_button.update(mouse_pos)
         self.ability_sort_button.update(mouse_pos)
 
+        for name in ('choose_button', 'queue_button', 'play_again_button', 'quit_button', 'ability_sort_button'):
+            button = getattr(self, name)
+            self.dirty.watch(name, button.appearance(), button.rect)
+
     def check_ability_sort_toggle(self, mouse_pos: tuple, mouse_clicked: bool) -> bool:
         """Check if ability sort button was clicked. Returns True if toggled."""
         if self.ability_sort_button.is_clicked(mouse_pos, mouse_clicked):
@@ -2006,7 +2097,8 @@ class LeaderboardScreen:
             content_y = panel_y + 46
             content_height = max_visible * line_height
             clip_rect = pygame.Rect(panel_x, content_y, panel_width, content_height)
-            screen.set_clip(clip_rect)
+            old_clip = screen.get_clip()  # The caller's dirty-rect clip, if it is redrawing part of the screen
+            screen.set_clip(clip_rect.clip(old_clip))
 
             item_y = content_y
             for i in range(self.ability_scroll_offset, min(self.ability_scroll_offset + max_visible, total_abilities)):
@@ -2045,8 +2137,8 @@ class LeaderboardScreen:
 
                 item_y += line_height
 
-            # Reset clip
-            screen.set_clip(None)
+            # Restore the caller's clip
+            screen.set_clip(old_clip)
 
         # Queue panel on the right side (non-clickable)
         if self.queue_items:
@@ -2150,6 +2242,15 @@ class DocketClaimScreen:
                 # Add character
                 if event.unicode and event.unicode.isprintable():
                     self.custom_input.text += event.unicode
+
+        if event.type == TEXT_INSERT and self.custom_input.active:
+            # Pasted text up to the first line break; a line break submits like Enter
+            lines = paste_lines(event.text)
+            self.custom_input.text += lines[0]
+            name = self.custom_input.text.strip()
+            if len(lines) > 1 and name:
+                self.custom_name_submitted = name
+                return True
         return False
 
     def handle_scroll(self, event):
@@ -2328,6 +2429,7 @@ class ParticipantSelectScreen:
                                    color=DOCKET_GOLDEN_DARK, hover_color=DOCKET_GOLDEN)
 
         self.scroll_offset = 0
+        self.dirty = DirtyRegions()
         self._build_layout()
 
     def _build_layout(self):
@@ -2383,6 +2485,16 @@ class ParticipantSelectScreen:
         # Check for pending graduations
         self._update_pending_graduations()
 
+        dirty = self.dirty
+        dirty.watch('start_button', self.start_button.appearance(), self.start_button.rect)
+        dirty.watch('new_name_input', self.new_name_input.appearance(), self.new_name_input.rect)
+        for name, inputs in self.graduation_inputs.items():
+            for docket_type, textbox in inputs.items():
+                dirty.watch((name, docket_type), textbox.appearance(), textbox.rect)
+        rects = [rect for _, rect in self.permanent_rects] + [rect for _, rect, _ in self.recurring_rects]
+        hovered = _hovered_rect(rects, mouse_pos)
+        dirty.watch('hover', tuple(hovered), hovered)
+
     def _update_pending_graduations(self):
         """Check which recurring people will graduate to 5 and need inputs."""
         new_pending = []
@@ -2403,6 +2515,8 @@ class ParticipantSelectScreen:
             if name not in new_pending:
                 del self.graduation_inputs[name]
 
+        if new_pending != self.pending_graduation:
+            self.dirty.mark_all()  # Inputs appear/disappear and the add-person column toggles
         self.pending_graduation = new_pending
 
     def _create_graduation_inputs(self, name: str):
@@ -2439,6 +2553,19 @@ class ParticipantSelectScreen:
                 self.new_name_input.text = ""
             return
 
+        # Pasted names: each complete line is added as if Enter was pressed after it
+        if event.type == TEXT_INSERT and self.new_name_input.active:
+            *complete_lines, last_line = paste_lines(event.text)
+            for line in complete_lines:
+                self.new_name_input.insert_text(line)
+                new_name = self.new_name_input.text.strip()
+                if new_name and new_name not in self.people_counter and new_name not in self.all_permanent:
+                    self._add_new_person(new_name)
+                    self.new_name_input.text = ""
+                    self.new_name_input.cursor_pos = 0
+            self.new_name_input.insert_text(last_line)
+            return
+
         self.new_name_input.handle_event(event)
 
         # Handle graduation inputs
@@ -2629,6 +2756,7 @@ class DocketResultScreen:
         self.needs_replacement = False
         self.replacement_confirmed = False
         self.animation_timer = 0
+        self.dirty = DirtyRegions()
 
     def update_layout(self, window_width: int, window_height: int):
         self.window_width = window_width
@@ -2654,6 +2782,7 @@ class DocketResultScreen:
         self.animation_timer = 0
         # Update layout to ensure rect positions are correct
         self.update_layout(self.window_width, self.window_height)
+        self.dirty.mark_all()
 
     def update(self, mouse_pos: tuple):
         self.animation_timer += 1
@@ -2669,6 +2798,22 @@ class DocketResultScreen:
             self.confirm_button.update(mouse_pos)
             self.confirm_button.enabled = len(self.replacement_input.text.strip()) > 0
 
+        dirty = self.dirty
+        for name in ('title_button', 'quit_button', 'confirm_button'):
+            button = getattr(self, name)
+            dirty.watch(name, button.appearance(), button.rect)
+        dirty.watch('replacement_input', self.replacement_input.appearance(), self.replacement_input.rect)
+
+        # Pulsing glow behind the winner (largest glow is 230px)
+        center_x = self.window_width // 2
+        center_y = self.window_height // 2
+        glow_rect = pygame.Rect(center_x - 230, center_y - 235, 460, 460)
+        dirty.watch('glow', self._glow_size(), glow_rect)
+
+    def _glow_size(self) -> int:
+        pulse = abs((self.animation_timer % 60) - 30) / 30
+        return int(200 + pulse * 30)
+
     def handle_event(self, event):
         """Handle text input events. Returns True if ENTER was pressed to confirm."""
         if self.needs_replacement and not self.replacement_confirmed:
@@ -2677,6 +2822,11 @@ class DocketResultScreen:
                 if self.replacement_input.text.strip():
                     return True  # Signal to confirm
                 return False  # Ignore if empty
+            # Pasted text up to the first line break; a line break confirms like ENTER
+            if event.type == TEXT_INSERT and self.replacement_input.active:
+                lines = paste_lines(event.text)
+                self.replacement_input.insert_text(lines[0])
+                return len(lines) > 1 and bool(self.replacement_input.text.strip())
             # Handle other events normally (but filter out RETURN from TextBox)
             if not (event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN):
                 self.replacement_input.handle_event(event)
@@ -2725,8 +2875,7 @@ class DocketResultScreen:
         center_y = self.window_height // 2
 
         # Pulsing glow
-        pulse = abs((self.animation_timer % 60) - 30) / 30
-        glow_size = int(200 + pulse * 30)
+        glow_size = self._glow_size()
 
         for i in range(4):
             alpha = int(25 - i * 5)
@@ -3128,12 +3277,55 @@ class PersonWheelResultScreen:
         screen.blit(instruction, instruction_rect)
 
 
-def create_fonts() -> dict:
-    pygame.font.init()
-    fonts = {}
-    for name, size in FONT_SIZES.items():
+# Process-wide font registry: (face, size, bold) -> Font, shared by every module
+_font_registry: dict[tuple, pygame.font.Font] = {}
+
+
+def _drop_fonts():
+    """Forget every Font, and the labels drawn with them - they die with the font module."""
+    _font_registry.clear()
+    label_cache.clear()
+
+
+def get_font(size: int, face: str = None, bold: bool = False) -> pygame.font.Font:
+    """Shared Font for (face, size, bold). face=None is pygame's default font,
+    anything else goes through SysFont (falling back to the default font)."""
+    if not pygame.font.get_init():
+        _drop_fonts()  # The font module was quit on its own
+    key = (face, size, bold)
+    font = _font_registry.get(key)
+    if font is None:
+        if not _font_registry:
+            pygame.register_quit(_drop_fonts)  # Runs once, on the next pygame.quit()
+        pygame.font.init()
+        if face is None:
+            font = pygame.font.Font(None, size)
+            font.bold = bold
+        else:
+            try:
+                font = pygame.font.SysFont(face, size, bold=bold)
+            except:
+                font = pygame.font.Font(None, size)
+        _font_registry[key] = font
+    return font
+
+
+def font_registry_stats() -> dict:
+    """Font handles held by the registry plus process memory, for spotting leaks
+    over long-running server sessions."""
+    stats = {'fonts': len(_font_registry), 'rss_kb': None}
+    try:
+        with open('/proc/self/statm') as f:
+            stats['rss_kb'] = int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') // 1024
+    except (OSError, ValueError, AttributeError):
         try:
-            fonts[name] = pygame.font.SysFont('Arial', size, bold=(name in ['title', 'huge', 'large']))
-        except:
-            fonts[name] = pygame.font.Font(None, size)
-    return fonts
+            import resource
+            stats['rss_kb'] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss  # Peak, in KB on Linux
+        except ImportError:
+            pass
+    return stats
+
+
+def create_fonts() -> dict:
+    return {name: get_font(size, 'Arial', bold=(name in ['title', 'huge', 'large']))
+            for name, size in FONT_SIZES.items()}
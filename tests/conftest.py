@@ -0,0 +1,20 @@
+# Shared fixtures: every test runs pygame headless
+
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+import pytest
+
+from src.game import Game
+
+
+@pytest.fixture
+def game(tmp_path, monkeypatch):
+    """A web-mode game (offscreen, no window) saving into an empty directory."""
+    monkeypatch.chdir(tmp_path)
+    game = Game(web_mode=True)
+    yield game
+    pygame.quit()
@@ -0,0 +1,39 @@
+# Partial menu redraws must produce exactly the pixels a full repaint would
+
+import pygame
+
+from src.constants import ABILITIES, STATE_LEADERBOARD
+
+
+def repaint_mismatch(game, screen) -> int:
+    """Pixels where the streamed screen differs from a full repaint of the same state."""
+    reference = game.screen.copy()
+    screen.draw(reference)
+    expected = pygame.surfarray.array3d(reference)
+    actual = pygame.surfarray.array3d(game.screen)
+    return int((expected != actual).any(axis=2).sum())
+
+
+def test_leaderboard_hover_matches_full_repaint(game):
+    # Ability stats make the leaderboard draw its translucent, clipped ability panel
+    game.config.storage.write_lines('ability_stats', [
+        f"{ability}|{i % 3}|{i % 5 + 1}|{i % 7 + 2}|{i % 4 + 1}" for i, ability in enumerate(ABILITIES)])
+    game.config.storage.write_lines('queue', ['Alpha', 'Beta'])
+    names = [f"Movie {i}" for i in range(12)]
+    game.winner = names[0]
+    game.all_eliminated = names[1:]
+    game.leaderboard_screen.set_rankings(game.winner, game.all_eliminated)
+    game.state = STATE_LEADERBOARD
+
+    screen = game.leaderboard_screen
+    buttons = [screen.choose_button, screen.queue_button, screen.play_again_button,
+               screen.quit_button, screen.ability_sort_button]
+    game.draw()  # First frame paints everything
+    # Hovering on and off each button only redraws the button's rect
+    for _ in range(3):
+        for button in buttons:
+            for pos in (button.rect.center, (5, 5)):
+                game._web_mouse_pos = pos
+                game.update(False)
+                game.draw()
+                assert repaint_mismatch(game, screen) == 0
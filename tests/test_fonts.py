@@ -0,0 +1,13 @@
+# The font registry outlives pygame.quit() without handing out dead fonts
+
+import pygame
+
+from src.game import Game
+
+
+def test_game_draws_after_pygame_restart(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    for _ in range(3):  # Twice over, so the registry has to re-arm its quit hook
+        game = Game(web_mode=True)
+        game.draw()
+        pygame.quit()
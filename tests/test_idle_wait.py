@@ -0,0 +1,36 @@
+# An idle frame wait wakes early for input without disturbing the event queue
+
+import threading
+import time
+
+import pygame
+
+from src.constants import IDLE_AFTER_MS, IDLE_FPS, STATE_INPUT
+
+
+def make_idle(game):
+    game.state = STATE_INPUT
+    game._last_input_ticks = pygame.time.get_ticks() - IDLE_AFTER_MS - 1
+    assert game._target_fps() == IDLE_FPS
+
+
+def test_idle_wait_keeps_event_order(game):
+    make_idle(game)
+    pygame.event.clear()
+    for order in range(3):
+        pygame.event.post(pygame.event.Event(pygame.USEREVENT, order=order))
+
+    game._wait_for_next_frame()
+
+    assert [event.order for event in pygame.event.get(pygame.USEREVENT)] == [0, 1, 2]
+
+
+def test_injected_event_wakes_idle_wait(game):
+    make_idle(game)
+    game.handle_events()
+    threading.Timer(0.01, game.inject_event, args=({'type': 'mousemove', 'x': 1, 'y': 2},)).start()
+
+    started = time.perf_counter()
+    game._wait_for_next_frame()
+
+    assert time.perf_counter() - started < 0.5 / IDLE_FPS  # Woke for the input, well before the idle frame
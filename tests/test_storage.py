@@ -0,0 +1,33 @@
+# Moving an entry between lists, in both backends
+
+import pytest
+
+from src.config import set_mode
+from src.storage import Storage
+
+
+@pytest.fixture(params=['text', 'sqlite'])
+def storage(request, tmp_path, monkeypatch):
+    """Each backend over an empty directory."""
+    monkeypatch.chdir(tmp_path)
+    storage = set_mode('default', request.param).storage
+    yield storage
+    storage.close()
+
+
+def test_move_takes_entry_off_source(storage):
+    storage.write_lines('movies', ['Alpha', ' beta ', 'Gamma'])
+    storage.move('Beta', 'movies', 'watched')
+    assert storage.read_lines('movies') == ['Alpha', 'Gamma']
+    assert storage.read_lines('watched') == ['Beta']
+
+
+def test_move_from_missing_source_leaves_it_missing(storage):
+    storage.move('Alpha', 'queue', 'watched')
+    assert not storage.exists('queue')
+    assert storage.read_lines('watched') == ['Alpha']
+
+
+def test_storage_base_cannot_be_built():
+    with pytest.raises(TypeError):
+        Storage(set_mode('default'))
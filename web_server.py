@@ -1,35 +1,43 @@
 #!/usr/bin/env python3
 """
 Web server wrapper for Movie Beyblade Battle.
-Streams the pygame display to web browsers and handles input from them.
+Streams the game's offscreen frames to web browsers and handles input from them.
+No display is needed: the game runs on SDL's dummy video driver.
 """
 
 import os
-import sys
 import io
 import base64
 import time
+import struct
 import threading
+import multiprocessing
+import queue
+from functools import partial
 
 # Must set SDL environment BEFORE importing pygame
-if sys.platform.startswith('linux'):
-    if not os.environ.get('DISPLAY'):
-        print("Warning: No DISPLAY set. Run with 'xvfb-run -a python web_server.py'")
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
 
+import numpy as np
 import pygame
-from flask import Flask, render_template
+from PIL import Image
+from flask import Flask, render_template, request, jsonify
 from flask_socketio import SocketIO, emit
 
 from src.game import Game
-from src.constants import WINDOW_WIDTH, WINDOW_HEIGHT
+from src.config import set_mode
+from src.ui import font_registry_stats
+from src.statesync import BattleStateEncoder
+from src.constants import WINDOW_WIDTH, WINDOW_HEIGHT, STATE_BATTLE
 
 # Create Flask app
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'beyblade-secret'
 socketio = SocketIO(app, cors_allowed_origins="*", async_mode='threading')
 
-# Global state
+# Session worker state - each worker process hosts one Game (see run_session)
 game = None
+outbox = None  # Worker -> server messages: ('frame', ...), ('emit', ...), ('disconnect', sid), ('stats', token, stats)
 web_mouse_pos = [WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2]
 
 # Store original pygame.mouse.get_pos
@@ -40,99 +48,963 @@ def _patched_get_pos():
     return tuple(web_mouse_pos)
 
 
-def frame_to_base64(surface):
-    """Convert pygame surface to base64 JPEG."""
-    try:
-        from PIL import Image
-        data = pygame.image.tobytes(surface, 'RGB')
-        img = Image.frombytes('RGB', surface.get_size(), data)
-        buffer = io.BytesIO()
-        img.save(buffer, format='JPEG', quality=70)
-        buffer.seek(0)
-        return base64.b64encode(buffer.read()).decode('utf-8')
-    except Exception as e:
-        print(f"[ERROR] Frame conversion failed: {e}")
-        return None
+JPEG_QUALITY = 70
 
 
-# Frame rate limiting
+def surface_pixels(surface) -> np.ndarray:
+    """Height x width x 3 RGB copy of a surface."""
+    width, height = surface.get_size()
+    return np.frombuffer(pygame.image.tobytes(surface, 'RGB'), dtype=np.uint8).reshape(height, width, 3)
+
+
+def scaled_pixels(surface, scale: float) -> np.ndarray:
+    """surface_pixels of the surface shrunk by `scale` (1.0 = as is)."""
+    if scale != 1.0:
+        width, height = surface.get_size()
+        surface = pygame.transform.smoothscale(surface, (round(width * scale), round(height * scale)))
+    return surface_pixels(surface)
+
+
+def pixels_to_jpeg(pixels: np.ndarray, quality: int = JPEG_QUALITY) -> bytes:
+    buffer = io.BytesIO()
+    Image.fromarray(pixels).save(buffer, format='JPEG', quality=quality)
+    return buffer.getvalue()
+
+
+# Tile delta packets (little-endian): kind (uint8, 0 = keyframe, 1 = delta), rect
+# count (uint16), then per rect x, y, width, height (uint16 each), JPEG length
+# (uint32) and the JPEG. A keyframe is one rect covering the whole frame.
+TILE_SIZE = 64
+KEYFRAME_INTERVAL = 5.0  # Seconds between full frames, so a missed delta heals
+KEYFRAME_CHANGED_RATIO = 0.6  # Send a keyframe instead once this share of tiles changed
+PACKET_KEYFRAME = 0
+PACKET_DELTA = 1
+PACKET_HEADER = struct.Struct('<BH')
+PACKET_RECT = struct.Struct('<HHHHI')
+
+
+class TileDeltaEncoder:
+    """Encodes only the TILE_SIZE tiles that changed since the last frame sent.
+
+    Tiles are compared on the source pixels, not the decoded JPEG, so
+    compression error never accumulates. Changed tiles next to each other in
+    a tile row go out as one rect.
+    """
+
+    def __init__(self, tile_size: int = TILE_SIZE, keyframe_interval: float = KEYFRAME_INTERVAL,
+                 quality: int = JPEG_QUALITY):
+        self.tile_size = tile_size
+        self.keyframe_interval = keyframe_interval
+        self.quality = quality
+        self._previous = None
+        self._last_keyframe = 0.0
+        self.keyframes = 0
+        self.deltas = 0
+        self.tiles_sent = 0
+
+    def encode(self, pixels: np.ndarray):
+        """Packet bytes for this frame, or None when nothing changed."""
+        previous, self._previous = self._previous, pixels
+        now = time.time()
+        if (previous is None or previous.shape != pixels.shape
+                or now - self._last_keyframe >= self.keyframe_interval):
+            return self._keyframe(pixels, now)
+
+        size = self.tile_size
+        height, width = pixels.shape[:2]
+        changed = self._changed_tiles(pixels, previous)
+        changed_count = int(changed.sum())
+        if changed_count == 0:
+            return None
+        if changed_count >= KEYFRAME_CHANGED_RATIO * changed.size:
+            return self._keyframe(pixels, now)
+
+        rects = []
+        for row, columns in enumerate(changed):
+            tiles = np.flatnonzero(columns)
+            if not len(tiles):
+                continue
+            # Split the changed tiles of this row into runs of adjacent columns
+            for run in np.split(tiles, np.flatnonzero(np.diff(tiles) > 1) + 1):
+                x, y = int(run[0]) * size, row * size
+                right = min(width, (int(run[-1]) + 1) * size)
+                bottom = min(height, y + size)
+                rects.append((x, y, pixels[y:bottom, x:right]))
+        self.deltas += 1
+        self.tiles_sent += changed_count
+        return self._packet(PACKET_DELTA, rects)
+
+    def _changed_tiles(self, pixels: np.ndarray, previous: np.ndarray) -> np.ndarray:
+        """Tile rows x tile columns, True where any byte differs."""
+        size = self.tile_size
+        height = pixels.shape[0]
+        changed = pixels.reshape(height, -1) != previous.reshape(height, -1)
+        full_rows, tail = divmod(height, size)
+        per_row = np.empty((full_rows + (1 if tail else 0), changed.shape[1]), dtype=bool)
+        per_row[:full_rows] = changed[:full_rows * size].reshape(full_rows, size, -1).any(axis=1)
+        if tail:
+            per_row[-1] = changed[full_rows * size:].any(axis=0)
+        # Each pixel is 3 bytes wide
+        return np.logical_or.reduceat(per_row, np.arange(0, changed.shape[1], size * 3), axis=1)
+
+    def full_frame(self, pixels: np.ndarray) -> bytes:
+        """A keyframe of this frame for clients joining or resyncing; later deltas follow on from it."""
+        self._previous = pixels
+        self.keyframes += 1
+        return self._packet(PACKET_KEYFRAME, [(0, 0, pixels)])
+
+    def _keyframe(self, pixels: np.ndarray, now: float) -> bytes:
+        self._last_keyframe = now
+        self.keyframes += 1
+        return self._packet(PACKET_KEYFRAME, [(0, 0, pixels)])
+
+    def _packet(self, kind: int, rects: list) -> bytes:
+        parts = [PACKET_HEADER.pack(kind, len(rects))]
+        for x, y, region in rects:
+            jpeg = pixels_to_jpeg(region, self.quality)
+            height, width = region.shape[:2]
+            parts.append(PACKET_RECT.pack(x, y, width, height, len(jpeg)))
+            parts.append(jpeg)
+        return b''.join(parts)
+
+
+# Frame transports: 'binary' sends tile delta packets ('frame_delta' event,
+# composited with createImageBitmap), 'base64' the original {'data': base64} 'frame' event.
+# 'state' clients get tile packets on menus but draw battles themselves from
+# 'battle_state' snapshots (see src/statesync.py)
+TRANSPORTS = ('binary', 'base64', 'state')
+PIXEL_TRANSPORTS = ('binary', 'base64')
+DEFAULT_TRANSPORT = 'binary'
+RATE_WINDOW = 2.0  # Seconds per bytes/sec measurement
+
+# Each client streams at one rung of this ladder: (JPEG quality, scale, frames/sec).
+# Clients on the same rung share every encode.
+QUALITY_LADDER = (
+    (70, 1.0, 30),
+    (60, 0.75, 20),
+    (50, 0.5, 12),
+    (40, 0.5, 6),
+)
+MAX_IN_FLIGHT = 2  # Unacknowledged frames before a client is skipped rather than queued up
+ACK_TIMEOUT = 5.0  # Seconds before an unacknowledged frame is written off
+ADAPT_INTERVAL = 2.0  # Seconds between rung changes for one client
+SLOW_ACK = 0.25  # Smoothed ack round trip (seconds) that moves a client down a rung
+FAST_ACK = 0.08  # ...and that moves it back up
+FRAME_SLACK = 0.005  # Seconds early a rung's frame may go, so 30 fps publishes are not skipped on jitter
+LAG_DISCONNECT = 20.0  # Seconds a client may go without acking a due frame before it is disconnected
+
+
+class ClientStream:
+    """Per-client transport, quality rung, frames in flight and bytes/sec sent.
+
+    Frames go out through the client's ClientSender in the server process,
+    which reports back any frame it drops. Clients acknowledge each frame
+    once it is drawn. A client with MAX_IN_FLIGHT frames unacknowledged is
+    skipped instead of queued, and resyncs with a keyframe; one that has not
+    acked for LAG_DISCONNECT seconds is lagging for good and gets
+    disconnected. Every ADAPT_INTERVAL
+    the client moves down a rung if it was skipped or its acks came back
+    slowly, and up a rung if they came back fast.
+    """
+
+    def __init__(self, sid: str, transport: str):
+        self.sid = sid
+        self.transport = transport
+        self.level = 0  # Index into QUALITY_LADDER
+        self.needs_keyframe = True  # Next pixel frame must be a full frame
+        self.on_snapshots = False  # Last frame was a battle_state snapshot (state transport)
+        self.frames_sent = 0
+        self.skipped = 0  # Frames skipped for backlog since the last rung check
+        self.skipped_total = 0
+        self.dropped = 0  # Queued frames replaced by a newer one before they went out
+        self.ack_seconds = None  # Smoothed round trip from send to ack
+        self.lagging_since = None  # First skip or expired frame since the last ack
+        self.closed = False
+        self.bytes_sent = 0
+        self.connected_at = time.time()
+        self._in_flight = []  # Send times of frames handed to the server and not yet acknowledged
+        self._lock = threading.Lock()  # Acks and drops arrive on the command thread
+        self._adapted_at = self.connected_at
+        self._window_start = self.connected_at
+        self._window_bytes = 0
+        self.bytes_per_sec = 0.0
+
+    def close(self):
+        self.closed = True
+
+    def ready(self, now: float) -> bool:
+        """Room for another frame; a frame that was never acknowledged counts as a skip."""
+        with self._lock:
+            live = [sent_at for sent_at in self._in_flight if now - sent_at < ACK_TIMEOUT]
+            if len(live) < len(self._in_flight):
+                self._skip(now)
+            self._in_flight = live
+            if len(live) >= MAX_IN_FLIGHT:
+                self._skip(now)
+                self.needs_keyframe = True
+                return False
+            return True
+
+    def _skip(self, now: float):
+        self.skipped += 1
+        self.skipped_total += 1
+        if self.lagging_since is None:
+            self.lagging_since = now
+
+    def lagging(self, now: float) -> float:
+        """Seconds since this client last kept up (0 while it is)."""
+        lagging_since = self.lagging_since
+        return now - lagging_since if lagging_since is not None else 0.0
+
+    def dispatched(self, size: int, sent_at: float):
+        """A frame went to the server process for this client (called on the encoder thread)."""
+        with self._lock:
+            self._in_flight.append(sent_at)
+        self.frames_sent += 1
+        self.count(size)
+
+    def frame_dropped(self, sent_at: float, resync: bool):
+        """The client's sender replaced the frame with a newer one before it went out."""
+        with self._lock:
+            if sent_at in self._in_flight:
+                self._in_flight.remove(sent_at)
+            self.dropped += 1
+            if self.lagging_since is None:
+                self.lagging_since = time.time()
+            if resync:
+                self.needs_keyframe = True  # The client missed the tiles that frame carried
+
+    def queue_depth(self) -> int:
+        """Frames queued in the server process or sent, and awaiting an ack."""
+        with self._lock:
+            return len(self._in_flight)
+
+    def acked(self, sent_at: float, *args):
+        round_trip = time.time() - sent_at
+        with self._lock:
+            self.lagging_since = None
+            if sent_at in self._in_flight:
+                self._in_flight.remove(sent_at)
+            if self.ack_seconds is None:
+                self.ack_seconds = round_trip
+            else:
+                self.ack_seconds += 0.2 * (round_trip - self.ack_seconds)
+
+    def adapt(self, now: float):
+        """Move down a rung after lag, or up one when acks are quick."""
+        if now - self._adapted_at < ADAPT_INTERVAL:
+            return
+        self._adapted_at = now
+        ack_seconds = self.ack_seconds
+        if self.skipped or (ack_seconds is not None and ack_seconds > SLOW_ACK):
+            level = min(self.level + 1, len(QUALITY_LADDER) - 1)
+        elif ack_seconds is not None and ack_seconds < FAST_ACK:
+            level = max(self.level - 1, 0)
+        else:
+            level = self.level
+        if level != self.level:
+            self.level = level
+            self.needs_keyframe = True  # A different rung has its own tile baseline
+        self.skipped = 0
+
+    def count(self, size: int):
+        self.bytes_sent += size
+        self._window_bytes += size
+        now = time.time()
+        if now - self._window_start >= RATE_WINDOW:
+            self.bytes_per_sec = self._window_bytes / (now - self._window_start)
+            self._window_start = now
+            self._window_bytes = 0
+
+    def describe(self) -> str:
+        quality, scale, fps = QUALITY_LADDER[self.level]
+        ack = f"{1000 * self.ack_seconds:.0f} ms" if self.ack_seconds is not None else "-"
+        return (f"{self.sid[:6]} {self.transport} q{quality} x{scale} {fps}fps ack {ack} "
+                f"{self.bytes_per_sec / 1024:.0f} KB/s queue {self.queue_depth()} dropped {self.dropped}")
+
+    def stats(self, now: float) -> dict:
+        quality, scale, fps = QUALITY_LADDER[self.level]
+        return {
+            'transport': self.transport,
+            'quality': quality,
+            'scale': scale,
+            'fps': fps,
+            'queue_depth': self.queue_depth(),
+            'frames_sent': self.frames_sent,
+            'dropped': self.dropped,
+            'skipped': self.skipped_total,
+            'ack_ms': round(1000 * self.ack_seconds, 1) if self.ack_seconds is not None else None,
+            'lagging_s': round(self.lagging(now), 1),
+            'kb_per_sec': round(self.bytes_per_sec / 1024, 1),
+            'connected_s': round(now - self.connected_at, 1),
+        }
+
+
+class StreamRung:
+    """Encoder state for one QUALITY_LADDER rung, shared by every client on it."""
+
+    def __init__(self, quality: int, scale: float, fps: int):
+        self.quality = quality
+        self.scale = scale
+        self.fps = fps
+        self.tiles = TileDeltaEncoder(quality=quality)
+        self.jpeg_source = None  # Pixels of the last whole JPEG sent to base64 clients
+        self.last_frame = 0.0
+
+    def due(self, now: float) -> bool:
+        return now - self.last_frame >= 1.0 / self.fps - FRAME_SLACK
+
+
+clients = {}  # Socket.IO sid -> ClientStream
+clients_lock = threading.Lock()
+
+
+class FrameEncoder:
+    """JPEG-encodes and emits frames on its own thread, newest frame wins.
+
+    The game thread only copies the screen into a single slot. The worker
+    encodes whatever is in the slot when it gets there; frames replaced
+    before it could pick them up are counted as dropped, so slow encodes or
+    sends cost stream frame rate rather than simulation frame time.
+    """
+
+    def __init__(self, encode, send):
+        self._encode = encode  # (surface, battle state) snapshot -> encoded frame, or None to skip it
+        self._send = send  # Called with each encoded frame
+        self._slot = None
+        self._ready = threading.Condition()
+        self.published = 0
+        self.encoded = 0
+        self.dropped = 0
+        self.encode_seconds = 0.0
+        self.emit_seconds = 0.0
+        self._thread = threading.Thread(target=self._run, name='frame-encoder', daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def publish(self, surface, battle_state: bytes = None):
+        """Hand over a snapshot of the screen and/or a packed battle state (called on the game thread)."""
+        snapshot = (surface.copy() if surface is not None else None, battle_state)
+        with self._ready:
+            if self._slot is not None:
+                self.dropped += 1
+            self._slot = snapshot
+            self.published += 1
+            self._ready.notify()
+
+    def _run(self):
+        while True:
+            with self._ready:
+                while self._slot is None:
+                    self._ready.wait()
+                snapshot, self._slot = self._slot, None
+
+            start = time.perf_counter()
+            try:
+                frame_data = self._encode(snapshot)
+            except Exception as e:
+                print(f"[ERROR] Frame encoding failed: {e}")
+                frame_data = None
+            encoded = time.perf_counter()
+            if frame_data:
+                self._send(frame_data)
+            self.encode_seconds += encoded - start
+            self.emit_seconds += time.perf_counter() - encoded
+            self.encoded += 1
+
+    def stats(self) -> dict:
+        encoded = max(1, self.encoded)
+        return {
+            'published': self.published,
+            'encoded': self.encoded,
+            'dropped': self.dropped,
+            'encode_ms': round(1000 * self.encode_seconds / encoded, 2),
+            'emit_ms': round(1000 * self.emit_seconds / encoded, 2),
+        }
+
+
+rungs = [StreamRung(*settings) for settings in QUALITY_LADDER]
+state_encoder = BattleStateEncoder()
+
+
+def client_streams() -> list:
+    with clients_lock:
+        return list(clients.values())
+
+
+def client_transports() -> set:
+    return {stream.transport for stream in client_streams()}
+
+
+def encode_frame(snapshot):
+    """Encode a snapshot for every client due a frame: [(stream, event, payload)].
+
+    Each rung encodes at most once per frame, at its own frame rate, and
+    every client on it shares the result. Clients that were skipped, changed
+    rung, or come back to pixels from battle snapshots get a keyframe of the
+    rung's frame instead of its delta.
+    """
+    surface, battle_state = snapshot
+    now = time.time()
+    streams = client_streams()
+    for stream in streams:
+        if stream.lagging(now) > LAG_DISCONNECT:
+            print(f"[WEB] Disconnecting {stream.sid[:6]}: no ack for {stream.lagging(now):.0f}s")
+            drop_client(stream.sid)
+            outbox.put(('disconnect', stream.sid))
+            continue
+        stream.adapt(now)
+    streams = [stream for stream in streams if not stream.closed]
+    due_levels = {stream.level for stream in streams if rungs[stream.level].due(now)}
+    for level in due_levels:
+        rungs[level].last_frame = now
+
+    sends = []
+    pixels_by_scale = {}
+    for level in sorted(due_levels):
+        rung = rungs[level]
+        group = [stream for stream in streams if stream.level == level and stream.ready(now)]
+        pixel_streams = []
+        for stream in group:
+            if stream.transport == 'state' and battle_state is not None:
+                stream.on_snapshots = True
+                sends.append((stream, 'battle_state', battle_state))
+            else:
+                if stream.on_snapshots:
+                    stream.on_snapshots = False
+                    stream.needs_keyframe = True  # Missed every delta during the battle
+                pixel_streams.append(stream)
+        if surface is None or not pixel_streams:
+            continue
+
+        if rung.scale not in pixels_by_scale:
+            pixels_by_scale[rung.scale] = scaled_pixels(surface, rung.scale)
+        pixels = pixels_by_scale[rung.scale]
+
+        tile_streams = [stream for stream in pixel_streams if stream.transport != 'base64']
+        in_sync = [stream for stream in tile_streams if not stream.needs_keyframe]
+        resyncing = [stream for stream in tile_streams if stream.needs_keyframe]
+        packet = rung.tiles.encode(pixels) if in_sync else None
+        if packet:
+            sends.extend((stream, 'frame_delta', packet) for stream in in_sync)
+        if resyncing:
+            keyframe = packet if packet and packet[0] == PACKET_KEYFRAME else rung.tiles.full_frame(pixels)
+            for stream in resyncing:
+                stream.needs_keyframe = False
+                sends.append((stream, 'frame_delta', keyframe))
+
+        # Whole JPEGs: re-offered frames (see on_frame) only go to clients that lack them
+        changed = rung.jpeg_source is None or not np.array_equal(rung.jpeg_source, pixels)
+        jpeg_streams = [stream for stream in pixel_streams
+                        if stream.transport == 'base64' and (changed or stream.needs_keyframe)]
+        if jpeg_streams:
+            rung.jpeg_source = pixels
+            data = base64.b64encode(pixels_to_jpeg(pixels, rung.quality)).decode('utf-8')
+            for stream in jpeg_streams:
+                stream.needs_keyframe = False
+                sends.append((stream, 'frame', data))
+    return sends or None
+
+
+def emit_frame(sends):
+    """Pass each distinct encode to the server process once, with the clients it goes to.
+
+    Clients on the same rung share one payload, so it crosses the process
+    boundary once; the server fans it out to each client's ClientSender.
+    """
+    sent_at = time.time()
+    frames = {}  # id(payload) -> (event, payload, [(sid, sent_at)])
+    for stream, event, payload in sends:
+        if stream.closed:
+            continue
+        stream.dispatched(len(payload), sent_at)
+        frames.setdefault(id(payload), (event, payload, []))[2].append((stream.sid, sent_at))
+    for event, payload, targets in frames.values():
+        data = {'data': payload} if event == 'frame' else payload
+        outbox.put(('frame', event, data, targets))
+
+
+def drop_client(sid: str):
+    global idle_since
+    with clients_lock:
+        stream = clients.pop(sid, None)
+        if not clients:
+            idle_since = time.time()
+    if stream:
+        stream.close()
+
+
+def rungs_behind(now: float) -> bool:
+    """Some client's rung is not due, so the current frame will not reach it."""
+    return any(not rungs[stream.level].due(now) for stream in client_streams())
+
+
+def update_battle_rendering():
+    """Skip drawing battles on the server while every viewer draws them from state."""
+    if game:
+        transports = client_transports()
+        game.render_battles = not transports or bool(transports & set(PIXEL_TRANSPORTS))
+
+
+encoder = FrameEncoder(encode_frame, emit_frame)
+
+# Frame rate limiting (the top rung's rate; slower rungs skip frames in encode_frame)
 last_frame_time = 0
-STREAM_FPS = 30
+STREAM_FPS = QUALITY_LADDER[0][2]
 
 def on_frame(surface):
-    """Callback called after each frame is drawn."""
+    """Callback called after each changed frame is drawn.
+
+    Returns False when the frame is skipped for rate limiting, or when a
+    slower rung will skip it, so the game offers the screen again next frame
+    instead of leaving those clients on a stale image.
+    """
     global last_frame_time
 
     current_time = time.time()
     if current_time - last_frame_time < 1.0 / STREAM_FPS:
-        return
+        return False
     last_frame_time = current_time
 
-    frame_data = frame_to_base64(surface)
-    if frame_data:
-        socketio.emit('frame', {'data': frame_data})
+    if game.state != STATE_BATTLE or 'state' not in client_transports():
+        encoder.publish(surface)
+    elif game.render_battles:
+        encoder.publish(surface, state_encoder.encode(game))
+    else:
+        encoder.publish(None, state_encoder.encode(game))
+    return not rungs_behind(current_time)
+
+
+# Sessions: name -> ModeConfig mode. Each runs its own Game in its own worker
+# process, served at /s/<name> (the first one also at /).
+SESSIONS = {
+    'default': 'default',
+    'girlfriend': 'girlfriend',
+}
+DEFAULT_SESSION = 'default'
+STORAGE_BACKEND = os.environ.get('BEYBLADE_STORAGE', 'text')  # 'sqlite': each mode's lists in its database_file
+SUSPEND_AFTER = 10.0  # Seconds without clients before a session's game loop is parked
+STATS_TIMEOUT = 2.0  # Seconds to wait for a worker's stats
+WORKER_CHECK_INTERVAL = 1.0  # Seconds the relay waits for a message before checking its worker is alive
+
+idle_since = time.time()  # When the last client left (worker side)
+suspended = False
+session_wake = threading.Condition(clients_lock)  # Notified when a client connects
+
+
+def wait_while_idle():
+    """Game.suspend_check: park the game loop while nobody has been connected for SUSPEND_AFTER.
+
+    The worker's command thread keeps serving acks, stats and connects;
+    the first connect wakes the loop up again.
+    """
+    global suspended
+    with session_wake:
+        if clients or time.time() - idle_since < SUSPEND_AFTER:
+            return
+        print(f"[SESSION] Suspended (no clients for {SUSPEND_AFTER:.0f}s)")
+        suspended = True
+        while not clients:
+            session_wake.wait()
+        suspended = False
+    print("[SESSION] Resumed")
+    game.request_redraw()
+
 
+def session_stats() -> dict:
+    now = time.time()
+    fonts = font_registry_stats()
+    with clients_lock:
+        streams = {sid: stream.stats(now) for sid, stream in clients.items()}
+        described = [stream.describe() for stream in clients.values()]
+    return {
+        'mode': game.config.mode if game else None,
+        'state': game.state if game else None,
+        'suspended': suspended,
+        'fonts': fonts['fonts'],
+        'rss_kb': fonts['rss_kb'],
+        'encoder': encoder.stats(),
+        'keyframes': sum(rung.tiles.keyframes for rung in rungs),
+        'deltas': sum(rung.tiles.deltas for rung in rungs),
+        'tiles': sum(rung.tiles.tiles_sent for rung in rungs),
+        'state_snapshots': state_encoder.snapshots,
+        'state_bytes_avg': state_encoder.bytes_packed // max(1, state_encoder.snapshots),
+        'render_battles': game.render_battles if game else None,
+        'input': game.input_stats() if game else None,
+        'clients': streams,
+        'streams': described,
+    }
+
+
+def handle_input(event: dict):
+    """Hand a browser input event to this session's game; mouse events also move its pointer."""
+    if 'x' in event and event['type'] != 'mousewheel':
+        web_mouse_pos[0] = event['x']
+        web_mouse_pos[1] = event['y']
+    game.inject_event(event)
+
+
+def handle_command(command: tuple):
+    """Apply one message from the server process (on the worker's command thread)."""
+    kind = command[0]
+    if kind == 'ack':
+        _, sid, sent_at = command
+        with clients_lock:
+            stream = clients.get(sid)
+        if stream:
+            stream.acked(sent_at)
+    elif kind == 'input':
+        if game:
+            handle_input(command[1])
+    elif kind == 'dropped':
+        _, sid, sent_at, resync = command
+        with clients_lock:
+            stream = clients.get(sid)
+        if stream:
+            stream.frame_dropped(sent_at, resync)
+    elif kind == 'connect':
+        _, sid, transport = command
+        stream = ClientStream(sid, transport)  # Starts on a keyframe
+        with session_wake:
+            clients[sid] = stream
+            session_wake.notify_all()
+        update_battle_rendering()
+        if game:
+            # Static menus only stream when something changes - send the newcomer a frame now
+            game.request_redraw()
+    elif kind == 'disconnect':
+        drop_client(command[1])
+        update_battle_rendering()
+    elif kind == 'roster':
+        outbox.put(('emit', command[1], 'battle_roster', state_encoder.roster()))
+    elif kind == 'stats':
+        outbox.put(('stats', command[1], session_stats()))
 
-def run_game():
-    """Run the game loop."""
-    global game
 
-    # Patch mouse.get_pos for web mode
+def run_commands(commands):
+    while True:
+        command = commands.get()
+        try:
+            handle_command(command)
+        except Exception as e:
+            print(f"[ERROR] Session command {command[0]} failed: {e}")
+
+
+def run_session(name: str, mode: str, commands, messages):
+    """Worker process entry point: run one session's Game and frame stream."""
+    global game, outbox
+    outbox = messages
+    # Let the server stop this process: SDL would otherwise turn SIGTERM into a QUIT event
+    os.environ.setdefault('SDL_NO_SIGNAL_HANDLERS', '1')
+
+    # Patch mouse.get_pos for web mode (this process's game only)
     pygame.mouse.get_pos = _patched_get_pos
 
-    game = Game(web_mode=True)
+    config = set_mode(mode, STORAGE_BACKEND)
+    print(f"[SESSION] {name} starting ({mode} mode, pid {os.getpid()})")
+    encoder.start()
+    threading.Thread(target=run_commands, args=(commands,), name='session-commands', daemon=True).start()
+
+    game = Game(config, web_mode=True)
     game.frame_callback = on_frame
+    game.suspend_check = wait_while_idle
+    update_battle_rendering()
     game.run()
 
 
+class ClientSender:
+    """Server-side outbound queue for one client: a one-frame slot and its own emit thread.
+
+    A stalled connection only ever holds the newest frame and never delays
+    the session's other clients. A frame replaced before it goes out is
+    reported to the worker; if it was a tile packet, later deltas are dropped
+    too until the worker's keyframe arrives.
+    """
+
+    def __init__(self, session, sid: str, transport: str):
+        self.session = session
+        self.sid = sid
+        self.transport = transport  # Sent again to a restarted worker
+        self.closed = False
+        self._queued = None  # (event, data, sent_at) waiting for the emit thread
+        self._messages = []  # (event, data) that must not be dropped, sent ahead of frames
+        self._needs_keyframe = False
+        self._wake = threading.Condition()
+        threading.Thread(target=self._send_loop, name=f'client-{sid[:6]}', daemon=True).start()
+
+    def offer(self, event: str, data, sent_at: float):
+        """Queue a frame, replacing any frame still waiting (called on the relay thread)."""
+        with self._wake:
+            if self.closed:
+                return
+            if self._queued is not None:
+                queued_event, _, queued_at = self._queued
+                self._queued = None
+                self._drop(queued_event, queued_at)
+            if event == 'frame_delta':
+                if data[0] == PACKET_DELTA and self._needs_keyframe:
+                    self._drop(event, sent_at)  # Its tiles build on the packet the client missed
+                    return
+                self._needs_keyframe = False
+            self._queued = (event, data, sent_at)
+            self._wake.notify()
+
+    def _drop(self, event: str, sent_at: float):
+        resync = event == 'frame_delta'
+        self._needs_keyframe |= resync
+        self.session.send('dropped', self.sid, sent_at, resync)
+
+    def send(self, event: str, data):
+        """Queue a message that is never replaced, such as the battle roster."""
+        with self._wake:
+            self._messages.append((event, data))
+            self._wake.notify()
+
+    def close(self):
+        with self._wake:
+            self.closed = True
+            self._queued = None
+            self._wake.notify()
+
+    def _send_loop(self):
+        while True:
+            with self._wake:
+                while self._queued is None and not self._messages and not self.closed:
+                    self._wake.wait()
+                if self.closed:
+                    return
+                if self._messages:
+                    event, data = self._messages.pop(0)
+                    sent_at = None
+                else:
+                    (event, data, sent_at), self._queued = self._queued, None
+            callback = partial(self.session._acked, self.sid, sent_at) if sent_at is not None else None
+            socketio.emit(event, data, to=self.sid, callback=callback)
+
+
+class Session:
+    """Server-side handle on one session's worker process.
+
+    Commands (client connects, input, acks, dropped frames) go to the worker
+    on one queue; frames, disconnects and stats come back on another, drained
+    by a relay thread. Each frame arrives once with the clients it goes to,
+    and the relay hands it to their ClientSenders without waiting on any emit.
+    The relay also notices the worker exiting and restarts it with the
+    session's connected clients.
+    """
+
+    def __init__(self, name: str, mode: str):
+        self.name = name
+        self.mode = mode
+        self.process = None
+        self.commands = None
+        self.messages = None
+        self.senders = {}  # sid -> ClientSender
+        self._start_lock = threading.Lock()  # Clients connecting at once must not start two workers
+        self._stats_lock = threading.Lock()
+        self._stats_waiting = {}  # token -> [Event, stats]
+        self._next_token = 0
+
+    def start(self):
+        context = multiprocessing.get_context('spawn')
+        self.commands = context.Queue()
+        self.messages = context.Queue()
+        self.process = context.Process(target=run_session, args=(self.name, self.mode, self.commands, self.messages),
+                                       name=f'session-{self.name}', daemon=True)
+        self.process.start()
+        threading.Thread(target=self._relay, args=(self.process, self.messages), name=f'relay-{self.name}',
+                         daemon=True).start()
+
+    def ensure_running(self):
+        with self._start_lock:
+            if self.process is not None and self.process.is_alive():
+                return
+            if self.process is not None:
+                print(f"[SERVER] Session {self.name} worker exited, restarting")
+            with client_sessions_lock:
+                self.start()
+                # Clients still connected get a fresh queue, and the new game learns about them
+                for sid, sender in list(self.senders.items()):
+                    sender.close()
+                    self.senders[sid] = ClientSender(self, sid, sender.transport)
+                    self.send('connect', sid, sender.transport)
+
+    def send(self, *command):
+        self.commands.put(command)
+
+    def _acked(self, sid: str, sent_at: float, *args):
+        self.send('ack', sid, sent_at)
+
+    def _relay(self, process, messages):
+        while True:
+            try:
+                message = messages.get(timeout=WORKER_CHECK_INTERVAL)
+            except queue.Empty:
+                if process.is_alive():
+                    continue
+                self.ensure_running()  # Unless a connecting client already restarted it
+                return
+            kind = message[0]
+            if kind == 'frame':
+                _, event, data, targets = message
+                for sid, sent_at in targets:
+                    sender = self.senders.get(sid)
+                    if sender:
+                        sender.offer(event, data, sent_at)
+            elif kind == 'emit':
+                _, sid, event, data = message
+                sender = self.senders.get(sid)
+                if sender:
+                    sender.send(event, data)
+            elif kind == 'disconnect':
+                socketio.server.disconnect(message[1], namespace='/')
+            elif kind == 'stats':
+                _, token, stats = message
+                with self._stats_lock:
+                    waiting = self._stats_waiting.get(token)
+                if waiting:
+                    waiting[1] = stats
+                    waiting[0].set()
+
+    def stats(self) -> dict:
+        """The worker's session_stats(), or None if it does not answer in time."""
+        if self.process is None or not self.process.is_alive():
+            return None
+        with self._stats_lock:
+            token = self._next_token
+            self._next_token += 1
+            waiting = self._stats_waiting[token] = [threading.Event(), None]
+        self.send('stats', token)
+        waiting[0].wait(STATS_TIMEOUT)
+        with self._stats_lock:
+            self._stats_waiting.pop(token, None)
+        return waiting[1]
+
+
+sessions = {name: Session(name, mode) for name, mode in SESSIONS.items()}
+client_sessions = {}  # Socket.IO sid -> Session
+client_sessions_lock = threading.Lock()
+
+
+def session_for(sid: str):
+    with client_sessions_lock:
+        return client_sessions.get(sid)
+
+
+def forward_input(event: dict):
+    """Send an input event from the requesting client to its session's game."""
+    session = session_for(request.sid)
+    if session:
+        session.send('input', event)
+
+
 # Flask routes
 @app.route('/')
 def index():
     print("[WEB] Serving index page")
-    return render_template('index.html', width=WINDOW_WIDTH, height=WINDOW_HEIGHT)
+    return render_template('index.html', width=WINDOW_WIDTH, height=WINDOW_HEIGHT, session=DEFAULT_SESSION)
+
+
+@app.route('/s/<name>')
+def session_page(name):
+    if name not in sessions:
+        return f"No session named {name!r}", 404
+    print(f"[WEB] Serving index page for session {name}")
+    return render_template('index.html', width=WINDOW_WIDTH, height=WINDOW_HEIGHT, session=name)
 
 
 @app.route('/test')
 def test():
-    return f"Server OK. Game ready: {game is not None}"
+    lines = ["Server OK."]
+    for name, session in sessions.items():
+        stats = session.stats()
+        if stats is None:
+            lines.append(f"Session {name}: not running.")
+            continue
+        frames = stats['encoder']
+        web_input = stats['input']
+        input_summary = (f"{web_input['events']} events ({web_input['moves_coalesced']} moves coalesced), "
+                         f"{web_input['latency_avg_ms']} ms avg, {web_input['latency_max_ms']} ms max"
+                         if web_input else "-")
+        lines.append(
+            f"Session {name} ({stats['mode']} mode, {stats['state']}"
+            f"{', suspended' if stats['suspended'] else ''}): "
+            f"Fonts loaded: {stats['fonts']}, RSS: {stats['rss_kb']} KB. "
+            f"Frames published: {frames['published']}, encoded: {frames['encoded']}, dropped: {frames['dropped']}, "
+            f"encode: {frames['encode_ms']} ms, emit: {frames['emit_ms']} ms, "
+            f"keyframes: {stats['keyframes']}, deltas: {stats['deltas']}, tiles: {stats['tiles']}, "
+            f"state snapshots: {stats['state_snapshots']} ({stats['state_bytes_avg']} B avg), "
+            f"server renders battles: {stats['render_battles']}, "
+            f"input: {input_summary}. "
+            f"Clients: {', '.join(stats['streams']) or 'none'}")
+    return ' '.join(lines)
+
+
+@app.route('/stats')
+def stats():
+    """Per-session encoder totals and per-client queue depth, drops and stream settings, as JSON."""
+    return jsonify({name: session.stats() for name, session in sessions.items()})
 
 
 # Socket.IO events
 @socketio.on('connect')
 def handle_connect():
-    print(f"[WEB] Client connected")
-    emit('status', {'msg': 'connected'})
+    transport = request.args.get('transport', DEFAULT_TRANSPORT)
+    if transport not in TRANSPORTS:
+        transport = DEFAULT_TRANSPORT
+    name = request.args.get('session', DEFAULT_SESSION)
+    session = sessions.get(name)
+    if session is None:
+        return False  # Reject: unknown session
+    print(f"[WEB] Client connected to {name} ({transport})")
+    session.ensure_running()
+    with client_sessions_lock:
+        client_sessions[request.sid] = session
+        session.senders[request.sid] = ClientSender(session, request.sid, transport)
+        session.send('connect', request.sid, transport)  # Under the lock, so a worker restart re-sends it or comes after
+    emit('status', {'msg': 'connected', 'transport': transport, 'session': name})
 
 
 @socketio.on('disconnect')
 def handle_disconnect():
     print(f"[WEB] Client disconnected")
+    with client_sessions_lock:
+        session = client_sessions.pop(request.sid, None)
+        sender = session.senders.pop(request.sid, None) if session else None
+    if sender:
+        sender.close()
+    if session:
+        session.send('disconnect', request.sid)
 
 
-@socketio.on('mouse')
-def handle_mouse(data):
-    global web_mouse_pos
+@socketio.on('battle_roster')
+def handle_battle_roster():
+    """Names and tables for state snapshots (asked for when a snapshot's roster version is new)."""
+    session = session_for(request.sid)
+    if session:
+        session.send('roster', request.sid)
 
-    if not game:
-        return
 
+@socketio.on('mouse')
+def handle_mouse(data):
     x = data.get('x', 0)
     y = data.get('y', 0)
-    web_mouse_pos[0] = x
-    web_mouse_pos[1] = y
-    game._web_mouse_pos = (x, y)
 
     event_type = data.get('type')
-    if event_type == 'mousedown':
+    if event_type == 'mousemove':
+        # Counts as interaction, so an idle game loop returns to full frame rate
+        forward_input({'type': 'mousemove', 'x': x, 'y': y})
+    elif event_type == 'mousedown':
         print(f"[WEB] Click at ({x}, {y})")
-        game.inject_event({
+        forward_input({
             'type': 'mousedown',
             'button': data.get('button', 1),
             'x': x,
             'y': y
         })
     elif event_type == 'mouseup':
-        game.inject_event({
+        forward_input({
             'type': 'mouseup',
             'button': data.get('button', 1),
             'x': x,
@@ -142,9 +1014,6 @@ def handle_mouse(data):
 
 @socketio.on('key')
 def handle_key(data):
-    if not game:
-        return
-
     js_key = data.get('jsKey', '')
 
     # Skip Ctrl+V
@@ -179,7 +1048,7 @@ def handle_key(data):
     if data.get('shift'): mod |= pygame.KMOD_SHIFT
     if data.get('alt'): mod |= pygame.KMOD_ALT
 
-    game.inject_event({
+    forward_input({
         'type': data.get('type', 'keydown'),
         'key': pygame_key,
         'mod': mod,
@@ -189,13 +1058,10 @@ def handle_key(data):
 
 @socketio.on('wheel')
 def handle_wheel(data):
-    if not game:
-        return
-
     delta_y = data.get('deltaY', 0)
     scroll_y = -1 if delta_y > 0 else (1 if delta_y < 0 else 0)
 
-    game.inject_event({
+    forward_input({
         'type': 'mousewheel',
         'x': 0,
         'y': scroll_y
@@ -204,47 +1070,29 @@ def handle_wheel(data):
 
 @socketio.on('paste')
 def handle_paste(data):
-    if not game:
-        return
-
+    # One event for the whole paste - the focused text box inserts it in a single edit
     text = data.get('text', '')
-    for char in text:
-        if char == '\n':
-            game.inject_event({
-                'type': 'keydown',
-                'key': pygame.K_RETURN,
-                'mod': 0,
-                'unicode': '\n'
-            })
-        elif char.isprintable():
-            game.inject_event({
-                'type': 'keydown',
-                'key': ord(char.lower()) if char.isalpha() else ord(char),
-                'mod': pygame.KMOD_SHIFT if char.isupper() else 0,
-                'unicode': char
-            })
+    if text:
+        forward_input({'type': 'text', 'text': text})
 
 
 def main():
-    global game
-
     PORT = 8080
 
     print("\n" + "=" * 50)
     print("  Movie Beyblade Battle - Web Server")
     print("=" * 50)
     print(f"\n  Open in browser: http://localhost:{PORT}")
+    for name in sessions:
+        if name != DEFAULT_SESSION:
+            print(f"  Session {name}: http://localhost:{PORT}/s/{name}")
     print("\n  Press Ctrl+C to stop")
     print("=" * 50 + "\n")
 
-    # Start game thread
-    print("[SERVER] Starting game thread...")
-    game_thread = threading.Thread(target=run_game, daemon=True)
-    game_thread.start()
-
-    # Wait for game to initialize
-    time.sleep(1)
-    print(f"[SERVER] Game initialized: {game is not None}")
+    # One worker process per session, each with its own game and frame stream
+    print(f"[SERVER] Starting {len(sessions)} session workers...")
+    for session in sessions.values():
+        session.ensure_running()
 
     # Start Flask server
     print(f"[SERVER] Starting web server on port {PORT}...")